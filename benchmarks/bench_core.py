@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Per-row cost of applying compiled slice plans to wide rows
+"""
+from common import best_of, report
+
+from sliced import compile_plan, slices
+from sliced.plan import chained
+
+ROWS = [['r{}c{}'.format(i, j) for j in range(200)] for i in range(2000)]
+
+
+def generic(plan, rows):
+    "the per-slice path every plan used before specialization"
+    slices = plan.slices
+    return list(map(list, (chained(i[j] for j in slices) for i in rows)))
+
+
+def bench_indices():
+    plan = compile_plan(', '.join(str(i) for i in range(1, 200, 3)))
+    baseline = best_of(lambda: generic(plan, ROWS))
+    report('index list, generic slices', baseline)
+    report('index list, itemgetter', best_of(lambda: list(plan.apply(ROWS))),
+           baseline)
+
+
+def bench_coalesce():
+    spec = ', '.join('{}:{}'.format(i, i + 4) for i in range(1, 196, 5))
+    plan = compile_plan(spec)
+    baseline = best_of(lambda: generic(plan, ROWS))
+    report('{} contiguous ranges, generic slices'.format(len(plan.slices)),
+           baseline)
+    report('{} contiguous ranges, coalesced'.format(len(plan.slices)),
+           best_of(lambda: list(plan.apply(ROWS))), baseline)
+
+
+def bench_specialized():
+    plan = compile_plan('-3, 1, 5:8, -1, 10:20:2, 30:33')
+    baseline = best_of(lambda: list(plan.apply(ROWS)))
+    report('mixed slice list, generic slices', baseline)
+    fixed = plan.specialize(200)
+    report('mixed slice list, specialized to width',
+           best_of(lambda: list(fixed.apply(ROWS))), baseline)
+
+
+def bench_array():
+    try:
+        import numpy
+    except ImportError:
+        return
+    array = numpy.arange(2000 * 200).reshape(2000, 200)
+    rows = array.tolist()
+    spec = '1, 3, 7, 20:40, -1'
+    baseline = best_of(lambda: list(slices(rows, spec)))
+    report('2-d array, row by row', baseline)
+    report('2-d array, fancy index', best_of(lambda: slices(array, spec)),
+           baseline)
+
+
+if __name__ == '__main__':
+    bench_indices()
+    bench_coalesce()
+    bench_specialized()
+    bench_array()
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Cold-start cost: time to import sliced & slice a few rows in a new process
+
+Import times come from `python -X importtime`, so they exclude interpreter
+start-up; the best of several runs is reported.
+"""
+import os
+import subprocess
+import sys
+
+from common import report
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 10
+
+STATEMENTS = [
+    ('import sliced', 'import sliced'),
+    ('import sliced; slices', "import sliced; list(sliced.slices("
+                              "[[1, 2, 3]], '1, 3'))"),
+    ('import sliced; headers', "import sliced; list(sliced.slices("
+                               "[[1, 2, 3]], 'a', headers=['a', 'b', 'c']))"),
+]
+
+
+def _top_level_imports(statement):
+    ":returns: {module: cumulative import time in us}, & statement's output"
+    output = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement], cwd=ROOT,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True)
+    times = {}
+    for line in output.stderr.splitlines():
+        _, cumulative, name = line.split('|')
+        # nested imports are indented further
+        if cumulative.strip().isdigit() and name[1] != ' ':
+            times[name.strip()] = int(cumulative)
+    return times, output.stdout.strip()
+
+
+def import_time(statement, startup):
+    """
+    :returns: import time in seconds of the modules imported by statement,
+              & the names of the slow third party modules it imported
+    """
+    check = '; import sys; print([i for i in ("pyparsing", "asyncio") ' \
+            'if i in sys.modules])'
+    times, modules = _top_level_imports(statement + check)
+    total = sum(j for i, j in times.items() if i not in startup)
+    return total / 1e6, modules
+
+
+def bench_import():
+    startup = _top_level_imports('pass')[0]
+    for name, statement in STATEMENTS:
+        times, modules = zip(*(import_time(statement, startup)
+                               for _ in range(RUNS)))
+        report('{} {}'.format(name, modules[0]), min(times))
+
+
+if __name__ == '__main__':
+    bench_import()
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+Cost of building Interval objects, as when compiling bulk slice strings
+"""
+import tracemalloc
+
+from common import best_of, report
+
+from sliced import Lineage, compile_plan
+from sliced.intervals import Interval, IntervalSet
+
+ARGS = [dict(start=i, stop=i + 5, step=2, type_='right-open')
+        for i in range(1, 10001)]
+
+
+def build():
+    return [Interval(**i) for i in ARGS]
+
+
+def bench_construct():
+    report('{} intervals, construct'.format(len(ARGS)), best_of(build))
+    tracemalloc.start()
+    intervals = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print('{:<44} {:>10.1f} bytes'.format('memory per interval',
+                                          size / len(intervals)))
+
+
+def reference(interval):
+    "to_slice as it was before the direct arithmetic"
+    step = interval.stride
+    start, stop = interval.to_right_open(step=step, to_origin=0)
+    return slice(start.value, stop.value, step)
+
+
+def uncached(intervals):
+    for interval in intervals:
+        interval._slice = None
+    return [i.to_slice() for i in intervals]
+
+
+def bench_to_slice():
+    intervals = build()
+    baseline = best_of(lambda: [reference(i) for i in intervals])
+    report('{} intervals, to_slice reference'.format(len(intervals)),
+           baseline)
+    report('{} intervals, to_slice'.format(len(intervals)),
+           best_of(lambda: uncached(intervals)), baseline)
+    report('{} intervals, memoized to_slice'.format(len(intervals)),
+           best_of(lambda: [i.to_slice() for i in intervals]), baseline)
+
+
+def index_sets(width, *specs):
+    "combine specs by listing their column indices"
+    first, second = [{j for i in compile_plan(spec).slices
+                      for j in range(*i.indices(width))} for spec in specs]
+    return sorted(first - second)
+
+
+def interval_sets(width, *specs):
+    first, second = [IntervalSet.from_spec(i, width=width) for i in specs]
+    return (first - second).to_slices()
+
+
+def bench_combine():
+    specs = ('1:100000', ', '.join(str(i) for i in range(50, 100000, 997)))
+    baseline = best_of(lambda: index_sets(100000, *specs), 10)
+    report('100000 columns except 100, index sets', baseline)
+    report('100000 columns except 100, IntervalSet',
+           best_of(lambda: interval_sets(100000, *specs), 10), baseline)
+
+
+def scan_outputs(plan, width, column):
+    "output positions of a column, found by checking every slice"
+    result, offset = [], 0
+    for slice_ in plan.slices:
+        indices = range(*slice_.indices(width))
+        if column in indices:
+            result.append(offset + indices.index(column))
+        offset += len(indices)
+    return result
+
+
+def bench_lineage():
+    width = 50000
+    plan = compile_plan(', '.join('{}:{}'.format(i, i + 20)
+                                  for i in range(1, width, 10)))
+    columns = range(0, width, 97)
+    baseline = best_of(lambda: [scan_outputs(plan, width, i)
+                                for i in columns])
+    report('{} slices, {} lineage queries, scan'.format(
+           len(plan.slices), len(columns)), baseline)
+    lineage = Lineage(plan, width)
+    report('{} slices, {} lineage queries, tree'.format(
+           len(plan.slices), len(columns)),
+           best_of(lambda: [lineage.outputs(i) for i in columns]), baseline)
+    report('{} slices, build lineage index'.format(len(plan.slices)),
+           best_of(lambda: Lineage(plan, width)))
+
+
+def bench_convert_many():
+    starts = [i % 500 + 1 for i in range(50000)]
+    stops = [None if i % 7 == 0 else i % 500 + 20 for i in range(50000)]
+    types = ['closed', 'left-open', 'right-open', 'open'] * 12500
+
+    def one_at_a_time():
+        return [Interval(*i, origin=1).to_right_open(to_origin=0)
+                for i in zip(starts, stops, [None] * 50000, types)]
+
+    baseline = best_of(one_at_a_time)
+    report('50000 conversions, one Interval at a time', baseline)
+    report('50000 conversions, convert_many (lists)',
+           best_of(lambda: Interval.convert_many(starts, stops, types=types)),
+           baseline)
+    try:
+        import numpy
+    except ImportError:
+        return
+    columns = (numpy.ma.masked_equal([-1 if i is None else i for i in stops],
+                                     -1),
+               numpy.array([Interval.types.index(i) for i in types]))
+    report('50000 conversions, convert_many (numpy)',
+           best_of(lambda: Interval.convert_many(
+               numpy.array(starts), columns[0], types=columns[1])), baseline)
+
+
+if __name__ == '__main__':
+    bench_construct()
+    bench_to_slice()
+    bench_combine()
+    bench_lineage()
+    bench_convert_many()
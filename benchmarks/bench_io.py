@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Throughput of slicing delimited files
+"""
+import os
+import shutil
+import subprocess
+import tempfile
+
+from common import best_of
+
+from sliced.io import cut_file, cut_mmap
+
+ROWS = 200000
+COLUMNS = 20
+
+
+def make_file(directory):
+    path = os.path.join(directory, 'rows.tsv')
+    with open(path, 'w') as fileobj:
+        for i in range(ROWS):
+            fileobj.write('\t'.join('r{}c{}'.format(i, j)
+                                    for j in range(COLUMNS)) + '\n')
+    return path
+
+
+def report_throughput(name, path, func):
+    megabytes = os.path.getsize(path) / float(1 << 20)
+    seconds = best_of(func, repeat=3)
+    print('{:<44} {:>8.1f} MB/s'.format(name, megabytes / seconds))
+
+
+def bench_cut_file(path):
+    for spec in ('1, 3, 5', '2-8, 12-', '1-3, 5, 7, 9-11, 15'):
+        report_throughput('cut_file {!r}'.format(spec), path,
+                          lambda: cut_file(path, spec, out=os.devnull))
+
+
+def bench_cut_mmap(path):
+    for spec in ('1, 3, 5', '2-8, 12-', '1-3, 5, 7, 9-11, 15'):
+        report_throughput('cut_mmap {!r}'.format(spec), path,
+                          lambda: cut_mmap(path, spec, out=os.devnull))
+
+
+def bench_gnu_cut(path):
+    "reference point: the cut command itself"
+    if not shutil.which('cut'):
+        return
+    for spec in ('1,3,5', '2-8,12-', '1-3,5,7,9-11,15'):
+        command = ['cut', '-f', spec, path]
+        report_throughput('cut -f {}'.format(spec), path,
+                          lambda: subprocess.call(command,
+                                                  stdout=subprocess.DEVNULL))
+
+
+if __name__ == '__main__':
+    directory = tempfile.mkdtemp()
+    try:
+        path = make_file(directory)
+        bench_cut_file(path)
+        bench_cut_mmap(path)
+        bench_gnu_cut(path)
+    finally:
+        shutil.rmtree(directory)
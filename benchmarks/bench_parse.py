@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Cost of parsing slice strings, compared with the pyparsing reference grammar
+"""
+from common import best_of, report
+
+from sliced import (Grammar, IncrementalParser, InvalidSliceString, Slicer,
+                    compile_plan, plan_cache)
+from sliced.serialize import dumps, loads
+from sliced.intervals import Interval
+from sliced.parser import SliceParser
+
+SPECS = {
+    'slice_list': '1, 3:7, -1, 2:20:2, ::-1',
+    'unix_cut': '1-3,5,7-',
+    'dot_notation': '1.:5, 2..9:2, :.4',
+    'python_slice': '2:-1:3',
+}
+
+
+def pyparsing_parse(grammar, text):
+    "parse_text as it was before the fast parser, with a prebuilt grammar"
+    slices = grammar._text_grammar.parseString(text)
+    return [dict(grammar._slice_grammar.parseString(i)) for i in slices]
+
+
+def bench_parse():
+    for dialect, spec in sorted(SPECS.items()):
+        grammar = Grammar(dialect)
+        grammar._build_grammar()
+        baseline = best_of(lambda: pyparsing_parse(grammar, spec), 100)
+        report('{}, pyparsing'.format(dialect), baseline)
+        report('{}, fast parser'.format(dialect),
+               best_of(lambda: list(grammar.parse_text(spec)), 100),
+               baseline)
+
+
+def uncached_grammar(dialect):
+    "a grammar & parser built from scratch, without the shared registries"
+    grammar = Grammar.__new__(Grammar)
+    for attr, value in Grammar._registry[dialect].items():
+        setattr(grammar, attr, value)
+    grammar.validate_separators()
+    grammar._parser = SliceParser.from_grammar(grammar)
+    return grammar
+
+
+def bench_construct():
+    for dialect in sorted(SPECS):
+        baseline = best_of(lambda: uncached_grammar(dialect), 100)
+        report('{}, new grammar'.format(dialect), baseline)
+        report('{}, registered grammar'.format(dialect),
+               best_of(lambda: Grammar(dialect)._build_parser(), 100),
+               baseline)
+
+
+def parse_each(grammar, texts):
+    "validate slice strings one at a time, as before parse_many"
+    results = []
+    for text in texts:
+        try:
+            results.append(list(grammar.parse(text)))
+        except InvalidSliceString as error:
+            results.append(error)
+    return results
+
+
+def bench_parse_many():
+    # saved reports: many repeated specs, some of them invalid
+    texts = ['{}:{}, {}'.format(i % 50, i % 50 + 3, i % 7) for i in
+             range(4000)] + ['{}-{}'.format(i % 20, i) for i in range(1000)]
+    grammar = Grammar()
+    baseline = best_of(lambda: parse_each(grammar, texts))
+    report('5000 specs, parse each', baseline)
+    report('5000 specs, parse_many',
+           best_of(lambda: grammar.parse_many(texts)), baseline)
+
+
+def validate_each(specs):
+    "validate untrusted specs by catching the exception"
+    valid = 0
+    for spec in specs:
+        try:
+            Slicer(spec)
+            valid += 1
+        except InvalidSliceString as error:
+            error.message
+    return valid
+
+
+def bench_try_parse():
+    # a request stream of distinct, invalid specs
+    specs = ['{}:{} {}'.format(i, i + 3, i) for i in range(1, 2001)]
+
+    def compile_each():
+        return sum(1 for i in specs if Slicer.compile(i))
+
+    def raising():
+        plan_cache.clear()
+        return validate_each(specs)
+
+    def non_raising():
+        plan_cache.clear()
+        return compile_each()
+
+    baseline = best_of(raising, 10)
+    report('2000 bad specs, Slicer & except', baseline)
+    report('2000 bad specs, Slicer.compile', best_of(non_raising, 10),
+           baseline)
+
+
+def bench_incremental():
+    # typing a digit into the middle of a slice list of 300 slices
+    items = ['{}:{}'.format(i, i + 2) for i in range(1, 900, 3)]
+    edits = [', '.join(items[:150] + [str(i)] + items[150:])
+             for i in range(1, 10)]
+    grammar = Grammar()
+
+    def full():
+        for text in edits:
+            [Interval(**grammar._get_interval_args(i))
+             for i in grammar.parse_text(text)]
+
+    parser = IncrementalParser(grammar=grammar)
+    parser.update(edits[-1])
+
+    def incremental():
+        for text in edits:
+            parser.update(text)
+
+    baseline = best_of(full, 10)
+    report('300 slices, 9 edits, full parse', baseline)
+    report('300 slices, 9 edits, incremental', best_of(incremental, 10),
+           baseline)
+
+
+def bench_warm_start():
+    specs = ['{}:{}, {}, -{}'.format(i, i + 5, i * 2, i % 9 + 1)
+             for i in range(1, 251)]
+
+    def compile_all():
+        plan_cache.clear()
+        for spec in specs:
+            compile_plan(spec)
+
+    compile_all()
+    saved = dumps()
+
+    def load_all():
+        plan_cache.clear()
+        loads(saved)
+
+    baseline = best_of(compile_all, 10)
+    report('250 saved specs, compile', baseline)
+    report('250 saved specs, load', best_of(load_all, 10), baseline)
+
+
+if __name__ == '__main__':
+    bench_parse()
+    bench_construct()
+    bench_parse_many()
+    bench_try_parse()
+    bench_incremental()
+    bench_warm_start()
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""
+Shared helpers for the benchmark scripts
+========================================
+Each script in this directory can be run on its own, i.e.
+
+    $ python benchmarks/bench_core.py
+"""
+import os
+import sys
+import timeit
+
+# run against the working tree rather than an installed copy
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def best_of(func, number=1, repeat=5):
+    ":returns: fastest time in seconds for `number` calls of func"
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def report(name, seconds, baseline=None):
+    line = '{:<44} {:>10.3f} ms'.format(name, seconds * 1000)
+    if baseline:
+        line += '  {:>6.1f}x'.format(baseline / seconds)
+    print(line)
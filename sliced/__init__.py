@@ -7,18 +7,59 @@
     :copyright: (c) 2014 by Brian Peterson.
     :license: Apache 2.0, see LICENSE for more details.
 """
+import sys
+from importlib import import_module
+
 import sliced
 from ._compat import *
-from . import headers
-from . import intervals
-from .core import as_list, slice_, slices, cut
-from .exceptions import OptionNotFound, InvalidSliceString
+from .core import (as_list, as_columns, slice_, slices, cut, compile_plan,
+                   try_compile_plan, plan_cache)
+from .exceptions import OptionNotFound, InvalidSliceString, ParseError
 from .grammar import Grammar
+from .incremental import IncrementalParser
+from .plan import SlicePlan
+from .slicer import Slicer
+
+
+__all__ = ('as_list', 'as_columns', 'slices', 'slice_', 'cut', 'compile_plan',
+           'try_compile_plan', 'plan_cache', 'SlicePlan', 'Slicer',
+           'IncrementalParser', 'OptionNotFound', 'InvalidSliceString',
+           'ParseError',
+           'headers', 'intervals', 'save_plans', 'load_plans', 'Lineage')
+
+# attributes imported on first use: (module, attribute or None for modules);
+# headers need pyparsing, toolz & unidecode, and aio needs asyncio
+_lazy = {'headers': ('.headers', None), 'intervals': ('.intervals', None),
+         'save_plans': ('.serialize', 'save_plans'),
+         'load_plans': ('.serialize', 'load_plans'),
+         'Lineage': ('.lineage', 'Lineage')}
+
+if sys.version_info >= (3, 7):
+    _lazy.update((i, ('.aio', i)) for i in ('aslices', 'aslice_', 'acut'))
+    __all__ += ('aslices', 'aslice_', 'acut')
+
+
+def __getattr__(name):
+    try:
+        module, attr = _lazy[name]
+    except KeyError:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(
+                             __name__, name))
+    value = import_module(module, __name__)
+    if attr is not None:
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy))
 
 
-__all__ = ('as_list', 'slices', 'slice_', 'cut',
-           'OptionsNotFound', 'InvalidSliceString',
-           'headers', 'intervals')
+if sys.version_info < (3, 7):
+    # module __getattr__ (PEP 562) isn't supported
+    for _name in _lazy:
+        __getattr__(_name)
 
 
 __version__ = '0.1a'
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Slicing rows from asynchronous sources
+======================================
+Async generator counterparts of slices, slice_ & cut for rows produced by
+`async for` sources (network feeds, async file readers, ...).  The slice
+string is compiled once per call; with large header lists it is compiled in
+the event loop's default executor so the loop isn't blocked.
+
+Requires Python 3.7+.
+"""
+import asyncio
+
+from .core import _normalize, compile_plan
+
+#: compile in an executor when there are at least this many headers
+EXECUTOR_HEADERS = 256
+
+
+async def _compile(slicestr, dialect, headers, ignorecase, allow_slice_list):
+    args = (slicestr, dialect, headers, ignorecase, allow_slice_list)
+    if headers and len(headers) >= EXECUTOR_HEADERS:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, compile_plan, *args)
+    return compile_plan(*args)
+
+
+async def _rows(rows):
+    "iterate over sync or async iterables"
+    if hasattr(rows, '__aiter__'):
+        async for row in rows:
+            yield row
+    else:
+        for row in rows:
+            yield row
+
+
+async def _batches(rows, size):
+    batch = []
+    async for row in _rows(rows):
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _aslices(rows, slicestr, dialect, headers, ignorecase, batch_size,
+                   allow_slice_list=True):
+    slicestr, plan = _normalize(slicestr), None
+    if slicestr and slicestr.strip() != ':':
+        plan = await _compile(slicestr, dialect, headers, ignorecase,
+                              allow_slice_list)
+    if batch_size:
+        async for batch in _batches(rows, batch_size):
+            yield batch if plan is None else list(plan.apply(batch))
+    else:
+        async for row in _rows(rows):
+            yield row if plan is None else plan(row)
+
+
+def aslices(rows, slicestr, dialect=None, headers=None, ignorecase=False,
+            batch_size=None):
+    """
+    extract columns from rows produced by an async iterable
+    -------------------------------------------------------
+    :param rows:         async iterable (or iterable) of rows
+    :param str slicestr: Slice string specified in the selected dialect.
+    :param str dialect:  Dialect name; used to build grammar and parse text.
+    :param headers:      header names and optional index positions
+    :param ignorecase:   Indicates whether header names are case sensitive
+    :param int batch_size: if set, rows are gathered & sliced this many at a
+                         time, and each batch is produced as a list
+    :returns:            sliced rows (or lists of sliced rows)
+    :rtype:              async generator
+    :raises:             InvalidSliceString
+    """
+    return _aslices(rows, slicestr, dialect, headers, ignorecase, batch_size)
+
+
+def aslice_(rows, slicestr, dialect=None, headers=None, ignorecase=False,
+            batch_size=None):
+    """
+    extract columns from rows produced by an async iterable using a single
+    slice; see aslices & slice_
+    """
+    return _aslices(rows, slicestr, dialect, headers, ignorecase, batch_size,
+                    allow_slice_list=False)
+
+
+def acut(rows, text, batch_size=None):
+    """
+    extract columns from rows produced by an async iterable using Unix
+    cut-style syntax; see aslices & cut
+    """
+    return _aslices(rows, text, 'unix_cut', None, False, batch_size)
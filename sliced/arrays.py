@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+NumPy backend for 2-d arrays
+============================
+Rather than slicing an array row by row, a compiled plan is converted into
+a single index for the column axis & applied to the whole matrix at once:
+
+- a plan made of one slice becomes a basic slice; the result is a view
+  sharing the array's memory (no copy).
+- a slice list becomes one array of column numbers (fancy indexing).
+
+NumPy is optional; it's only imported when a sequence exposes the array
+interface.
+"""
+import sys
+
+
+def as_array(seq):
+    """
+    :returns: seq as a 2-d numpy array sharing its memory, or None when seq
+              isn't array-like or NumPy isn't installed
+    """
+    if not (hasattr(seq, '__array_interface__')
+            or hasattr(seq, '__array_struct__')):
+        return None
+    numpy = sys.modules.get('numpy')
+    if numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            return None
+    array = numpy.asarray(seq)
+    return array if array.ndim == 2 else None
+
+
+def column_index(plan, width):
+    """
+    :param SlicePlan plan: compiled slice plan
+    :param int width:      number of columns in the array
+    :returns: basic slice or array of column numbers to select
+    """
+    slices = plan._runs if plan.slice_list else plan.slices
+    if len(slices) == 1:
+        return slices[0]
+    import numpy
+    return numpy.fromiter(plan.indices(width), numpy.intp)
+
+
+def slice_array(array, plan):
+    """
+    extract columns from all rows of a 2-d array in one operation
+    -------------------------------------------------------------
+    :param array:          2-d numpy array
+    :param SlicePlan plan: compiled slice plan
+    :returns:              view of array if plan is a single slice, otherwise
+                           a new array holding the selected columns
+    :rtype:                numpy.ndarray
+    """
+    return array[:, column_index(plan, array.shape[1])]
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Process-wide cache of compiled slice plans
+==========================================
+Parsing a slice string means building a grammar, running pyparsing & creating
+intervals; the result only depends on the slice string and a handful of
+options, so it can be reused for every later call with the same arguments.
+"""
+from collections import namedtuple, OrderedDict
+from threading import Lock
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses evictions maxsize currsize')
+
+
+class LRUCache(object):
+    """
+    A thread-safe, least recently used cache
+    ----------------------------------------
+
+    Attributes:
+      hits (int):      number of lookups that found a cached value
+      misses (int):    number of lookups that didn't
+      evictions (int): number of values dropped to stay within maxsize
+
+    Properties:
+      maxsize (int): maximum number of cached values; None for unbounded,
+                     0 disables caching.  Shrinking the cache evicts the
+                     least recently used values.
+    """
+
+    def __init__(self, maxsize=128):
+        self._lock = Lock()
+        self._data = OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+        self.maxsize = maxsize
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value):
+        """
+        :raises ValueError: must be None or a number >= 0
+        """
+        if value is not None:
+            value = int(value)
+            if value < 0:
+                raise ValueError('Cache size can not be negative.')
+        with self._lock:
+            self._maxsize = value
+            self._evict()
+
+    def _evict(self):
+        if self._maxsize is None:
+            return
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data[key] = value
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            self._evict()
+
+    def prune(self, predicate):
+        ":returns: the number of values dropped, those whose key matches"
+        with self._lock:
+            keys = [i for i in self._data if predicate(i)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def items(self):
+        ":returns: (key, value) pairs, least recently used first"
+        with self._lock:
+            return list(self._data.items())
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.evictions,
+                         self._maxsize, len(self._data))
+
+    def clear(self):
+        "drop all cached values & reset the statistics"
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
@@ -1,29 +1,47 @@
 # -*- coding: utf-8 -*-
-from collections import Iterator, Sequence
+try:
+    from collections.abc import Iterator, Sequence
+except ImportError:
+    from collections import Iterator, Sequence
+from array import array
 from itertools import chain
-chained = chain.from_iterable
 
+from .arrays import as_array, slice_array
+from .cache import LRUCache
+from .exceptions import InvalidSliceString, OptionNotFound, ParseError
 from .grammar import Grammar
-from .headers.header import Headers
 from .intervals.interval import Interval
+from .plan import SlicePlan
+
+#: compiled plans keyed by (slice string, dialect, headers, ignorecase, ...)
+plan_cache = LRUCache(maxsize=256)
 
 # convert to 2-d sequence
 # slicing required? (empty or copy [:])
 # headers_to_colnums
 
-def _preprocess(seq, slicestr, headers, ignorecase):
-    if not seq:
-        return (_ for _ in ()), None
+def _normalize(slicestr):
     if isinstance(slicestr, int):
         slicestr = str(slicestr)
-    slicestr = slicestr.replace('None', '')
+    return slicestr.replace('None', '')
+
+
+def _preprocess(seq, slicestr):
+    slicestr = _normalize(slicestr)
+    array = as_array(seq)
+    if array is not None:
+        if not slicestr or slicestr.strip() == ':':
+            return array, None
+        return array, slicestr
+    if not seq:
+        return (_ for _ in ()), None
     first_item = None
     try:
         is_2d_list = isinstance(seq[0], Sequence)
     except TypeError:
         try:
             first_item = next(seq)
-            seq = chain(first_item, seq)
+            seq = chain([first_item], seq)
         except TypeError:
             raise
         except StopIteration:
@@ -32,18 +50,234 @@ def _preprocess(seq, slicestr, headers, ignorecase):
         seq = list(seq)
     if not slicestr or slicestr.strip() == ':':
         return seq, None
-    if headers:
-        h = Headers(headers, ignorecase)
-        slicestr = h.names_to_indices(slicestr)
     return seq, slicestr
 
 
+def _headers_key(headers):
+    "hashable version of the headers argument"
+    if not headers:
+        return None
+    if hasattr(headers, 'items'):
+        return tuple(sorted(headers.items()))
+    return tuple(headers)
+
+
+def _translate(slicestr, headers, ignorecase, grammar):
+    ":returns: slicestr with header names replaced by column numbers"
+    # headers need pyparsing, so aren't imported until they're used
+    from .headers.header import Headers
+    h = Headers(headers, ignorecase, grammar=grammar)
+    return h.names_to_indices(slicestr)
+
+
+def _is_slice_list(slicestr, grammar, allow_slice_list):
+    return (allow_slice_list and grammar.allow_slice_list
+            and grammar.list_sep in slicestr)
+
+
+def _build_plan(slicestr, dialect, headers, ignorecase, allow_slice_list,
+                grammar=None):
+    if not grammar:
+        grammar = Grammar(dialect)
+    if headers:
+        slicestr = _translate(slicestr, headers, ignorecase, grammar)
+    if _is_slice_list(slicestr, grammar, allow_slice_list):
+        slices = [Interval(**i).to_slice() for i in grammar.parse(slicestr)]
+        return SlicePlan(slices)
+    grammar.allow_slice_list = False
+    return SlicePlan([Interval(**grammar.parse(slicestr)).to_slice()], False)
+
+
+def _try_build_plan(slicestr, dialect, headers, ignorecase, allow_slice_list):
+    ":returns: SlicePlan, or a ParseError if the slice string isn't valid"
+    grammar = Grammar(dialect)
+    if headers:
+        try:
+            slicestr = _translate(slicestr, headers, ignorecase, grammar)
+        except InvalidSliceString as error:
+            return ParseError.from_exception(error)
+    slice_list = _is_slice_list(slicestr, grammar, allow_slice_list)
+    if not slice_list:
+        grammar.allow_slice_list = False
+    args = grammar.try_parse(slicestr)
+    if isinstance(args, ParseError):
+        return args
+    try:
+        intervals = [Interval(**i) for i in (args if slice_list else [args])]
+    except ValueError as error:
+        # a zero endpoint in a unit-based dialect
+        return ParseError(slicestr, str(error))
+    return SlicePlan([i.to_slice() for i in intervals], slice_list)
+
+
+def _compile(build, slicestr, dialect, headers, ignorecase, allow_slice_list,
+             width):
+    key = (slicestr, dialect, _headers_key(headers), ignorecase,
+           allow_slice_list)
+    plan = plan_cache.get(key)
+    if plan is None:
+        plan = build(slicestr, dialect, headers, ignorecase, allow_slice_list)
+        if isinstance(plan, ParseError):
+            return plan
+        plan_cache.put(key, plan)
+    if width is None and isinstance(headers, (list, tuple)):
+        width = len(headers)
+    return plan if width is None else plan.specialize(width)
+
+
+def compile_plan(slicestr, dialect=None, headers=None, ignorecase=False,
+                 allow_slice_list=True, width=None):
+    """
+    parse a slice string into a reusable plan
+    -----------------------------------------
+    Plans are cached process-wide in `plan_cache`, so repeated calls with the
+    same arguments skip parsing completely.
+
+    :param str slicestr:    Slice string specified in the selected dialect.
+    :param dialect:         Slice string dialect name.
+    :type dialect:          str or None
+    :param headers:         header names and optional index positions
+    :param ignorecase:      Indicates whether header names are case sensitive
+    :param allow_slice_list: False restricts the plan to a single slice
+    :param int width:       number of items in each row, when known; the plan
+                            is specialized for rows of that width (see
+                            SlicePlan.specialize).  Defaults to the number of
+                            headers when they're given as a list.
+    :returns:               compiled slice plan
+    :rtype:                 SlicePlan
+    :raises:                InvalidSliceString
+
+    >>> compile_plan('2:, 1')
+    SlicePlan([slice(1, None, None), slice(0, 1, None)], slice_list=True)
+    """
+    return _compile(_build_plan, slicestr, dialect, headers, ignorecase,
+                    allow_slice_list, width)
+
+
+def try_compile_plan(slicestr, dialect=None, headers=None, ignorecase=False,
+                     allow_slice_list=True, width=None):
+    """
+    compile_plan for untrusted slice strings: an invalid slice string (or an
+    unknown header name) returns a ParseError instead of raising, and valid
+    ones share compile_plan's cache.
+
+    :returns: compiled slice plan, or a ParseError, which is false
+
+    >>> try_compile_plan('2:, 1,, 3')
+    ParseError('2:, 1,, 3', 'Expected string_end', 7)
+    """
+    return _compile(_try_build_plan, slicestr, dialect, headers, ignorecase,
+                    allow_slice_list, width)
+
+
+def _apply(plan, seq):
+    array = as_array(seq)
+    return plan.apply(seq) if array is None else slice_array(array, plan)
+
+
 def as_list(seq):
     return list(map(list, seq))
 
 
+#: ints of up to this magnitude are exact as floats
+_EXACT_FLOAT = 2 ** 53
+
+_KINDS = {'q': int, 'd': float}
+
+
+def _new_column(value):
+    ":returns: array for numeric values, otherwise a list"
+    code = {int: 'q', float: 'd'}.get(type(value))
+    if code:
+        try:
+            return array(code, [value])
+        except OverflowError:
+            pass
+    return [value]
+
+
+def _retype(columns, appends, kinds, row, count):
+    """
+    append the rest of row, changing column containers where required: an
+    array only takes values of its exact type (not bools or Decimals), & a
+    float array only takes ints it holds exactly
+    """
+    for i, value in enumerate(row):
+        column, kind = columns[i], kinds[i]
+        if len(column) > count:
+            continue
+        if kind is None or type(value) is kind:
+            try:
+                appends[i](value)
+                continue
+            except OverflowError:
+                pass
+        elif (kind is float and type(value) is int
+              and abs(value) <= _EXACT_FLOAT):
+            appends[i](value)
+            continue
+        if (kind is int and type(value) is float
+                and all(abs(j) <= _EXACT_FLOAT for j in column)):
+            column, kind = array('d', column), float
+        else:
+            column, kind = list(column), None
+        column.append(value)
+        columns[i], appends[i], kinds[i] = column, column.append, kind
+
+
+def as_columns(seq):
+    """
+    transpose rows into column-major containers in a single pass
+    ------------------------------------------------------------
+    Columns of ints or floats are gathered into array.array objects ('q'
+    and 'd'); any other column is a list.  An int column that meets a float
+    becomes a float column, unless an int is too big to be exact as a float.
+
+    :param seq: 2-d sequence or iterator of rows, all the same width
+    :returns:   one container per column
+    :rtype:     list
+    :raises ValueError: rows differ in width
+
+    >>> as_columns([['a', 1, 1.5], ['b', 2, 3]])
+    [['a', 'b'], array('q', [1, 2]), array('d', [1.5, 3.0])]
+    """
+    array_ = as_array(seq)
+    if array_ is not None:
+        return list(array_.T)
+    rows = iter(seq)
+    try:
+        first = next(rows)
+    except StopIteration:
+        return []
+    columns = [_new_column(i) for i in first]
+    appends = [i.append for i in columns]
+    kinds = [_KINDS.get(getattr(i, 'typecode', None)) for i in columns]
+    width = len(columns)
+    for count, row in enumerate(rows, 1):
+        if len(row) != width:
+            raise ValueError('Rows must have the same number of columns.')
+        try:
+            for append, kind, value in zip(appends, kinds, row):
+                if kind is not None and type(value) is not kind:
+                    raise TypeError(value)
+                append(value)
+        except (TypeError, OverflowError):
+            _retype(columns, appends, kinds, row, count)
+    return columns
+
+
+def _output(seq, output):
+    if output == 'rows':
+        return seq
+    if output == 'columns':
+        return as_columns(seq)
+    error = dict(mesg='Unknown output', selected_option=output,
+                 available_options=['rows', 'columns'])
+    raise OptionNotFound(error)
+
+
 def slice_(seq, slicestr, dialect=None, headers=None, ignorecase=False,
-           grammar=None):
+           grammar=None, output='rows'):
     """
     extract columns from rows using a single slice
     ----------------------------------------------
@@ -60,26 +294,29 @@ def slice_(seq, slicestr, dialect=None, headers=None, ignorecase=False,
                          and header name (value=str)
     :param ignorecase:   Indicates whether header names are case sensitive
     :type ignorecase:    bool
+    :param str output:   'rows' or 'columns' (see as_columns)
     :returns:            A list of sliced objects for each each item in the
-                         sequence.
-    :rtype:              generator
+                         sequence; a view when seq is a 2-d NumPy array.
+    :rtype:              generator, numpy.ndarray or list of columns
     :raises:             InvalidSliceString
 
     >>> seq = [['a1', 'a2', 'a3'], ['b1', 'b2', 'b3']]
     >>> list(slice_(seq, '2:'))
     [['a2', 'a3'], ['b2', 'b3']]
     """
-    seq, slicestr = _preprocess(seq, slicestr, headers, ignorecase)
+    seq, slicestr = _preprocess(seq, slicestr)
     if slicestr is None:
-        return seq
-    if not grammar:
-        grammar = Grammar(dialect)
-    grammar.allow_slice_list = False
-    slice_ = Interval(**grammar.parse(slicestr)).to_slice()
-    return (i[slice_] for i in seq)
+        return _output(seq, output)
+    if grammar:
+        plan = _build_plan(slicestr, dialect, headers, ignorecase, False,
+                           grammar)
+    else:
+        plan = compile_plan(slicestr, dialect, headers, ignorecase, False)
+    return _output(_apply(plan, seq), output)
 
 
-def slices(seq, slicestr, dialect=None, headers=None, ignorecase=False):
+def slices(seq, slicestr, dialect=None, headers=None, ignorecase=False,
+           output='rows', workers=None):
     """
     extract columns from rows using one or more slice strings
     ---------------------------------------------------------
@@ -93,8 +330,14 @@ def slices(seq, slicestr, dialect=None, headers=None, ignorecase=False):
                          and header name (value=str)
     :param ignorecase:   Indicates whether header names are case sensitive
     :type ignorecase:    bool
+    :param str output:   'rows' or 'columns'; columns are gathered into
+                         column-major containers (see as_columns)
+    :param int workers:  slice rows using this many worker processes (see
+                         sliced.parallel); rows must be picklable
     :returns:            Produces a list of sliced objects per item in the seq.
-    :rtype:              generator
+                         2-d NumPy arrays are sliced in one operation instead,
+                         returning an array (a view when possible).
+    :rtype:              generator, numpy.ndarray or list of columns
 
     >>> seq = [['a1', 'a2', 'a3'], ['b1', 'b2', 'b3']]
     >>> list(slices(seq, '2:, 1'))
@@ -112,30 +355,31 @@ def slices(seq, slicestr, dialect=None, headers=None, ignorecase=False):
     >>> list(slices(seq, '1...3', 'double_dot'))
     [['a1', 'a2'], ['b1', 'b2']]
     """
-    grammar = Grammar(dialect)
-    if not grammar.allow_slice_list or grammar.list_sep not in slicestr:
-        return slice_(seq, slicestr, dialect, headers, ignorecase, grammar)
-    seq, slicestr = _preprocess(seq, slicestr, headers, ignorecase)
+    seq, slicestr = _preprocess(seq, slicestr)
     if slicestr is None:
-        return seq
-    slices = [Interval(**i).to_slice() for i in grammar.parse(slicestr)]
-    return map(list, (chained(i[j] for j in slices) for i in seq))
+        return _output(seq, output)
+    plan = compile_plan(slicestr, dialect, headers, ignorecase)
+    if workers and as_array(seq) is None:
+        from .parallel import parallel_slices
+        return _output(parallel_slices(slicestr, plan, seq, workers), output)
+    return _output(_apply(plan, seq), output)
 
 
-def cut(seq, text):
+def cut(seq, text, output='rows'):
     """
     extract columns from rows using Unix cut-style syntax
     -----------------------------------------------------
     :param Sequence seq: 2-d Sequence to slice (i.e. rows & columns)
     :param str text:     Slice string specified in the selected dialect.
+    :param str output:   'rows' or 'columns' (see as_columns)
     :returns:            Produces a list of sliced objects per item in the seq.
-    :rtype:              generator
+    :rtype:              generator or list of columns
 
     >>> seq = [['a1', 'a2', 'a3'], ['b1', 'b2', 'b3']]
     >>> list(cut(seq, '2-, 1'))
     [['a2', 'a3', 'a1'], ['b2', 'b3', 'b1']]
     """
-    return slices(seq, text, 'unix_cut')
+    return slices(seq, text, 'unix_cut', output=output)
 
 if __name__ == '__main__':
     import doctest
@@ -1,63 +1,150 @@
 # -*- coding: utf-8 -*-
+def _show_column(text, column, message, width=40):
+    ":returns: message, below the text with a pointer to the (1-based) column"
+    pointer = column - 1
+    if pointer > width:
+        half_width = width // 2
+        text = text[pointer - half_width:pointer + half_width]
+        pointer = half_width
+    return '{}\n{}^\n{} at column {}'.format(text[:width], ' ' * pointer,
+                                              message, column)
+
+
 class OptionNotFound(KeyError):
 
     """
     Similar to KeyNotFound, but also displays the list of valid keys
     """
 
-    def __init__(self, message, errors={}):
+    def __init__(self, message, errors=None):
         """
         message can be a string containing the value or can be a dictionary
         containing the following keys:
-            value (str): the value that wasn't found
-            options ([str[, str]...]): list of valid options
+            mesg (str): error message
+            selected_option (str): the value that wasn't found
+            available_options ([str[, str]...]): list of valid options
+        errors can be the list of valid options when message is a string
         """
-        self.message = KeyError.__init__(self, message)
+        KeyError.__init__(self, message)
+        self.message = message
+        self.errors = errors
 
     def show_options(self):
-        value = self.error.get('value', 'None')
-        options = self.error.get('options', [])
-        if options:
-            mesg = ', '.join(map(repr, options[:-1]))
-            if len(options) > 1:
-                mesg += ' or ' + options[-1]
-            return '{!r}\nValid options: {}.'.format(value, mesg)
+        ":returns: the valid options formatted for display, or None"
+        options = self.errors
+        if isinstance(self.message, dict):
+            options = self.message.get('available_options', options)
+        if not isinstance(options, (list, tuple)) or not options:
+            return None
+        options = [repr(i) for i in options]
+        mesg = ', '.join(options[:-1])
+        if len(options) > 1:
+            mesg += ' or '
+        return 'Valid options: {}.'.format(mesg + options[-1])
 
     def show(self):
-        if isinstance(self.message, dict):
-            if 'value' in self.errors and 'options' in self.errors:
-                options = self.show_options()
-                return '{!r}\n{}'.format(self.message, options)
-        return self.message
+        ":returns: the error message & the valid options as a string"
+        message = self.message
+        if isinstance(message, dict):
+            message = '{}: {!r}'.format(message.get('mesg', 'Not found'),
+                                        message.get('selected_option'))
+        options = self.show_options()
+        return '{}\n{}'.format(message, options) if options else str(message)
 
 
 class InvalidSliceString(Exception):
 
     def __init__(self, message='', info=None):
         """
-        message keys:
-            mesg (str):   error message
-            column (int): position in text where error first occured
-            width (int):  maximum width of displayed text (default 40)
+        info keys:
+            text (str):     the slice string
+            column (int):   position in text where error first occured
+            expected (tuple): descriptions of the tokens expected there
+            width (int):    maximum width of displayed text (default 40)
         """
         Exception.__init__(self, message)
         self.message = message
         self.info = info
 
     def show(self):
+        ":returns: the error message, with the text & a pointer to the column"
         name = self.__class__.__name__
-        if isinstance(self.info, dict):
-            text = self.info.get('text', '')
-            pointer = column = self.info.get('column', 0)
-            max_width = self.info.get('width', 40)
-            half_width = max_width//2
-            if pointer > max_width:
-                text = text[pointer - half_width:pointer + half_width]
-                pointer -= (pointer - half_width)
-            pointer = ' ' * (pointer + 1) + '^'
-            print(text[:max_width])
-            print(pointer)
-            error_mesg = self.message if self.message else '{}: Bad syntax'.format(name)
-            print('{} at column {}'.format(error_mesg, column + 1))
-        else:
-            print(self.message if self.message else name)
+        info = self.info if isinstance(self.info, dict) else {}
+        if info.get('column') is None:
+            return self.message if self.message else name
+        error_mesg = self.message if self.message else \
+            '{}: Bad syntax'.format(name)
+        return _show_column(info.get('text', ''), info['column'], error_mesg,
+                            info.get('width', 40))
+
+
+class ParseError(object):
+
+    """
+    A slice string that couldn't be parsed, returned (rather than raised) by
+    non-raising methods such as Grammar.try_parse & Slicer.compile.
+    ParseErrors are false in a boolean context, so valid results can be told
+    apart with `if`.  The message is only formatted when it's used.
+
+    Attributes:
+      text (str):       the slice string
+      message (str):    error message
+      column (int):     position in text where the error first occurred, or
+                        None if it isn't tied to a position (e.g. a zero
+                        endpoint in a unit-based dialect)
+      expected (tuple): descriptions of the tokens expected at column
+    """
+    __slots__ = ('text', 'column', 'expected', '_message')
+
+    def __init__(self, text, message=None, column=None, expected=()):
+        self.text = text
+        self.column = column
+        self.expected = expected
+        self._message = message
+
+    @classmethod
+    def from_exception(cls, error):
+        ":returns: the ParseError equivalent to an InvalidSliceString"
+        info = error.info if isinstance(error.info, dict) else {}
+        return cls(info.get('text'), error.message, info.get('column'),
+                   info.get('expected', ()))
+
+    @property
+    def message(self):
+        if self._message is None:
+            self._message = 'Expected ' + ' or '.join(self.expected)
+        return self._message
+
+    def __bool__(self):
+        return False
+
+    __nonzero__ = __bool__
+
+    def __eq__(self, obj):
+        if not isinstance(obj, ParseError):
+            return NotImplemented
+        return ((self.text, self.message, self.column)
+                == (obj.text, obj.message, obj.column))
+
+    def __ne__(self, obj):
+        result = self.__eq__(obj)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '{}({!r}, {!r}, {!r})'.format(self.__class__.__name__,
+                                             self.text, self.message,
+                                             self.column)
+
+    def show(self):
+        ":returns: the error message, with the text & a pointer to the column"
+        if self.column is None:
+            return self.message
+        return _show_column(self.text, self.column, self.message)
+
+    def exception(self):
+        ":returns: the equivalent InvalidSliceString"
+        return InvalidSliceString(self.message, {'text': self.text,
+                                                 'column': self.column,
+                                                 'expected': self.expected})
@@ -1,70 +1,250 @@
 # -*- coding: utf-8 -*-
-import pyparsing as pp
-from pyparsing import Literal, Optional, ZeroOrMore, Regex, \
-    Combine, Suppress, ParseException
+"""
+Slice string grammars & dialects
+================================
+Slice strings are parsed by the compiled parsers in sliced.parser; pyparsing
+is only imported when the pyparsing version of a grammar is built, which is
+kept as the reference implementation (and used by the Headers class).
+"""
+import re
+
+from ._compat import StringType
+from .exceptions import InvalidSliceString, OptionNotFound, ParseError
+from .intervals.interval import Interval
+from .parser import SliceParser, _literal, range_separators
+
+_separator = re.compile(r'[^a-zA-Z_]+$')
+
+
+def _copy_args(result):
+    ":returns: a copy of a try_parse result (a ParseError isn't changed)"
+    if isinstance(result, list):
+        return [dict(i) for i in result]
+    if isinstance(result, dict):
+        return dict(result)
+    return result
+
+
+def _registered_dialect(name):
+    ":returns: dialect method loading the settings of a registered dialect"
+    def method(self):
+        for attr, value in Grammar._registry[name].items():
+            setattr(self, attr, dict(value) if isinstance(value, dict)
+                    else value)
+    method.__name__ = Grammar.dialect_method_prefix + name
+    method.registered = True
+    return method
+
+
+def _pyparsing():
+    import pyparsing
+    return pyparsing
+
+
+class _element(object):
+    """
+    A pyparsing element class attribute, built on first use so that importing
+    this module doesn't import pyparsing
+    """
+
+    def __init__(self, build):
+        self.build = build
+        self.name = build.__name__
+
+    def __get__(self, obj, cls):
+        owner = next(i for i in cls.__mro__
+                     if i.__dict__.get(self.name) is self)
+        value = self.build(owner, _pyparsing())
+        setattr(owner, self.name, value)
+        return value
 
-from .exceptions import InvalidSliceString, OptionNotFound
 
+class Grammar(object):
 
-def _fist_el_to_int(tok):
-    return int(tok[0])
+    @_element
+    def digit(cls, pp):
+        return pp.Regex(r'\d')
 
+    @_element
+    def nonzerodigit(cls, pp):
+        return pp.Regex(r'[1-9]')
 
-class Grammar(object):
+    @_element
+    def positiveinteger(cls, pp):
+        return pp.Combine(cls.nonzerodigit + pp.ZeroOrMore(cls.digit))
+
+    @_element
+    def negativeinteger(cls, pp):
+        return pp.Combine('-' + cls.positiveinteger)
+
+    @_element
+    def nonzerointeger(cls, pp):
+        return cls.positiveinteger ^ cls.negativeinteger
+
+    @_element
+    def unsignedinteger(cls, pp):
+        return '0' ^ cls.positiveinteger
+
+    @_element
+    def integer(cls, pp):
+        return '0' ^ cls.nonzerointeger
 
-    digit = Regex(r'\d')
-    nonzerodigit = Regex(r'[1-9]')
-    positiveinteger = Combine(nonzerodigit + ZeroOrMore(digit))
-    negativeinteger = Combine('-' + positiveinteger)
-    nonzerointeger = positiveinteger ^ negativeinteger
-    unsignedinteger = '0' ^ positiveinteger
-    integer = '0' ^ nonzerointeger
-    sep = Regex(r'[^a-zA-Z_]+$')
+    @_element
+    def sep(cls, pp):
+        return pp.Regex(_separator.pattern)
 
     dialect_method_prefix = '_dialect__'
 
+    # shared by every instance: the settings of each registered dialect, the
+    # settings made by dialect methods (subclasses can still add dialects as
+    # _dialect__<name> methods) keyed by (class, dialect name), & the
+    # compiled parsers keyed by options
+    _registry = {}
+    _dialects = {}
+    _parsers = {}
+
     def __init__(self, dialect=None):
         if dialect is None:
             dialect = 'slice_list'
         self.dialect = dialect
 
+    @staticmethod
+    def _dialect_name(name):
+        if name:
+            name = name.lower().replace(' ', '_').replace('-', '_')
+        return name
+
     @property
     def dialect(self):
         return self._dialect
 
     @dialect.setter
     def dialect(self, name):
-        if name:
-            name = name.lower().replace(' ', '_').replace('-', '_')
-        try:
-            getattr(self, self.__class__.dialect_method_prefix + name)()
-            self._dialect = name
-            self._grammar_update = True
-        except AttributeError:
+        name = self._dialect_name(name)
+        settings = self._dialect_settings(name)
+        if settings is None:
             self._dialect = None
             error = dict(mesg='Unknown dialect', selected_option=name,
                          available_options=self.get_dialects())
             raise OptionNotFound(error)
+        for attr, value in settings.items():
+            setattr(self, attr, dict(value) if isinstance(value, dict)
+                    else value)
+        self._dialect = name
+        self._grammar_update = True
+
+    @classmethod
+    def _dialect_settings(cls, name):
+        """
+        :returns: the attributes set by the dialect, or None if it's unknown;
+                  dialect methods are only run the first time, on a blank
+                  instance
+        """
+        method = getattr(cls, cls.dialect_method_prefix + name, None)
+        if method is None or getattr(method, 'registered', False):
+            return Grammar._registry.get(name)
+        key = (cls, name)
+        settings = Grammar._dialects.get(key)
+        if settings is None:
+            blank = cls.__new__(cls)
+            method(blank)
+            settings = vars(blank)
+            settings.pop('_grammar_update', None)
+            Grammar._dialects[key] = settings
+        return settings
+
+    @classmethod
+    def register_dialect(cls, name, list_sep=',', range_sep=':', step_sep=':',
+                         interval_map=None, allow_relative_indices=True,
+                         allow_stepped_intervals=True,
+                         allow_reverse_strides=True, allow_slice_list=True):
+        """
+        add (or replace) a dialect, available to every grammar
+        ------------------------------------------------------
+        The dialect's parser is compiled straight away, & a _dialect__<name>
+        method loading its settings is added for dialect methods to call.
+        Replacing a dialect drops the plans compiled with it from plan_cache.
+
+        :param str name:      dialect name
+        :param str list_sep:  slice list separator
+        :param range_sep:     range separator, or a tuple of range separators
+        :param str step_sep:  step separator
+        :param dict interval_map: interval type for each range separator,
+                              i.e. {'..': 'open'}; by default all are closed
+        :param bool allow_relative_indices:  allow negative indices
+        :param bool allow_stepped_intervals: allow steps
+        :param bool allow_reverse_strides:   allow negative steps
+        :param bool allow_slice_list:        allow lists of slices
+        :returns:             the normalized dialect name
+        :raises ValueError:   invalid separator
+        :raises OptionNotFound: unknown interval type
+        """
+        name = cls._dialect_name(name)
+        seps = range_sep if isinstance(range_sep, tuple) else (range_sep,)
+        if interval_map is None:
+            interval_map = dict.fromkeys(seps, 'closed')
+        for type_ in interval_map.values():
+            if type_ not in Interval.types:
+                error = dict(mesg='Unknown interval type',
+                             selected_option=type_,
+                             available_options=Interval.types)
+                raise OptionNotFound(error)
+        grammar = cls.__new__(cls)
+        grammar._dialect = name
+        grammar.list_sep, grammar.step_sep = list_sep, step_sep
+        grammar.range_sep = range_sep
+        grammar.interval = dict(interval_map)
+        grammar.allow_relative_indices = allow_relative_indices
+        grammar.allow_stepped_intervals = allow_stepped_intervals
+        grammar.allow_reverse_strides = allow_reverse_strides
+        grammar.allow_slice_list = allow_slice_list
+        grammar._build_parser()
+        settings = vars(grammar)
+        for attr in ('_dialect', '_grammar_update', '_parser'):
+            del settings[attr]
+        if name in Grammar._registry:
+            # core imports this module, so only imports it once it's loaded
+            from .core import plan_cache
+            plan_cache.prune(lambda key: cls._dialect_name(
+                key[1] or 'slice_list') == name)
+        Grammar._registry[name] = settings
+        # dialect methods may have loaded the dialect's old settings
+        Grammar._dialects.clear()
+        setattr(Grammar, Grammar.dialect_method_prefix + name,
+                _registered_dialect(name))
+        return name
 
     @property
     def allow_relative_indices(self):
-        return self.endpoint == self.__class__.integer
+        return self._allow_relative_indices
 
     @allow_relative_indices.setter
     def allow_relative_indices(self, enabled):
         self._grammar_update = True
-        endpoint = 'integer' if enabled else 'unsignedinteger'
-        self.endpoint = getattr(self.__class__, endpoint)
+        self._allow_relative_indices = enabled
 
     @property
     def allow_reverse_strides(self):
-        return self.stride == self.__class__.nonzerointeger
+        return self._allow_reverse_strides
 
     @allow_reverse_strides.setter
     def allow_reverse_strides(self, enabled):
         self._grammar_update = True
-        stride = 'nonzerointeger' if enabled else 'positiveinteger'
-        self.stride = getattr(self.__class__, stride)
+        self._allow_reverse_strides = enabled
+
+    @property
+    def endpoint(self):
+        ":returns: pyparsing element matching slice endpoints"
+        cls = self.__class__
+        return cls.integer if self.allow_relative_indices \
+            else cls.unsignedinteger
+
+    @property
+    def stride(self):
+        ":returns: pyparsing element matching strides"
+        cls = self.__class__
+        return cls.nonzerointeger if self.allow_reverse_strides \
+            else cls.positiveinteger
 
     @property
     def allow_slice_list(self):
@@ -86,103 +266,115 @@ class Grammar(object):
 
     def get_dialects(self):
         prefix = self.__class__.dialect_method_prefix
-        prefix_length = len(prefix)
-        return [i[prefix_length:] for i in dir(self) if i.startswith(prefix)]
+        # registered dialects' methods are listed by the registry
+        methods = set(k[len(prefix):] for cls in self.__class__.__mro__
+                      for k, v in vars(cls).items() if k.startswith(prefix)
+                      and not getattr(v, 'registered', False))
+        return sorted(methods.union(Grammar._registry))
 
     def list_dialects(self, indent='    '):
         return 'Dialects:\n' + ('\n'.join([indent + dialect
                                 for dialect in self.get_dialects()]))
 
-    def _dialect__slice_list(self):
-        self.list_sep = ','
-        self.range_sep = ':'
-        self.step_sep = ':'
-        self.allow_relative_indices = True
-        self.allow_stepped_intervals = True
-        self.allow_reverse_strides = True
-        self.allow_slice_list = True
-        self.interval = {':': 'closed'}
-
-    def _dialect__python_slice(self):
-        self._dialect__slice_list()
-        self.allow_slice_list = False
-
-    def _dialect__dot_notation(self):
-        self._dialect__slice_list()
-        range_sep = Combine(Optional('.') + ':' + Optional('.'))
-        self.range_sep = range_sep ^ '..'
-        self.interval = {':': 'closed', '.:': 'left-open', ':.': 'right-open',
-                         '.:.': 'open', '..': 'open'}
-
-    def _dialect__double_dot(self):
-        self._dialect__slice_list()
-        self.range_sep = Combine('..' + Optional('.'))
-        self.allow_stepped_interval = False
-        self.interval = {'..': 'closed', '...': 'right-open'}
-
-    def _dialect__unix_cut(self):
-        self._dialect__slice_list()
-        self.range_sep = '-'
-        self.allow_relative_indices = False
-        self.allow_stepped_interval = False
-
     def validate_separators(self):
         """
-        Sepaarators can not be alphanumeric when headers are enabled, because
+        Separators can not be alphanumeric when headers are enabled, because
         of potential ambiguity.
         """
         for type_ in ['range', 'step', 'list']:
-            try:
-                sep = getattr(self, type_ + '_sep')
-                if isinstance(sep, str):
-                    self.sep.parseString(getattr(self, type_ + '_sep'))
-                    setattr(self, type_ + '_sep', Literal(sep))
-            except ParseException:
-                mesg = ('{} separator can\'t contain alphanumeric or '
-                        'underscore characters when headers are enabled.')
-                raise ValueError(mesg.format(sep.title()))
+            seps = getattr(self, type_ + '_sep')
+            if not isinstance(seps, (tuple, list)):
+                seps = [seps]
+            for sep in map(_literal, seps):
+                if sep is not None and not _separator.match(sep):
+                    mesg = ('{} separator can\'t contain alphanumeric or '
+                            'underscore characters when headers are enabled.')
+                    raise ValueError(mesg.format(type_.title()))
         return True
 
+    def _range_sep_element(self):
+        ":returns: pyparsing element matching the range separators"
+        pp, sep = _pyparsing(), self.range_sep
+        if isinstance(sep, (tuple, list)):
+            return pp.Or([pp.Literal(i) for i in sep])
+        return pp.Literal(sep) if isinstance(sep, tuple(StringType)) else sep
+
     def _get_slice_item(self):
+        pp = _pyparsing()
         index = endpoint = self.endpoint
-        short_slice = Optional(endpoint) + self.range_sep + Optional(endpoint)
+        short_slice = (pp.Optional(endpoint) + self._range_sep_element()
+                       + pp.Optional(endpoint))
         if not self.allow_stepped_intervals:
-            return Combine(index ^ short_slice)
-        long_slice = short_slice + self.step_sep + Optional(self.stride)
-        return Combine(index ^ short_slice ^ long_slice)
+            return pp.Combine(index ^ short_slice)
+        long_slice = short_slice + self.step_sep + pp.Optional(self.stride)
+        return pp.Combine(index ^ short_slice ^ long_slice)
 
     def _get_slice_list(self):
-        sep = Suppress(self.list_sep)
+        pp = _pyparsing()
+        sep = pp.Suppress(self.list_sep)
         slice_item = self._get_slice_item()
-        return slice_item + ZeroOrMore(sep + slice_item) + Optional(sep)
+        return slice_item + pp.ZeroOrMore(sep + slice_item) + pp.Optional(sep)
 
     def _build_slice_grammar(self):
+        pp = _pyparsing()
         to_int = lambda tok: int(tok[0])
         endpoint = self.endpoint.setResultsName
-        range_sep = self.range_sep.setResultsName('range_sep')
-        lower_bound = Optional(endpoint('start').setParseAction(to_int))
-        upper_bound = Optional(endpoint('stop').setParseAction(to_int))
+        range_sep = self._range_sep_element().setResultsName('range_sep')
+        lower_bound = pp.Optional(endpoint('start').setParseAction(to_int))
+        upper_bound = pp.Optional(endpoint('stop').setParseAction(to_int))
         stride = self.stride.setResultsName('step').setParseAction(to_int)
         short_slice = lower_bound + range_sep + upper_bound
-        long_slice = short_slice + self.step_sep + Optional(stride)
+        long_slice = short_slice + self.step_sep + pp.Optional(stride)
         index = lower_bound
         if self.allow_stepped_intervals:
             return index ^ short_slice ^ long_slice
         return index ^ short_slice
 
     def _build_grammar(self):
+        "build the pyparsing grammars, used as the reference implementation"
+        pp = _pyparsing()
         self.validate_separators()
         self._slice_grammar = self._build_slice_grammar() + pp.stringEnd
         self._text_grammar = (self._get_slice_list() if self.allow_slice_list
                               else self._get_slice_item()) + pp.stringEnd
 
+    def _options(self):
+        ":returns: every setting the compiled parser depends on"
+        return (self._dialect, tuple(range_separators(self)),
+                _literal(self.step_sep), _literal(self.list_sep),
+                self.allow_relative_indices, self.allow_stepped_intervals,
+                self.allow_reverse_strides, self.allow_slice_list)
+
+    def _build_parser(self):
+        "compiled parsers are shared by all grammars with the same options"
+        key = self._options()
+        parser = Grammar._parsers.get(key)
+        if parser is None:
+            self.validate_separators()
+            parser = Grammar._parsers[key] = SliceParser.from_grammar(self)
+        self._parser = parser
+
     def parse_text(self, text):
+        """
+        :param str text: slice string
+        :returns:        dict of interval arguments for each slice
+        :rtype:          iterator
+        :raises:         InvalidSliceString
+        """
         if self._grammar_update:
-            self._build_grammar()
+            self._build_parser()
             self._grammar_update = False
+        return iter(self._parser.parse(text))
+
+    def _parse_text_pyparsing(self, text):
+        """
+        The pyparsing reference implementation of parse_text; it is much
+        slower, & only used to check the fast parser.
+        """
+        self._build_grammar()
         try:
             slices = self._text_grammar.parseString(text)
-        except ParseException as error:
+        except _pyparsing().ParseException as error:
             info = {'text': text, 'column': error.column}
             raise InvalidSliceString(error.msg, info)
         return (dict(self._slice_grammar.parseString(i)) for i in slices)
@@ -191,6 +383,63 @@ class Grammar(object):
         result = (self._get_interval_args(i) for i in self.parse_text(text))
         return result if self.allow_slice_list else next(result)
 
+    def try_parse(self, text):
+        """
+        parse a slice string without raising InvalidSliceString
+        -------------------------------------------------------
+        For validating untrusted slice strings: an invalid one costs no
+        exception, and its error message isn't formatted unless it's used.
+
+        :param str text: slice string
+        :returns:        the interval arguments parse would produce (a list
+                         of dicts, or a dict if slice lists are disabled), or
+                         a ParseError, which is false
+
+        >>> Grammar('python_slice').try_parse('2:4')
+        {'start': 2, 'stop': 4, 'type_': 'closed'}
+        >>> Grammar().try_parse('1:3 5')
+        ParseError('1:3 5', 'Expected string_end', 5)
+        """
+        if self._grammar_update:
+            self._build_parser()
+            self._grammar_update = False
+        return self._try_parse(self._parser._scan, text)
+
+    def _try_parse(self, scan, text):
+        args, error = scan(text)
+        if error is not None:
+            expected, column = error
+            return ParseError(text, column=column, expected=expected)
+        get_args = self._get_interval_args
+        if not self.allow_slice_list:
+            return get_args(args[0])
+        return [get_args(i) for i in args]
+
+    def parse_many(self, texts):
+        """
+        parse a batch of slice strings without stopping at invalid ones
+        ---------------------------------------------------------------
+        Each distinct slice string is only parsed once; duplicates get a copy
+        of its result, so changing one result doesn't change another.
+
+        :param texts: iterable of slice strings
+        :returns:     a result for each slice string, in order, as returned
+                      by try_parse
+        :rtype:       list
+        """
+        if self._grammar_update:
+            self._build_parser()
+            self._grammar_update = False
+        scan, try_parse = self._parser._scan, self._try_parse
+        parsed, results = {}, []
+        for text in texts:
+            try:
+                result = _copy_args(parsed[text])
+            except KeyError:
+                result = parsed[text] = try_parse(scan, text)
+            results.append(result)
+        return results
+
     def _get_interval_args(self, slice_):
         range_sep = slice_.get('range_sep')
         if range_sep:
@@ -200,3 +449,17 @@ class Grammar(object):
             slice_['type_'] = 'closed'
             slice_['stop'] = slice_['start']
         return slice_
+
+
+Grammar.register_dialect('slice_list')
+Grammar.register_dialect('python_slice', allow_slice_list=False)
+Grammar.register_dialect('dot_notation',
+                         range_sep=(':', '.:', ':.', '.:.', '..'),
+                         interval_map={':': 'closed', '.:': 'left-open',
+                                       ':.': 'right-open', '.:.': 'open',
+                                       '..': 'open'})
+Grammar.register_dialect('double_dot', range_sep=('..', '...'),
+                         interval_map={'..': 'closed', '...': 'right-open'})
+Grammar.register_dialect('unix_cut', range_sep='-',
+                         allow_relative_indices=False,
+                         allow_stepped_intervals=True)
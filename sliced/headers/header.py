@@ -14,19 +14,36 @@ where column index is zero-based if origin is 0 or unit-based if origin is 1
 """
 
 import re
-import sys
 from collections import OrderedDict
+from fnmatch import fnmatchcase
 
 import pyparsing as pp
-from pyparsing import (CharsNotIn, Group, Literal, Or, Regex, ParseException,
-    ZeroOrMore)
-from toolz import curry, merge, pipe, valmap
-from unidecode import unidecode
+from pyparsing import CharsNotIn, Empty, Group, Literal, Or, Regex, \
+    ParseException, ZeroOrMore
 
-from .alphaids import id2num, num2id, get_ids, add_alphaids
-from .slugs import Slugs, slugify
+from .alphaids import id2num
+from .slugs import slugify as slugify_
 from ..exceptions import InvalidSliceString
 from ..grammar import Grammar
+from ..parser import range_separators
+
+
+def _tagged(kind):
+    return lambda tok: (kind, tok[0])
+
+
+def _separators(grammar):
+    ":returns: the literal separator strings used by the grammar's dialect"
+    seps = set(range_separators(grammar))
+    for sep in (grammar.list_sep, grammar.step_sep):
+        if isinstance(sep, Literal):
+            sep = sep.match
+        if isinstance(sep, str):
+            seps.add(sep)
+        else:
+            seps.update(grammar.interval)
+    return seps
+
 
 class Headers(object):
     """
@@ -38,15 +55,20 @@ class Headers(object):
         * Contains separator characters (sep chars are defined in dialect).
         * Contains literal ? or * characters and wildcards are enabled.
     * Header names can be single or double quoted.
-    * Escape literal quote characters inside headers names with a backslash.
+    * Header names can also be given as slugs (see slugs.slugify).
+    * Wildcards & regular expions (r'...') expand to a list of every matching
+      column.
     * headers format name: idx
+
+    >>> Headers(['id', 'First Name', 'Email']).names_to_indices('first_name:')
+    '2:'
     """
 
-    def __init__(self, headers=None, slugify=None, origin=1, grammar=None, 
-                 allow_alphaids=False, allow_colnums=True,
+    def __init__(self, headers=None, ignorecase=False, slugify=None, origin=1,
+                 grammar=None, allow_alphaids=False, allow_colnums=True,
                  allow_wildcards=True, allow_regexes=True):
         self.origin = origin
-        self.slugify = slugify if slugify else slugs.slugify
+        self.slugify = slugify if slugify else slugify_
         self.ignorecase = ignorecase
         self.allow_alphaid = allow_alphaids
         self.allow_colnum = allow_colnums
@@ -65,14 +87,24 @@ class Headers(object):
         :param names: list of header names or dict of column indexes: names
         :type names: [str, ...] or [(int, str), ...] or {int: str}, 
         """
-        if items:
-            if isinstance(items[0], str):
-                numbered_items = enumerate(items, self.origin)
-                items = OrderedDict((j, i) for i, j in numbered_items)
-            slugs_ = self.slugify(self.headers.keys())
-            self._headers = dict(zip(slugs_, self.headers.values))
-        elif self.allow_alphaids:
-            self.headers = add_alphaids()
+        items = items or {}
+        if not hasattr(items, 'items'):
+            items = list(items)
+            if items and isinstance(items[0], str):
+                items = enumerate(items, self.origin)
+            items = OrderedDict(items)
+        self._headers = items
+        self._indices = {}
+        for index, name in items.items():
+            self._indices.setdefault(self._key(name), index)
+        names = list(items.values())
+        slugs = self.slugify(names)
+        if len(slugs) == len(names):
+            for slug, index in zip(slugs, items):
+                self._indices.setdefault(self._key(slug), index)
+
+    def _key(self, name):
+        return name.lower() if self.ignorecase else name
 
     @property
     def grammar(self):
@@ -80,29 +112,69 @@ class Headers(object):
 
     @grammar.setter
     def grammar(self, value):
-        seps = list({
-            value.list_sep,
-            value.range_sep,
-            value.step_sep
-        })
-        quotedstr = pp.quotedString.setParseAction(pp.removeQuotes)
-
-        self.tokens = OrderedDict({
-            'regex': Literal('r').suppress() + quotedstr,
-            'quoted': quotedstr,
-            'colnum': Grammar.integer,
-            'sep': Or(seps),
-            'name': CharsNotIn(seps),
-        })
+        self._grammar = value
+        seps = sorted(_separators(value), key=len, reverse=True)
+        quotedstr = pp.quotedString.copy().setParseAction(pp.removeQuotes)
+        self.list_sep = value.list_sep
+        if isinstance(self.list_sep, Literal):
+            self.list_sep = self.list_sep.match
+        self.tokens = OrderedDict([
+            ('regex', Literal('r').suppress() + quotedstr),
+            ('quoted', quotedstr.copy()),
+            ('colnum', Regex(r'-?\d+')),
+            ('sep', Or([Literal(i) for i in seps])),
+            ('name', CharsNotIn(''.join(set(''.join(seps))) + '\'"')),
+        ])
+        self.tokenizer = self.build_parser()
 
     def parse_text(self, text):
         try:
             return self.tokenizer.parseString(text)
-        except ParserException as error:
+        except ParseException as error:
             info = {'text': text, 'column': error.column}
             raise InvalidSliceString(error.msg, info)
 
     def build_parser(self):
-        tokens = (v.setResultsName(k) for k, v in self.tokens.items()
-                  if not k.startswith('_') and getattr(self, k, True))
-        return ZeroOrMore(Group(Or(tokens))) + pp.stringEnd
+        enabled = {'regex': self.allow_regex, 'colnum': self.allow_colnum}
+        location = Empty().setParseAction(lambda text, loc, tok: loc)
+        tokens = (v.addParseAction(_tagged(k)) for k, v in self.tokens.items()
+                  if not k.startswith('_') and enabled.get(k, True))
+        return ZeroOrMore(Group(location + Or(list(tokens)))) + pp.stringEnd
+
+    def _lookup(self, kind, name):
+        ":returns: list of column indices for the name token"
+        if kind == 'regex':
+            regex = re.compile(name, re.I if self.ignorecase else 0)
+            return [k for k, v in self._headers.items() if regex.search(v)]
+        if kind == 'name':
+            name = name.strip()
+            if self.allow_colnum and re.match(r'-?\d+$', name):
+                return [name]
+            if self.allow_wildcard and ('*' in name or '?' in name):
+                return [k for k, v in self._headers.items()
+                        if fnmatchcase(self._key(v), self._key(name))]
+        index = self._indices.get(self._key(name))
+        if index is not None:
+            return [index]
+        if kind == 'name' and self.allow_alphaid and name.isalpha():
+            return [id2num(name) + self.origin]
+        return []
+
+    def names_to_indices(self, text):
+        """
+        translate header names in the slice string into column numbers
+        :raises: InvalidSliceString -- unknown header name
+        """
+        result = []
+        for location, (kind, value) in self.parse_text(text):
+            if kind in ('sep', 'colnum'):
+                result.append(value)
+                continue
+            indices = self._lookup(kind, value)
+            if not indices:
+                # pyparsing locations are 0-based, columns 1-based
+                info = {'text': text, 'column': location + 1}
+                mesg = 'Unknown header name {!r}'.format(value.strip())
+                raise InvalidSliceString(mesg, info)
+            result.append(self.list_sep.join(str(i) for i in indices))
+        return ''.join(result)
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Incremental slice string parsing
+================================
+For interactive editing, where the slice string is parsed again after every
+keystroke: the slice list is split on its list separator & only the slices
+whose text changed since the last parse are parsed again.  The Interval
+objects of unchanged slices are reused, so the cost of an edit doesn't grow
+with the length of the slice list.
+"""
+from .grammar import Grammar
+from .intervals.interval import Interval
+from .parser import SliceParser, _literal, range_separators
+
+# the whitespace allowed around slices
+_space = ' \t\n\r'
+
+
+class IncrementalParser(object):
+    """
+    Parses successive versions of a slice string, reusing unchanged slices
+    ----------------------------------------------------------------------
+    Slices with identical text share one Interval object, as do unchanged
+    slices of successive versions; treat the intervals as read-only.
+
+    :param dialect: Slice string dialect name.
+    :param grammar: Grammar to parse with (overrides dialect)
+
+    Attributes:
+      text (str):       the slice string last parsed
+      intervals (list): an Interval for each of its slices
+      changed (tuple):  positions in intervals of the slices that were parsed
+                        by the last update; the others were reused
+    """
+
+    def __init__(self, dialect=None, grammar=None):
+        self.grammar = grammar or Grammar(dialect)
+        grammar = self.grammar
+        self._list_sep = _literal(grammar.list_sep) \
+            if grammar.allow_slice_list else None
+        seps = range_separators(grammar) + [_literal(grammar.step_sep)]
+        if self._list_sep and any(self._list_sep in i for i in seps):
+            # the list separator can't be split on; every slice is parsed
+            self._list_sep = None
+            self._item_parser = None
+        else:
+            self._item_parser = SliceParser(
+                range_separators(grammar), _literal(grammar.step_sep), None,
+                grammar.allow_relative_indices,
+                grammar.allow_stepped_intervals,
+                grammar.allow_reverse_strides)
+        self.text = None
+        self.intervals = []
+        self.changed = ()
+        self._parsed = {}
+
+    def _parse_item(self, text):
+        ":returns: Interval, or None if the text isn't a valid slice"
+        if self._item_parser is None:
+            return None
+        args, error = self._item_parser._scan(text)
+        if error is not None:
+            return None
+        return Interval(**self.grammar._get_interval_args(args[0]))
+
+    def update(self, text):
+        """
+        parse a new version of the slice string
+        ---------------------------------------
+        :param str text: slice string
+        :returns:        an Interval for each slice
+        :rtype:          list
+        :raises:         InvalidSliceString; invalid text raises the same
+                         error as Grammar.parse_text, & leaves the state of
+                         the last valid version unchanged
+        """
+        if text == self.text:
+            self.changed = ()
+            return self.intervals
+        items = text.split(self._list_sep) if self._list_sep else [text]
+        if len(items) > 1 and not items[-1].strip(_space):
+            # trailing list separator
+            items.pop()
+        previous, parsed = self._parsed, {}
+        intervals, changed = [], []
+        for position, item in enumerate(items):
+            key = item.strip(_space)
+            interval = parsed.get(key, previous.get(key))
+            if interval is None:
+                interval = self._parse_item(item)
+                if interval is None:
+                    return self._full_parse(text)
+                changed.append(position)
+            parsed[key] = interval
+            intervals.append(interval)
+        self._parsed = parsed
+        self.text, self.intervals = text, intervals
+        self.changed = tuple(changed)
+        return intervals
+
+    def _full_parse(self, text):
+        "parse every slice; raises the parser's error for invalid text"
+        args = self.grammar.parse_text(text)
+        intervals = [Interval(**self.grammar._get_interval_args(i))
+                     for i in args]
+        self._parsed = {}
+        self.text, self.intervals = text, intervals
+        self.changed = tuple(range(len(intervals)))
+        return intervals
@@ -1,5 +1,6 @@
 from .endpoint import EndPoint
 from .interval import Interval
+from .intervalset import IntervalSet
 
 
-__all__ = ('Endpoint', 'Interval')
+__all__ = ('EndPoint', 'Interval', 'IntervalSet')
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+Converting many intervals at once
+=================================
+The endpoint arithmetic of Interval._get_new_type, applied to parallel
+columns of starts, stops, steps & types rather than one Interval at a time.
+Unbounded (None) endpoints are tracked with masks, and an endpoint moved
+past either end of the sequence becomes unbounded, as with EndPoint.__add__.
+
+NumPy columns are converted with vectorized arithmetic; NumPy is only
+imported when a column exposes the array interface.  Other columns (lists,
+tuples, array.array) are converted in pure Python.
+"""
+import sys
+
+from .endpoint import check_origin
+
+_ZERO_ENDPOINT = 'Zero endpoint not allowed in unit-based interval.'
+
+
+def _numpy(columns):
+    ":returns: the numpy module if any column is a NumPy array, else None"
+    if not any(hasattr(i, '__array_interface__') for i in columns):
+        return None
+    numpy = sys.modules.get('numpy')
+    if numpy is None:
+        import numpy
+    return numpy
+
+
+def _add(value, offset, origin):
+    ":returns: value + offset, or None as for EndPoint.__add__"
+    if value is None:
+        return None
+    result = value + offset
+    if (value >= 0 and offset < 0 and result < origin
+            or value < 0 and offset > 0 and result >= 0):
+        return None
+    return result
+
+
+def _convert(start, stop, step, old, new, shift, origin):
+    ":returns: (start, stop) of one interval"
+    if shift:
+        if start is not None and start >= 0:
+            start = _add(start, shift, origin)
+        if stop is not None and stop >= 0:
+            stop = _add(stop, shift, origin)
+    direction = -1 if step is not None and step < 0 else 1
+    if (old ^ new) & 2:
+        start = _add(start, ((old >> 1) - (new >> 1)) * direction, origin)
+    if (old ^ new) & 1:
+        stop = _add(stop, ((new & 1) - (old & 1)) * direction, origin)
+    return start, stop
+
+
+def _convert_lists(starts, stops, steps, types, new, from_origin, to_origin):
+    if from_origin and (0 in starts or 0 in stops):
+        raise ValueError(_ZERO_ENDPOINT)
+    shift, length = to_origin - from_origin, len(starts)
+    if steps is None:
+        steps = [None] * length
+    if isinstance(types, int):
+        types = [types] * length
+    results = [_convert(start, stop, step, old, new, shift, to_origin)
+               for start, stop, step, old in zip(starts, stops, steps, types)]
+    return [i[0] for i in results], [i[1] for i in results]
+
+
+def _column(numpy, values):
+    """
+    :returns: (int64 array, mask of the unbounded items)
+    :raises ValueError: the values aren't integers
+    """
+    if isinstance(values, numpy.ma.MaskedArray):
+        data, mask = values.filled(0), numpy.ma.getmaskarray(values)
+    else:
+        data = numpy.asarray(values)
+        mask = numpy.zeros(data.shape, bool)
+        if data.dtype.kind == 'O':
+            mask = numpy.array([i is None for i in values], bool)
+            data = numpy.array([0 if i is None else i for i in values])
+    if data.size and data.dtype.kind not in 'iu':
+        raise ValueError('Endpoints & steps must be integers.')
+    return data.astype(numpy.int64), mask
+
+
+def _add_arrays(numpy, values, mask, offsets, origin):
+    result = values + offsets
+    out = (((values >= 0) & (offsets < 0) & (result < origin))
+           | ((values < 0) & (offsets > 0) & (result >= 0)))
+    return result, mask | out
+
+
+def _convert_arrays(numpy, starts, stops, steps, types, new, from_origin,
+                    to_origin):
+    (starts, start_mask), (stops, stop_mask) = (_column(numpy, starts),
+                                                _column(numpy, stops))
+    if from_origin and (((starts == 0) & ~start_mask).any()
+                        or ((stops == 0) & ~stop_mask).any()):
+        raise ValueError(_ZERO_ENDPOINT)
+    shift = to_origin - from_origin
+    if shift:
+        starts, start_mask = _add_arrays(numpy, starts, start_mask,
+                                         numpy.where(starts >= 0, shift, 0),
+                                         to_origin)
+        stops, stop_mask = _add_arrays(numpy, stops, stop_mask,
+                                       numpy.where(stops >= 0, shift, 0),
+                                       to_origin)
+    direction = 1
+    if steps is not None:
+        steps, step_mask = _column(numpy, steps)
+        direction = numpy.where(step_mask | (steps >= 0), 1, -1)
+    old = numpy.asarray(types, numpy.int64)
+    starts, start_mask = _add_arrays(numpy, starts, start_mask,
+                                     ((old >> 1) - (new >> 1)) * direction,
+                                     to_origin)
+    stops, stop_mask = _add_arrays(numpy, stops, stop_mask,
+                                   ((new & 1) - (old & 1)) * direction,
+                                   to_origin)
+    return (numpy.ma.MaskedArray(starts, start_mask),
+            numpy.ma.MaskedArray(stops, stop_mask))
+
+
+def convert_many(starts, stops, steps, types, new, from_origin, to_origin,
+                 get_type):
+    """
+    see Interval.convert_many
+
+    :param get_type: converts an interval type name or number to 2 bits
+    """
+    from_origin, to_origin = check_origin(from_origin), check_origin(to_origin)
+    if len(starts) != len(stops) or steps is not None and \
+            len(steps) != len(starts):
+        raise ValueError('Columns must have the same length.')
+    if isinstance(types, str) or not hasattr(types, '__len__'):
+        types = get_type(types)
+    elif hasattr(types, '__array_interface__'):
+        numpy = _numpy((types,))
+        types = numpy.asarray(types)
+        if types.dtype.kind not in 'iu':
+            names, inverse = numpy.unique(types, return_inverse=True)
+            types = numpy.array([get_type(i) for i in names],
+                                numpy.int64)[inverse]
+        elif ((types < 0) | (types > 3)).any():
+            raise ValueError('Invalid 2-bit binary number.')
+    else:
+        names = {}
+        types = [names[i] if i in names else names.setdefault(i, get_type(i))
+                 for i in types]
+    if not isinstance(types, int) and len(types) != len(starts):
+        raise ValueError('Columns must have the same length.')
+    new = get_type(new)
+    numpy = _numpy((starts, stops, steps, types))
+    if numpy is not None:
+        return _convert_arrays(numpy, starts, stops, steps, types, new,
+                               from_origin, to_origin)
+    return _convert_lists(starts, stops, steps, types, new, from_origin,
+                          to_origin)
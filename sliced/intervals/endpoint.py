@@ -1,4 +1,32 @@
 # -*- coding: utf-8 -*-
+def check_origin(value):
+    """
+    :returns: the origin as an int
+    :raises ValueError: must a number set to either 0 or 1
+    """
+    try:
+        origin = int(value)
+        if origin not in [0, 1]:
+            raise ValueError()
+    except (ValueError, TypeError):
+        raise ValueError('Origin must be 0 or 1.')
+    return origin
+
+
+def check_value(value, origin):
+    """
+    :returns: the endpoint value as an int, or None (unbound)
+    :raises ValueError: must be a number and != 0 when origin == 1
+    """
+    if value is None:
+        return None
+    number = int(value)
+    if number >= 0 and number < origin:
+        mesg = 'Zero endpoint not allowed in unit-based interval.'
+        raise ValueError(mesg)
+    return number
+
+
 class EndPoint(object):
     """
     An unbounded, zero-based or unit-based interval endpoint
@@ -25,11 +53,20 @@ class EndPoint(object):
       OriginValueError
 
     """
+    __slots__ = ('_origin', '_value')
 
     def __init__(self, value=None, origin=1):
         self.origin = origin
         self.value = value
 
+    @classmethod
+    def _make(cls, value, origin):
+        "an EndPoint from a value & origin that are known to be valid"
+        endpoint = cls.__new__(cls)
+        endpoint._origin = origin
+        endpoint._value = value
+        return endpoint
+
     def __add__(self, operand):
         operand_ = operand.value if hasattr(operand, 'value') else operand
         if self.bound and operand_ is not None:
@@ -38,8 +75,8 @@ class EndPoint(object):
                                  and result < self._origin)
             incr_out_of_range = self.value < 0 and operand_ > 0 and result >= 0
             if not (decr_out_of_range or incr_out_of_range):
-                return EndPoint(result, self._origin)
-        return EndPoint(None, origin=self._origin)
+                return EndPoint._make(result, self._origin)
+        return EndPoint._make(None, self._origin)
 
     def __sub__(self, operand):
         operand_ = operand.value if hasattr(operand, 'value') else operand
@@ -94,12 +131,7 @@ class EndPoint(object):
         """
         :raises ValueError: must a number set to either 0 or 1
         """
-        try:
-            self._origin = int(value)
-            if self._origin not in [0, 1]:
-                raise ValueError()
-        except (ValueError, TypeError):
-                raise ValueError('Origin must be 0 or 1.')
+        self._origin = check_origin(value)
 
     @property
     def value(self):
@@ -110,14 +142,7 @@ class EndPoint(object):
         """
         :raises ValueError: must be a number and != 0 when origin == 1
         """
-        if value_ is None:
-            self._value = None
-        else:
-            number = int(value_)
-            if number >= 0 and number < self.origin:
-                mesg = 'Zero endpoint not allowed in unit-based interval.'
-                raise ValueError(mesg)
-            self._value = number
+        self._value = check_value(value_, self.origin)
 
     @property
     def bound(self):
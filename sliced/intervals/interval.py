@@ -1,13 +1,31 @@
 # -*- coding: utf-8 -*-
 import math
 
-from .endpoint import EndPoint
+from .bulk import _add, convert_many
+from .endpoint import EndPoint, check_origin, check_value
 from ..exceptions import OptionNotFound
 
 
+def _make_slice(start, stop, step, type_, origin):
+    ":returns: slice of the interval, converted to zero-based & right-open"
+    if origin:
+        if start is not None and start >= 0:
+            start = _add(start, -1, 0)
+        if stop is not None and stop >= 0:
+            stop = _add(stop, -1, 0)
+    direction = -1 if step is not None and step < 0 else 1
+    if type_ & Interval.LEFT_OPEN:
+        start = _add(start, direction, 0)
+    if not type_ & Interval.RIGHT_OPEN:
+        stop = _add(stop, direction, 0)
+    return slice(start, stop, step)
+
+
 class Interval(object):
     "http://en.wikipedia.org/wiki/Interval_(mathematics)"
+    __slots__ = ('_start', '_stop', '_stride', '_type', '_origin', '_slice')
     types = ['closed', 'right-open', 'left-open', 'open']
+    CLOSED, RIGHT_OPEN, LEFT_OPEN, OPEN = range(4)
 
     def __init__(self, start=None, stop=None, step=None,
                  type_='closed', origin=1):
@@ -35,13 +53,11 @@ class Interval(object):
             InvalidStepSize
 
         """
+        self._slice = None
         self.type = type_
-        self.origin = int(origin)
+        self.origin = origin
         self.set(start, stop, step)
 
-        for value, type_ in enumerate(self.__class__.types):
-            self.__dict__[type_.replace('-', '_').upper()] = value
-
     def __repr__(self):
         left_brace = '(' if self.left_open else '['
         right_brace = ')' if self.right_open else ']'
@@ -52,19 +68,39 @@ class Interval(object):
 
     @property
     def lower_bound(self):
-        return self._lower_bound.value
+        return self._start
 
     @lower_bound.setter
     def lower_bound(self, value):
-        self._lower_bound = EndPoint(value, self.origin)
+        self._start = check_value(value, self._origin)
+        self._slice = None
 
     @property
     def upper_bound(self):
-        return self._upper_bound.value
+        return self._stop
 
     @upper_bound.setter
     def upper_bound(self, value):
-        self._upper_bound = EndPoint(value, self.origin)
+        self._stop = check_value(value, self._origin)
+        self._slice = None
+
+    @property
+    def stride(self):
+        return self._stride
+
+    @stride.setter
+    def stride(self, value):
+        self._stride = value
+        self._slice = None
+
+    # endpoints are stored as ints; EndPoints are only made when they're used
+    @property
+    def _lower_bound(self):
+        return EndPoint._make(self._start, self._origin)
+
+    @property
+    def _upper_bound(self):
+        return EndPoint._make(self._stop, self._origin)
 
     @property
     def type(self):
@@ -78,6 +114,7 @@ class Interval(object):
             right bit set -> interval is right-open.
         """
         self._type = self._get_type(value)
+        self._slice = None
 
     @property
     def origin(self):
@@ -85,10 +122,8 @@ class Interval(object):
 
     @origin.setter
     def origin(self, value):
-        if hasattr(self, '_lower_bound'):
-            self._lower_bound.origin = value
-            self._upper_bound.origin = value
-        self._origin = value
+        self._origin = check_origin(value)
+        self._slice = None
 
     @property
     def endpoints(self):
@@ -181,7 +216,9 @@ class Interval(object):
                     origin = stop.origin
                 stop = stop.value
             if start is False and stop is False:
-                start, stop = self._lower_bound.value, self._upper_bound.value
+                if origin is False or origin == self._origin:
+                    return self._lower_bound, self._upper_bound
+                start, stop = self._start, self._stop
             elif start is False:
                 start, stop = None, stop
             elif stop is False:
@@ -217,13 +254,14 @@ class Interval(object):
                 stop += (is_new_right_open - is_old_right_open) * direction
             return start, stop
 
-    def _get_type(self, value):
+    @classmethod
+    def _get_type(cls, value):
         if isinstance(value, str):
             interval = value.replace('_', '-').replace(' ', '-')
             try:
-                return self.__class__.types.index(interval)
+                return cls.types.index(interval)
             except (IndexError, TypeError, ValueError) as error:
-                raise OptionNotFound(error, self.__class__.types)
+                raise OptionNotFound(error, cls.types)
         value = int(value)
         if value < 0 or value > 3:
             raise ValueError('Invalid 2-bit binary number.')
@@ -279,8 +317,73 @@ class Interval(object):
                                   from_type, to_origin)
 
     def to_slice(self, start=False, stop=False, step=False, from_type=False):
-        "to Python slice object"
-        if step is False:
-            step = self.stride
-        start, stop = self.to_right_open(start, stop, step, from_type, 0)
-        return slice(start.value, stop.value, step)
+        """
+        to Python slice object
+
+        The slice is computed directly from the endpoint values & the type
+        bits (as to_right_open with to_origin=0 would), and the interval's
+        own slice is kept until the interval is changed.
+        """
+        if start is False and stop is False and step is False \
+                and from_type is False:
+            if self._slice is None:
+                self._slice = _make_slice(self._start, self._stop,
+                                          self._stride, self._type,
+                                          self._origin)
+            return self._slice
+        if isinstance(start, EndPoint) or isinstance(stop, EndPoint):
+            if step is False:
+                step = self.stride
+            start, stop = self.to_right_open(start, stop, step, from_type, 0)
+            return slice(start.value, stop.value, step)
+        if start is False and stop is False:
+            start, stop = self._start, self._stop
+        else:
+            start = None if start is False else start
+            stop = None if stop is False else stop
+            start = check_value(start, self._origin)
+            stop = check_value(stop, self._origin)
+        step = self._stride if step is False else step
+        type_ = self._type if from_type is False else self._get_type(from_type)
+        return _make_slice(start, stop, step, type_, self._origin)
+
+    @classmethod
+    def convert_many(cls, starts, stops, steps=None, types='closed',
+                     from_origin=1, to_origin=0, to_type='right-open'):
+        """
+        convert the endpoints of many intervals at once
+        -----------------------------------------------
+        Each interval is converted as to_right_open, to_closed (etc.) would
+        convert it, but the columns are converted together; NumPy columns
+        with vectorized arithmetic.  By default the endpoints are converted
+        as for to_slice.
+
+        :param starts:      lower bounds: a sequence with None for unbounded
+                            endpoints, an array.array, or a NumPy array
+                            (masked where unbounded)
+        :param stops:       upper bounds, as starts
+        :param steps:       strides, as starts; None if every stride is 1
+        :param types:       type of every interval, or a column of types
+                            (names or 2-bit numbers)
+        :param from_origin: origin of starts & stops
+        :param to_origin:   origin to convert to
+        :param to_type:     interval type to convert to
+        :returns:           (starts, stops): NumPy masked arrays if any column
+                            is a NumPy array, otherwise lists with None for
+                            unbounded endpoints
+        :raises ValueError: zero endpoint in unit-based interval
+
+        >>> Interval.convert_many([1, 3, None], [2, -1, 5],
+        ...                       types=['closed', 'open', 'right-open'])
+        ([0, 3, None], [2, -1, 4])
+        """
+        return convert_many(starts, stops, steps, types, to_type,
+                            from_origin, to_origin, cls._get_type)
+
+    def to_range(self, length):
+        """
+        to Python range object of the zero-based indices selected in a
+        sequence of the given length; ranges are lazy, so stepped intervals
+        over very long sequences cost no more than short ones
+        """
+        return range(*self.to_slice().indices(length))
@@ -0,0 +1,422 @@
+# -*- coding: utf-8 -*-
+"""
+Sets of column indices
+======================
+An IntervalSet is a set of zero-based column indices stored as a sorted list
+of disjoint runs (arithmetic progressions), so the specs of wide or unbounded
+column ranges combine without the indices ever being listed:
+
+    >>> cols = IntervalSet.from_spec('2:20') - IntervalSet.from_spec('5:9')
+    >>> cols.to_spec()
+    '2:4, 10:20'
+    >>> 12 in cols, 5 in cols
+    (True, False)
+
+Union, intersection & difference sweep over the boundaries of the runs of
+both sets, so n runs take O(n log n) time to sort, plus the cost of combining
+the k runs that overlap between each pair of boundaries, at least O(k):
+
+- intersections are solved directly, one progression per pair of runs.
+- unions & differences of runs with the same stride, or strides that divide
+  one another, produce a few runs.
+- otherwise the indices of one period (the lcm of the strides) are listed,
+  about lcm / stride per run, & the result can have as many runs; large
+  co-prime strides raise ValueError rather than listing more than
+  SEGMENT_LIMIT indices.
+
+Membership is tested by bisection.
+"""
+from bisect import bisect_right
+from heapq import merge
+from itertools import count
+from operator import itemgetter
+
+try:
+    from math import gcd
+except ImportError:
+    from fractions import gcd
+
+
+#: most indices listed to combine the runs between two run boundaries
+SEGMENT_LIMIT = 2 ** 20
+
+
+def _lcm(numbers):
+    result = 1
+    for number in numbers:
+        result = result * number // gcd(result, number)
+    return result
+
+
+def _run(slice_, width):
+    """
+    :returns: (start, last, step) run of the indices selected by slice_, with
+              a positive step & last=None if unbounded; None if it's empty
+    """
+    if width is not None:
+        indices = range(*slice_.indices(width))
+        if not indices:
+            return None
+        if indices.step < 0:
+            indices = indices[::-1]
+        start, last, step = indices[0], indices[-1], indices.step
+    else:
+        start, stop, step = slice_.start or 0, slice_.stop, slice_.step or 1
+        if start < 0 or step < 0 or (stop is not None and stop < 0):
+            raise ValueError('A width is required for relative indices & '
+                             'reverse strides.')
+        if stop is None:
+            return start, None, step
+        if stop <= start:
+            return None
+        last = start + (stop - 1 - start) // step * step
+    return (start, last, 1) if start == last else (start, last, step)
+
+
+def _contains(run, index):
+    start, last, step = run
+    return (start <= index and (last is None or index <= last)
+            and (index - start) % step == 0)
+
+
+def _union(first, second):
+    return first or second
+
+
+def _intersection(first, second):
+    return first and second
+
+
+def _difference(first, second):
+    return first and not second
+
+
+def _first(first, second):
+    return first
+
+
+def _divisors(number, factors):
+    ":returns: sorted divisors of number, given numbers whose lcm it is"
+    primes = set()
+    for factor in factors:
+        prime = 2
+        while prime * prime <= factor:
+            if factor % prime == 0:
+                primes.add(prime)
+                factor //= prime
+            else:
+                prime += 1
+        if factor > 1:
+            primes.add(factor)
+    divisors = [1]
+    for prime in primes:
+        power, powers = prime, []
+        while number % power == 0:
+            powers.append(power)
+            power *= prime
+        divisors += [i * j for i in divisors for j in powers]
+    return sorted(divisors)
+
+
+def _last(start, high, step):
+    ":returns: last index of the run from start in [start, high)"
+    return None if high is None else start + (high - 1 - start) // step * step
+
+
+def _intersect(low, high, first, second):
+    """
+    :returns: runs of the indices in [low, high) in both a run of first & a
+              run of second; each pair of runs meets in one progression
+              (Chinese remainder theorem), so no indices are enumerated
+    """
+    runs = []
+    for start, _, step in first:
+        for other, _, other_step in second:
+            divisor = gcd(step, other_step)
+            if (other - start) % divisor:
+                continue
+            period = step // divisor * other_step
+            # solve start + step * k == other (mod other_step)
+            modulus = other_step // divisor
+            k = (other - start) // divisor * _inverse(step // divisor,
+                                                      modulus) % modulus
+            first_index = low + (start + step * k - low) % period
+            if high is not None and first_index >= high:
+                continue
+            last = _last(first_index, high, period)
+            runs.append((first_index, last, 1 if first_index == last
+                         else period))
+    return runs
+
+
+def _inverse(number, modulus):
+    ":returns: the inverse of number modulo modulus (they're co-prime)"
+    result, other, previous = 0, modulus, 1
+    while number:
+        quotient = other // number
+        other, number = number, other - quotient * number
+        result, previous = previous, result - quotient * previous
+    return result % modulus if modulus > 1 else 0
+
+
+def _residues(runs):
+    ":returns: {step: set of start % step} of runs covering a whole segment"
+    residues = {}
+    for start, _, step in runs:
+        residues.setdefault(step, set()).add(start % step)
+    return list(residues.items())
+
+
+def _check_size(runs, period, span):
+    ":raises ValueError: combining runs over span would list too many indices"
+    size = sum(span // i[2] + 1 for i in runs)
+    if size > SEGMENT_LIMIT:
+        raise ValueError('Combining strides with an lcm of {} would list {} '
+                         'indices (SEGMENT_LIMIT is {}).'.format(
+                             period, size, SEGMENT_LIMIT))
+
+
+def _segment(low, high, first, second, keep):
+    """
+    :param first:  runs of the first set covering all of [low, high)
+    :param second: runs of the second set covering all of [low, high)
+    :returns:      runs of the indices in [low, high) where keep(in first,
+                   in second) is true (high=None is unbounded)
+    :raises ValueError: the indices of one period exceed SEGMENT_LIMIT
+    """
+    if keep is _intersection:
+        return _intersect(low, high, first, second)
+    active = first + second
+    if len(active) == 1:
+        if not keep(bool(first), bool(second)):
+            return []
+        step = active[0][2]
+        start = low + (active[0][0] - low) % step
+        if high is not None and start >= high:
+            return []
+        last = _last(start, high, step)
+        return [(start, last, 1 if start == last else step)]
+    period = _lcm(i[2] for i in active)
+    span = period if high is None else min(period, high - low)
+    _check_size(active, period, span)
+    # every index kept is in one of the runs
+    candidates = merge(*[range(low + (i[0] - low) % i[2], low + span, i[2])
+                         for i in active])
+    residues = _residues(first), _residues(second)
+    offsets, previous = [], None
+    for index in candidates:
+        if index != previous and keep(
+                any(index % i in j for i, j in residues[0]),
+                any(index % i in j for i, j in residues[1])):
+            offsets.append(index - low)
+        previous = index
+    if high is not None and high - low <= period:
+        return [(low + i, low + i, 1) for i in offsets]
+    # the indices kept repeat every period; find the shortest repeat
+    kept = set(offsets)
+    for step in _divisors(period, (i[2] for i in active)):
+        if all((i + step) % period in kept for i in offsets):
+            break
+    runs = []
+    for offset in offsets:
+        if offset >= step:
+            break
+        start = low + offset
+        runs.append((start, _last(start, high, step), step))
+    return runs
+
+
+def _normalize(runs):
+    ":returns: runs sorted by start, with consecutive progressions joined"
+    result = []
+    for run in sorted(runs, key=itemgetter(0)):
+        if result:
+            start, last, step = result[-1]
+            if last is not None and run[0] > last:
+                gap = run[0] - last
+                if ((start == last or step == gap)
+                        and (run[0] == run[1] or run[2] == gap)):
+                    result[-1] = (start, run[1], gap)
+                    continue
+        result.append(run)
+    return result
+
+
+def _combine(first, second, keep):
+    """
+    :returns: runs of the indices where keep(in first, in second) is true
+    :raises ValueError: see _segment
+    """
+    events, unbounded = [], []
+    for which, runs in enumerate((first, second)):
+        for run in runs:
+            events.append((run[0], 1, which, run))
+            if run[1] is not None:
+                events.append((run[1] + 1, 0, which, run))
+            else:
+                unbounded.append(run)
+    # the unbounded runs are all in the last segment; check it before sweeping
+    if keep is not _intersection and len(unbounded) > 1:
+        period = _lcm(i[2] for i in unbounded)
+        _check_size(unbounded, period, period)
+    events.sort(key=itemgetter(0, 1))
+    # active runs keyed by run, with a count of duplicates
+    active, runs, i = ({}, {}), [], 0
+    while i < len(events):
+        low = events[i][0]
+        while i < len(events) and events[i][0] == low:
+            _, add, which, run = events[i]
+            if add:
+                active[which][run] = active[which].get(run, 0) + 1
+            elif active[which][run] == 1:
+                del active[which][run]
+            else:
+                active[which][run] -= 1
+            i += 1
+        high = events[i][0] if i < len(events) else None
+        if active[0] or active[1]:
+            runs.extend(_segment(low, high, list(active[0]),
+                                 list(active[1]), keep))
+    return _normalize(runs)
+
+
+class IntervalSet(object):
+    """
+    A set of zero-based column indices
+    ----------------------------------
+    Relative indices & reverse strides are resolved with the width of the
+    rows; without a width, slices must be absolute, though their stop may be
+    unbounded (the set then runs to the end of every row).  Sets are
+    immutable.
+
+    :param slices: Python slices selecting the indices
+    :param int width: number of items in each row, when known
+
+    >>> IntervalSet([slice(0, 10, 2)]) & IntervalSet([slice(0, 10, 3)])
+    IntervalSet([slice(0, 7, 6)])
+    """
+    __slots__ = ('_runs', '_starts', '_reach')
+
+    def __init__(self, slices=(), width=None):
+        runs = (_run(i, width) for i in slices)
+        self._set_runs(_combine([i for i in runs if i], [], _first))
+
+    @classmethod
+    def from_spec(cls, slicestr, dialect=None, headers=None, ignorecase=False,
+                  width=None):
+        """
+        :returns: IntervalSet of the columns a slice string selects; see
+                  compile_plan for the arguments
+        :raises:  InvalidSliceString
+        """
+        # core imports the intervals package
+        from ..core import compile_plan
+        plan = compile_plan(slicestr, dialect, headers, ignorecase)
+        return cls(plan.slices, width)
+
+    @classmethod
+    def _from_runs(cls, runs):
+        result = cls.__new__(cls)
+        result._set_runs(runs)
+        return result
+
+    def _set_runs(self, runs):
+        self._runs = tuple(runs)
+        self._starts = [i[0] for i in runs]
+        # the highest index covered by each run & those before it
+        self._reach, reach = [], -1
+        for run in runs:
+            reach = float('inf') if run[1] is None else max(reach, run[1])
+            self._reach.append(reach)
+
+    @property
+    def runs(self):
+        ":returns: (start, stop, step) of each run; stop is None if unbounded"
+        return tuple((start, None if last is None else last + 1, step)
+                     for start, last, step in self._runs)
+
+    @property
+    def bounded(self):
+        return all(i[1] is not None for i in self._runs)
+
+    def union(self, other):
+        return self._from_runs(_combine(self._runs, other._runs, _union))
+
+    def intersection(self, other):
+        return self._from_runs(_combine(self._runs, other._runs,
+                                        _intersection))
+
+    def difference(self, other):
+        return self._from_runs(_combine(self._runs, other._runs, _difference))
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def __contains__(self, index):
+        i = bisect_right(self._starts, index) - 1
+        while i >= 0 and self._reach[i] >= index:
+            if _contains(self._runs[i], index):
+                return True
+            i -= 1
+        return False
+
+    def __iter__(self):
+        ":returns: the indices in ascending order"
+        return merge(*[range(start, last + 1, step) if last is not None
+                       else count(start, step)
+                       for start, last, step in self._runs])
+
+    def __len__(self):
+        if not self.bounded:
+            raise ValueError('An unbounded IntervalSet has no length.')
+        return sum((last - start) // step + 1
+                   for start, last, step in self._runs)
+
+    def __bool__(self):
+        return bool(self._runs)
+
+    __nonzero__ = __bool__
+
+    def __eq__(self, obj):
+        if not isinstance(obj, IntervalSet):
+            return NotImplemented
+        return self._runs == obj._runs
+
+    def __ne__(self, obj):
+        result = self.__eq__(obj)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self):
+        return hash(self._runs)
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.to_slices())
+
+    def to_slices(self):
+        """
+        :returns: the fewest Python slices selecting the set's indices, in
+                  ascending order of their first index; runs with different
+                  strides may interleave, so the items they select aren't
+                  always in ascending order
+        """
+        return [slice(start, None if last is None else last + 1,
+                      None if step == 1 else step)
+                for start, last, step in self._runs]
+
+    def to_spec(self):
+        """
+        :returns: slice string in the default (slice_list) dialect, for use
+                  by slices & compile_plan
+        :raises ValueError: an empty set can't be written as a slice string
+        """
+        if not self._runs:
+            raise ValueError('An empty IntervalSet has no slice string.')
+        items = []
+        for start, last, step in self._runs:
+            if start == last:
+                items.append(str(start + 1))
+                continue
+            item = '{}:{}'.format(start + 1, '' if last is None else last + 1)
+            items.append(item if step == 1 else '{}:{}'.format(item, step))
+        return ', '.join(items)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+Interval tree
+=============
+A static (centered) interval tree: built once, it finds the intervals that
+contain a point in O(log n + m) time, for n intervals & m matches.
+"""
+from operator import itemgetter
+
+_low, _high = itemgetter(0), itemgetter(1)
+
+
+def _build(intervals):
+    if not intervals:
+        return None
+    points = sorted(i[0] for i in intervals)
+    center = points[len(points) // 2]
+    here, left, right = [], [], []
+    for interval in intervals:
+        if interval[1] < center:
+            left.append(interval)
+        elif interval[0] > center:
+            right.append(interval)
+        else:
+            here.append(interval)
+    return (center, sorted(here, key=_low),
+            sorted(here, key=_high, reverse=True),
+            _build(left), _build(right))
+
+
+class IntervalTree(object):
+    """
+    Finds the intervals containing a point
+    --------------------------------------
+    :param intervals: iterable of (low, high, value) tuples; each interval is
+                      closed, [low, high]
+
+    >>> tree = IntervalTree([(0, 4, 'a'), (3, 9, 'b'), (7, 7, 'c')])
+    >>> sorted(tree.stab(3)), tree.stab(7), tree.stab(10)
+    (['a', 'b'], ['b', 'c'], [])
+    """
+    __slots__ = ('_root', '_size')
+
+    def __init__(self, intervals):
+        intervals = list(intervals)
+        self._root = _build(intervals)
+        self._size = len(intervals)
+
+    def __len__(self):
+        return self._size
+
+    def stab(self, point):
+        ":returns: list of the values of the intervals containing point"
+        result, node = [], self._root
+        while node is not None:
+            center, by_low, by_high, left, right = node
+            if point < center:
+                for low, _, value in by_low:
+                    if low > point:
+                        break
+                    result.append(value)
+                node = left
+            elif point > center:
+                for _, high, value in by_high:
+                    if high < point:
+                        break
+                    result.append(value)
+                node = right
+            else:
+                result.extend(i[2] for i in by_low)
+                break
+        return result
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+Slicing delimited files
+=======================
+Streams rows from CSV/TSV files through a compiled slice plan, so memory use
+is bounded by the read buffer rather than the size of the file.
+
+Files without quoting can instead be memory-mapped & sliced as raw bytes
+(see cut_mmap), which avoids the csv module & decoding altogether.
+"""
+import csv
+import mmap
+from contextlib import contextmanager
+from itertools import count
+from operator import itemgetter
+
+from .core import _normalize, compile_plan
+
+#: read & write buffer size in bytes
+BUFFER_SIZE = 1 << 20
+
+#: bytes of memory-mapped file processed at a time by cut_mmap
+CHUNK_SIZE = 1 << 22
+
+
+@contextmanager
+def _opened(path_or_fileobj, mode, encoding, buffer_size):
+    "open paths, but leave file objects for the caller to close"
+    if hasattr(path_or_fileobj, 'read') or hasattr(path_or_fileobj, 'write'):
+        yield path_or_fileobj
+    elif 'b' in mode:
+        with open(path_or_fileobj, mode, buffering=buffer_size) as fileobj:
+            yield fileobj
+    else:
+        with open(path_or_fileobj, mode, buffering=buffer_size,
+                  encoding=encoding, newline='') as fileobj:
+            yield fileobj
+
+
+@contextmanager
+def _mapped(path_or_fileobj):
+    "memory-map a path or binary file object; empty files map to b''"
+    with _opened(path_or_fileobj, 'rb', None, BUFFER_SIZE) as fileobj:
+        try:
+            mapped = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            yield b''
+            return
+        try:
+            yield mapped
+        finally:
+            mapped.close()
+
+
+def _read_header(reader, spec, dialect, header, ignorecase):
+    ":returns: the compiled plan & the header row (or None)"
+    headers = next(reader, None) if header else None
+    plan = compile_plan(_normalize(spec), dialect, headers, ignorecase)
+    return plan, headers
+
+
+def iter_cut_file(path_or_fileobj, spec, delimiter='\t', dialect='unix_cut',
+                  header=False, ignorecase=False, encoding='utf-8',
+                  buffer_size=BUFFER_SIZE, **fmtparams):
+    """
+    lazily extract columns from the rows of a delimited file
+    --------------------------------------------------------
+    Parameters are the same as cut_file.
+
+    :returns: sliced rows, starting with the header row if header is set
+    :rtype:   generator
+    """
+    with _opened(path_or_fileobj, 'r', encoding, buffer_size) as infile:
+        reader = csv.reader(infile, delimiter=delimiter, **fmtparams)
+        plan, headers = _read_header(reader, spec, dialect, header,
+                                     ignorecase)
+        if headers is not None:
+            yield plan(headers)
+        for row in plan.apply(reader):
+            yield row
+
+
+def cut_file(path_or_fileobj, spec, delimiter='\t', dialect='unix_cut',
+             header=False, ignorecase=False, out=None, encoding='utf-8',
+             buffer_size=BUFFER_SIZE, **fmtparams):
+    """
+    extract columns from the rows of a delimited file
+    -------------------------------------------------
+    The file is read through a large buffer & rows are sliced as they are
+    read, so files of any size can be processed in bounded memory.
+
+    :param path_or_fileobj: path or text file object to read
+    :param str spec:        Slice string specified in the selected dialect.
+    :param str delimiter:   field delimiter (default tab, like cut)
+    :param dialect:         Slice string dialect name (default 'unix_cut')
+    :type dialect:          str or None
+    :param bool header:     the first row holds header names, which can then
+                            be used in spec; it is sliced like any other row.
+    :param ignorecase:      Indicates whether header names are case sensitive
+    :param out:             path or text file object for the sliced rows; if
+                            None the sliced rows are produced instead.
+    :param str encoding:    encoding used when opening paths
+    :param int buffer_size: read & write buffer size in bytes
+    :param fmtparams:       other csv module formatting parameters
+    :returns:               number of rows written, or the sliced rows when
+                            out is None
+    :rtype:                 int or generator
+    :raises:                InvalidSliceString
+    """
+    if out is None:
+        return iter_cut_file(path_or_fileobj, spec, delimiter, dialect, header,
+                             ignorecase, encoding, buffer_size, **fmtparams)
+    with _opened(path_or_fileobj, 'r', encoding, buffer_size) as infile:
+        reader = csv.reader(infile, delimiter=delimiter, **fmtparams)
+        plan, headers = _read_header(reader, spec, dialect, header,
+                                     ignorecase)
+        fmtparams.setdefault('lineterminator', '\n')
+        with _opened(out, 'w', encoding, buffer_size) as outfile:
+            writer = csv.writer(outfile, delimiter=delimiter, **fmtparams)
+            if headers is not None:
+                writer.writerow(plan(headers))
+            # zip stops at the end of the rows without advancing counter,
+            # so its next value is the number of rows written
+            counter = count(headers is not None)
+            writer.writerows(map(itemgetter(0),
+                                 zip(plan.apply(reader), counter)))
+    return next(counter)
+
+
+def _max_fields(plan):
+    """
+    :returns: number of leading fields the plan selects from, or -1 when it
+              depends on the line (relative or unbounded endpoints)
+    """
+    slices = plan._runs if plan.slice_list else plan.slices
+    stops = []
+    for i in slices:
+        if (i.step or 1) < 0 or i.stop is None or i.stop < 0 or (
+                i.start is not None and i.start < 0):
+            return -1
+        stops.append(i.stop)
+    return max(stops)
+
+
+def _line_chunks(mapped, start, chunk_size):
+    "split mapped bytes into chunks ending on a line boundary"
+    size = len(mapped)
+    while start < size:
+        end = start + chunk_size
+        if end < size:
+            end = mapped.rfind(b'\n', start, end) + 1
+            if end <= start:
+                # a single line is longer than chunk_size
+                end = mapped.find(b'\n', start + chunk_size) + 1 or size
+        yield mapped[start:end]
+        start = end
+
+
+def _cut_chunks(mapped, spec, delimiter, dialect, header, ignorecase,
+                chunk_size):
+    ":yields: lists of sliced rows, each row being a list of bytes fields"
+    start, headers = 0, None
+    if header and len(mapped):
+        start = mapped.find(b'\n') + 1 or len(mapped)
+        line = mapped[:start].rstrip(b'\n')
+        headers = [i.decode('utf-8') for i in line.split(delimiter)]
+    plan = compile_plan(_normalize(spec), dialect, headers, ignorecase)
+    maxsplit = _max_fields(plan)
+    if maxsplit >= 0:
+        # lines with at least maxsplit fields split into maxsplit + 1 items
+        plan = plan.specialize(maxsplit + 1)
+    if headers is not None:
+        yield [plan(line.split(delimiter, maxsplit))]
+    for chunk in _line_chunks(mapped, start, chunk_size):
+        lines = chunk.split(b'\n')
+        if not lines[-1]:
+            lines.pop()
+        yield list(plan.apply([i.split(delimiter, maxsplit) for i in lines]))
+
+
+def iter_cut_mmap(path_or_fileobj, spec, delimiter=b'\t', dialect='unix_cut',
+                  header=False, ignorecase=False, chunk_size=CHUNK_SIZE):
+    """
+    lazily extract fields from the lines of a memory-mapped file
+    ------------------------------------------------------------
+    Parameters are the same as cut_mmap.
+
+    :returns: sliced rows as lists of bytes fields
+    :rtype:   generator
+    """
+    with _mapped(path_or_fileobj) as mapped:
+        for rows in _cut_chunks(mapped, spec, delimiter, dialect, header,
+                                ignorecase, chunk_size):
+            for row in rows:
+                yield row
+
+
+def cut_mmap(path_or_fileobj, spec, delimiter=b'\t', dialect='unix_cut',
+             header=False, ignorecase=False, out=None, chunk_size=CHUNK_SIZE):
+    """
+    extract fields from the lines of a file without decoding it
+    -----------------------------------------------------------
+    The file is memory-mapped & processed a chunk of lines at a time; fields
+    are located on the raw bytes and only the selected fields are copied to
+    the output.  Nothing is decoded (apart from the header row, when used),
+    so this only suits files where the delimiter is never quoted or escaped,
+    i.e. what Unix cut handles.  Lines are separated by b'\\n'.
+
+    :param path_or_fileobj: path or binary file object (with a fileno)
+    :param bytes delimiter: field delimiter (default tab, like cut)
+    :param dialect:         Slice string dialect name (default 'unix_cut')
+    :param bool header:     the first line holds UTF-8 header names, which can
+                            then be used in spec
+    :param ignorecase:      Indicates whether header names are case sensitive
+    :param out:             path or binary file object for the sliced lines;
+                            if None the sliced rows are produced instead.
+    :param int chunk_size:  approximate number of bytes sliced at a time
+    :returns:               number of lines written, or the sliced rows (lists
+                            of bytes) when out is None
+    :rtype:                 int or generator
+    :raises:                InvalidSliceString
+    """
+    if out is None:
+        return iter_cut_mmap(path_or_fileobj, spec, delimiter, dialect,
+                             header, ignorecase, chunk_size)
+    count_ = 0
+    join = delimiter.join
+    with _mapped(path_or_fileobj) as mapped:
+        with _opened(out, 'wb', None, BUFFER_SIZE) as outfile:
+            for rows in _cut_chunks(mapped, spec, delimiter, dialect, header,
+                                    ignorecase, chunk_size):
+                if rows:
+                    outfile.write(b'\n'.join(map(join, rows)) + b'\n')
+                    count_ += len(rows)
+    return count_
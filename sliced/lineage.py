@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Column lineage
+==============
+Maps between the source columns of a row & the output positions of a
+compiled slice plan, e.g. to record which slice list item produced each
+output column.  The slices are resolved for one row width & indexed in an
+interval tree once, so each query takes O(log n + m) time for a plan of n
+slices, rather than a scan of every slice.
+"""
+from bisect import bisect_right
+
+from .intervals.tree import IntervalTree
+
+
+class Lineage(object):
+    """
+    Source columns & output positions of a slice plan
+    -------------------------------------------------
+    Columns & positions are zero-based; items are positions in the plan's
+    slice list.
+
+    :param plan:      SlicePlan, or a list of Python slices
+    :param int width: number of items in each source row
+
+    >>> from sliced import compile_plan
+    >>> lineage = Lineage(compile_plan('2:4, -1, 3'), width=6)
+    >>> lineage.items(2), lineage.outputs(2)
+    ([0, 2], [1, 4])
+    >>> lineage.source(3)
+    (5, 1)
+    """
+    __slots__ = ('width', '_ranges', '_offsets', '_tree')
+
+    def __init__(self, plan, width):
+        self.width = width
+        slices = getattr(plan, 'slices', plan)
+        self._ranges = [range(*i.indices(width)) for i in slices]
+        # output position of the first column of each slice
+        self._offsets, offset = [], 0
+        for indices in self._ranges:
+            self._offsets.append(offset)
+            offset += len(indices)
+        self._tree = IntervalTree(
+            (min(i[0], i[-1]), max(i[0], i[-1]), n)
+            for n, i in enumerate(self._ranges) if i)
+
+    def __len__(self):
+        ":returns: number of output columns"
+        if not self._ranges:
+            return 0
+        return self._offsets[-1] + len(self._ranges[-1])
+
+    def items(self, column):
+        ":returns: sorted list of the slice list items that select column"
+        ranges = self._ranges
+        return sorted(i for i in self._tree.stab(column)
+                      if column in ranges[i])
+
+    def outputs(self, column):
+        ":returns: sorted list of the output positions taken from column"
+        ranges, offsets = self._ranges, self._offsets
+        return sorted(offsets[i] + ranges[i].index(column)
+                      for i in self._tree.stab(column) if column in ranges[i])
+
+    def source(self, position):
+        """
+        :returns: (source column, slice list item) of an output position
+        :raises IndexError: position out of range
+        """
+        if not 0 <= position < len(self):
+            raise IndexError('Output position out of range.')
+        # the last of any slices with the same offset isn't empty
+        item = bisect_right(self._offsets, position) - 1
+        return self._ranges[item][position - self._offsets[item]], item
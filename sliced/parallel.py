@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+Slicing rows with multiple processes
+====================================
+The slice string is compiled once, in the parent process; the compiled plan
+is then sent to each worker process when it starts (not with every chunk of
+rows).  Rows are sent to the workers in chunks (files are split into byte
+ranges of at most about chunk_bytes), with a limit on the number of chunks
+in flight, so memory stays bounded however long the input is.
+"""
+import csv
+import io
+import multiprocessing
+import os
+from collections import deque
+from itertools import islice
+
+try:
+    from queue import Queue
+except ImportError:
+    from Queue import Queue
+
+from .io import CHUNK_SIZE
+from .slicer import Slicer
+
+# the compiled plan, set once per worker process by _init_worker
+_plan = None
+
+
+def _init_worker(plan):
+    global _plan
+    _plan = plan
+
+
+def _slice_chunk(rows):
+    return list(_plan.apply(rows))
+
+
+def _slice_file_range(path, start, stop, encoding, fmtparams):
+    with open(path, 'rb') as fileobj:
+        fileobj.seek(start)
+        text = fileobj.read(stop - start).decode(encoding)
+    reader = csv.reader(io.StringIO(text, newline=''), **fmtparams)
+    return list(_plan.apply(reader))
+
+
+def _line_offsets(path, start, step):
+    ":returns: offsets about `step` bytes apart, each at the start of a line"
+    size = os.path.getsize(path)
+    offsets = [start]
+    with open(path, 'rb') as fileobj:
+        for offset in range(start + step, size, step):
+            if offset <= offsets[-1]:
+                continue
+            fileobj.seek(offset)
+            fileobj.readline()
+            if fileobj.tell() >= size:
+                break
+            offsets.append(fileobj.tell())
+    offsets.append(size)
+    return offsets
+
+
+class ParallelSlicer(Slicer):
+    """
+    A Slicer that spreads the rows over a pool of worker processes
+    --------------------------------------------------------------
+    The pool is started on first use; close it with close(), or use the
+    ParallelSlicer as a context manager.
+
+    :param str spec:        Slice string specified in the selected dialect.
+    :param dialect:         Slice string dialect name.
+    :param headers:         header names and optional index positions
+    :param ignorecase:      Indicates whether header names are case sensitive
+    :param int workers:     number of worker processes (default: CPU count)
+    :param int chunk_size:  number of rows sent to a worker at a time
+    :param int chunk_bytes: most bytes of a file read by a worker at a time,
+                            give or take a line (see cut_file)
+    :param int max_pending: maximum number of chunks in flight; reading the
+                            input pauses until results are consumed
+                            (default: 2 per worker)
+    :param bool ordered:    produce rows in input order; if False, chunks are
+                            produced as soon as they are done
+    """
+
+    def __init__(self, spec, dialect=None, headers=None, ignorecase=False,
+                 plan=None, workers=None, chunk_size=10000, max_pending=None,
+                 ordered=True, chunk_bytes=CHUNK_SIZE):
+        Slicer.__init__(self, spec, dialect, headers, ignorecase, plan)
+        self.workers = workers or multiprocessing.cpu_count()
+        self.chunk_size = chunk_size
+        self.chunk_bytes = chunk_bytes
+        self.max_pending = max_pending or 2 * self.workers
+        self.ordered = ordered
+        self._pool = None
+
+    def __reduce__(self):
+        # the settings, but not the pool
+        return (self.__class__, (self.spec, self.dialect, self.headers,
+                                 self.ignorecase, self.plan, self.workers,
+                                 self.chunk_size, self.max_pending,
+                                 self.ordered, self.chunk_bytes))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(self.workers, _init_worker,
+                                              (self.plan,))
+        return self._pool
+
+    def close(self):
+        "stop the worker processes"
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def _results(self, tasks, ordered):
+        """
+        submit (function, args) tasks while keeping at most max_pending in
+        flight; yields each task's rows
+        """
+        if ordered is None:
+            ordered = self.ordered
+        pool, pending, done = self.pool, deque(), Queue()
+        submitted = received = 0
+        for func, args in tasks:
+            if ordered:
+                pending.append(pool.apply_async(func, args))
+            else:
+                pool.apply_async(func, args, callback=done.put,
+                                 error_callback=done.put)
+            submitted += 1
+            if submitted - received >= self.max_pending:
+                received += 1
+                for row in self._next_result(pending, done):
+                    yield row
+        while received < submitted:
+            received += 1
+            for row in self._next_result(pending, done):
+                yield row
+
+    @staticmethod
+    def _next_result(pending, done):
+        if pending:
+            return pending.popleft().get()
+        result = done.get()
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    def map(self, rows, ordered=None):
+        """
+        :param rows:         iterable of rows; rows must be picklable
+        :param bool ordered: overrides the ordered attribute
+        :returns:            generator producing the sliced rows
+        """
+        rows = iter(rows)
+        chunks = iter(lambda: list(islice(rows, self.chunk_size)), [])
+        return self._results(((_slice_chunk, (i,)) for i in chunks), ordered)
+
+    def apply_batch(self, rows):
+        ":returns: list of sliced rows"
+        return list(self.map(rows, ordered=True))
+
+    def cut_file(self, path, delimiter='\t', header=False, encoding='utf-8',
+                 ordered=None, **fmtparams):
+        """
+        slice the rows of a delimited file in parallel
+        ----------------------------------------------
+        The file is split into byte ranges on line boundaries & each worker
+        reads its own range, so rows are never sent between processes.  The
+        ranges are at most about chunk_bytes long, & small files are split
+        into 4 ranges per worker.  Line breaks inside quoted fields are not
+        supported.
+
+        :param str path:      path of the file to slice
+        :param str delimiter: field delimiter
+        :param bool header:   slice the first line separately, producing it
+                              first; use headers= to refer to its names.
+        :param str encoding:  file encoding
+        :returns:             generator producing the sliced rows
+        """
+        fmtparams['delimiter'] = delimiter
+        start = 0
+        if header:
+            with open(path, 'rb') as fileobj:
+                line = fileobj.readline()
+                start = fileobj.tell()
+            reader = csv.reader(io.StringIO(line.decode(encoding),
+                                            newline=''), **fmtparams)
+            header = [self(i) for i in reader]
+        size = os.path.getsize(path) - start
+        step = max(min(self.chunk_bytes, size // (self.workers * 4)), 1)
+        offsets = _line_offsets(path, start, step)
+        tasks = ((_slice_file_range, (path, i, j, encoding, fmtparams))
+                 for i, j in zip(offsets, offsets[1:]))
+        return self._file_rows(header, self._results(tasks, ordered))
+
+    @staticmethod
+    def _file_rows(header, rows):
+        for row in header or ():
+            yield row
+        for row in rows:
+            yield row
+
+
+def parallel_slices(spec, plan, rows, workers, **options):
+    """
+    slice rows with a temporary pool of worker processes
+    :returns: generator producing the sliced rows
+    """
+    with ParallelSlicer(spec, plan=plan, workers=workers, **options) as slicer:
+        for row in slicer.map(rows):
+            yield row
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Fast slice string parser
+========================
+Slice strings are parsed with a regular expression generated from a Grammar's
+separators & flags: one scan of the text produces the interval arguments of
+every slice.  It accepts exactly the language of the pyparsing grammar built
+by Grammar._build_grammar, which is kept as the reference implementation, and
+raises InvalidSliceString with the same column information; the one exception
+is a malformed first slice, which is always reported at its first character
+(or after a leading minus sign).
+"""
+import re
+
+from ._compat import StringType
+from .exceptions import InvalidSliceString
+
+# pyparsing's default whitespace characters
+_space = re.compile(r'[ \t\n\r]*')
+
+ENDPOINT = r'0|-?[1-9]\d*'
+UNSIGNED_ENDPOINT = r'0|[1-9]\d*'
+STRIDE = r'-?[1-9]\d*'
+POSITIVE_STRIDE = r'[1-9]\d*'
+
+
+def _literal(sep):
+    ":returns: the text of a separator given as a string or pyparsing Literal"
+    if isinstance(sep, tuple(StringType)):
+        return sep
+    return getattr(sep, 'match', None)
+
+
+def range_separators(grammar):
+    """
+    :returns: every range separator accepted by the grammar; the range_sep
+              attribute is a separator or a tuple of separators.  Separators
+              built from other pyparsing expressions are taken from the
+              interval map.
+    """
+    if isinstance(grammar.range_sep, (tuple, list)):
+        return list(grammar.range_sep)
+    sep = _literal(grammar.range_sep)
+    return [sep] if sep is not None else list(grammar.interval)
+
+
+def _column(text, loc):
+    "1-based column of loc, counted from the start of its line (as pyparsing)"
+    if 0 < loc < len(text) and text[loc - 1] == '\n':
+        return 1
+    return loc - text.rfind('\n', 0, loc)
+
+
+class SliceParser(object):
+    """
+    Parses slice strings into interval arguments
+    --------------------------------------------
+
+    :param range_seps:     range separator strings
+    :param str step_sep:   step separator
+    :param list_sep:       slice list separator, None if lists are disabled
+    :param bool relative:  allow relative (negative) indices
+    :param bool stepped:   allow stepped intervals
+    :param bool reverse:   allow reverse (negative) strides
+    """
+
+    def __init__(self, range_seps, step_sep=':', list_sep=',', relative=True,
+                 stepped=True, reverse=True):
+        self.range_seps = tuple(sorted(range_seps, key=len, reverse=True))
+        self.step_sep = step_sep
+        self.list_sep = list_sep
+        self.relative = relative
+        endpoint = ENDPOINT if relative else UNSIGNED_ENDPOINT
+        # like pyparsing's Optional, a start endpoint that matches is never
+        # given back, even when no range separator follows it; lookaheads
+        # are atomic, so the start is matched in one & consumed by (?P=start)
+        slice_ = (r'(?=(?P<start>(?:{0})?))(?P=start)(?P<range_sep>{1})'
+                  r'(?P<stop>{0})?').format(
+            endpoint, '|'.join(re.escape(i) for i in self.range_seps))
+        if stepped:
+            slice_ += r'(?:{}(?P<step>{})?)?'.format(
+                re.escape(step_sep), STRIDE if reverse else POSITIVE_STRIDE)
+        # the longest alternative wins, as with pyparsing's Or (^)
+        self._item = re.compile(r'{}|(?P<index>{})'.format(slice_, endpoint))
+        self._groups = ('index', 'start', 'range_sep', 'stop') + (
+            ('step',) if stepped else ())
+
+    @classmethod
+    def from_grammar(cls, grammar):
+        list_sep = _literal(grammar.list_sep) if grammar.allow_slice_list \
+            else None
+        return cls(range_separators(grammar), _literal(grammar.step_sep),
+                   list_sep, grammar.allow_relative_indices,
+                   grammar.allow_stepped_intervals,
+                   grammar.allow_reverse_strides)
+
+    def _item_error(self, text, loc):
+        ":returns: (expected, column) if the first slice doesn't match at loc"
+        if self.relative and text.startswith('-', loc):
+            return ('a non-zero digit',), _column(text, loc + 1)
+        return ('a slice',), _column(text, loc)
+
+    def _interval_args(self, match):
+        index, start, range_sep, stop, step = (
+            match.group(*self._groups) + (None,))[:5]
+        if index is not None:
+            return {'start': int(index)}
+        args = {'range_sep': range_sep}
+        if start:
+            args['start'] = int(start)
+        if stop is not None:
+            args['stop'] = int(stop)
+        if step is not None:
+            args['step'] = int(step)
+        return args
+
+    def _scan(self, text):
+        """
+        :returns: (interval arguments, None), or (None, (expected, column))
+                  if the text isn't valid, where expected is a tuple
+                  describing the tokens expected at column; nothing is
+                  raised
+        """
+        if '\t' in text:
+            # pyparsing expands tabs before parsing
+            text = text.expandtabs()
+        match, skip = self._item.match, _space.match
+        loc = skip(text).end()
+        item = match(text, loc)
+        if item is None:
+            return None, self._item_error(text, loc)
+        items = [item]
+        end = item.end()
+        sep = self.list_sep
+        if sep is not None:
+            while True:
+                loc = skip(text, end).end()
+                if not text.startswith(sep, loc):
+                    break
+                # a trailing separator is allowed
+                end = loc + len(sep)
+                item = match(text, skip(text, end).end())
+                if item is None:
+                    break
+                items.append(item)
+                end = item.end()
+        loc = skip(text, end).end()
+        if loc != len(text):
+            return None, (('string_end',), _column(text, loc))
+        return [self._interval_args(i) for i in items], None
+
+    def parse(self, text):
+        """
+        :param str text: slice string
+        :returns:        dict of interval arguments for each slice; the keys
+                         are start, range_sep, stop & step (when present)
+        :rtype:          list
+        :raises:         InvalidSliceString
+        """
+        args, error = self._scan(text)
+        if error is not None:
+            expected, column = error
+            raise InvalidSliceString('Expected ' + ' or '.join(expected),
+                                     {'text': text, 'column': column,
+                                      'expected': expected})
+        return args
@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+"""
+Compiled slice plans
+====================
+A plan is the end product of parsing a slice string: the Python slice objects
+applied to every row.  Building one requires the Grammar & Interval classes;
+applying one doesn't.  Plans are immutable, so a single plan can be shared by
+any number of threads, and pickled for use in other processes.
+"""
+from itertools import chain
+from operator import itemgetter
+
+from .cache import LRUCache
+chained = chain.from_iterable
+
+#: plans specialized for a row width are compiled into a getter of absolute
+#: column numbers when they select at most this many columns
+FIXED_WIDTH_LIMIT = 4096
+
+#: most plans specialized for different row widths kept by each plan
+SPECIALIZED_WIDTHS = 8
+
+
+def _take(row, slice_):
+    """
+    :returns: row[slice_]; rows that can be indexed but not sliced (i.e.
+              deques) produce the selected items lazily, so big stepped ranges
+              are never expanded into lists of indices
+    """
+    try:
+        return row[slice_]
+    except TypeError:
+        indices = range(*slice_.indices(len(row)))
+        return (row[i] for i in indices)
+
+
+def _index(slice_):
+    ":returns: the only index selected by slice_, or None if it isn't one"
+    start, stop = slice_.start, slice_.stop
+    if start is None or slice_.step not in (None, 1):
+        return None
+    end = start + 1
+    if end == 0:
+        end = None
+    return start if stop == end else None
+
+
+def _ordered(start, stop):
+    ":returns: True if start <= stop for every sequence length"
+    if start is None or stop is None:
+        return True
+    return (start < 0) == (stop < 0) and start <= stop
+
+
+def _merge(first, second):
+    """
+    :returns: one slice selecting the same items as first followed by second
+              for sequences of any length, or None if there isn't one
+    """
+    step = first.step or 1
+    if step < 0 or first.stop is None or second.start is None:
+        return None
+    if step == 1:
+        if (second.start == first.stop and (second.step or 1) == 1
+                and _ordered(first.start, first.stop)
+                and _ordered(second.start, second.stop)):
+            return slice(first.start, second.stop, first.step or second.step)
+        index = _index(first)
+        if index is None or index < 0 or (second.step or 1) < 2:
+            return None
+        # a single index followed by a stepped run it belongs to
+        step = second.step
+        if (second.start == index + step
+                and _ordered(second.start, second.stop)):
+            return slice(index, second.stop, step)
+        return None
+    start = first.start or 0
+    if start < 0 or first.stop <= start:
+        return None
+    next_ = start - (start - first.stop) // step * step
+    if second.start != next_:
+        return None
+    if _index(second) is not None:
+        return slice(first.start, next_ + 1, step)
+    if second.step == step and _ordered(second.start, second.stop):
+        return slice(first.start, second.stop, step)
+    return None
+
+
+def coalesce(slices):
+    """
+    merge consecutive slices that select contiguous, same-stride runs
+    -----------------------------------------------------------------
+    The output order is unchanged, so overlapping slices are left alone.
+
+    :param slices: Python slice objects, in output order
+    :returns:      equivalent, but possibly fewer, slice objects
+    :rtype:        list
+
+    >>> coalesce([slice(0, 3), slice(3, 6), slice(6, 7)])
+    [slice(0, 7, None)]
+    >>> coalesce([slice(0, 5, 2), slice(6, 7), slice(1, 2)])
+    [slice(0, 7, 2), slice(1, 2, None)]
+    """
+    runs = []
+    for slice_ in slices:
+        merged = _merge(runs[-1], slice_) if runs else None
+        if merged is None:
+            runs.append(slice_)
+        else:
+            runs[-1] = merged
+    return runs
+
+
+class SlicePlan(object):
+    """
+    Slice objects ready to be applied to rows
+    -----------------------------------------
+
+    Attributes:
+      slices (tuple):    Python slice objects, in output order
+      slice_list (bool): True if the sliced columns are concatenated into a
+                         list (slice lists); False if the single slice is
+                         applied as-is, preserving the row type.
+      width (int):       the row width the plan is specialized for, or None;
+                         rows of other widths use the generic slices.
+    """
+    __slots__ = ('slices', 'slice_list', 'width', '_runs', '_getter',
+                 '_fixed', '_specialized')
+
+    def __init__(self, slices, slice_list=True, width=None):
+        slices = tuple(slices)
+        if not slice_list and len(slices) != 1:
+            raise ValueError('A single slice is required when slice lists '
+                             'are disabled.')
+        object.__setattr__(self, 'slices', slices)
+        object.__setattr__(self, 'slice_list', bool(slice_list))
+        object.__setattr__(self, 'width', width)
+        object.__setattr__(self, '_runs', tuple(coalesce(slices)))
+        object.__setattr__(self, '_getter', self._compile_getter())
+        object.__setattr__(self, '_fixed', self._compile_fixed())
+        object.__setattr__(self, '_specialized', None)
+
+    def _compile_getter(self):
+        """
+        Slice lists made up only of single indices (i.e. '1, 3, 7, -1') are
+        compiled into an operator.itemgetter, so each row costs one C call.
+        :returns: itemgetter or None
+        """
+        if not self.slice_list or len(self._runs) == 1:
+            return None
+        indices = [_index(i) for i in self.slices]
+        if None in indices:
+            return None
+        if len(indices) == 1:
+            index = indices[0]
+            return lambda row: (row[index],)
+        return itemgetter(*indices)
+
+    def _compile_fixed(self):
+        """
+        Once the row width is known, relative & unbounded endpoints resolve
+        to absolute column numbers, so the whole slice list is compiled into
+        one fixed-arity getter: a single slice when the columns are evenly
+        spaced, otherwise an itemgetter.
+        :returns: function of a row producing the selected items, or None
+        """
+        if self.width is None or not self.slice_list:
+            return None
+        ranges = [range(*i.indices(self.width)) for i in self._runs]
+        if sum(map(len, ranges)) > FIXED_WIDTH_LIMIT:
+            return None
+        indices = tuple(chained(ranges))
+        if len(indices) < 2:
+            return lambda row: tuple(row[i] for i in indices)
+        step = indices[1] - indices[0]
+        if step and all(j - i == step for i, j in zip(indices, indices[1:])):
+            stop = indices[-1] + step
+            return itemgetter(slice(indices[0], stop if stop >= 0 else None,
+                                    step))
+        return itemgetter(*indices)
+
+    def specialize(self, width):
+        """
+        :param int width: number of items in (most of) the rows
+        :returns:         an equivalent plan, faster for rows of that width;
+                          the last SPECIALIZED_WIDTHS widths used are kept
+        :rtype:           SlicePlan
+        """
+        specialized = self._specialized
+        if specialized is None:
+            specialized = LRUCache(SPECIALIZED_WIDTHS)
+            object.__setattr__(self, '_specialized', specialized)
+        plan = specialized.get(width)
+        if plan is None:
+            plan = self.__class__(self.slices, self.slice_list, width)
+            specialized.put(width, plan)
+        return plan
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{} objects are immutable'.format(
+                             self.__class__.__name__))
+
+    def __delattr__(self, name):
+        self.__setattr__(name, None)
+
+    def __reduce__(self):
+        return (self.__class__, (self.slices, self.slice_list, self.width))
+
+    def _key(self):
+        # slice objects are unhashable prior to Python 3.12
+        return (tuple((i.start, i.stop, i.step) for i in self.slices),
+                self.slice_list, self.width)
+
+    def __eq__(self, obj):
+        if not isinstance(obj, SlicePlan):
+            return NotImplemented
+        return self._key() == obj._key()
+
+    def __ne__(self, obj):
+        result = self.__eq__(obj)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        width = '' if self.width is None else ', width={}'.format(self.width)
+        return '{}({!r}, slice_list={}{})'.format(
+            self.__class__.__name__, list(self.slices), self.slice_list, width)
+
+    def __call__(self, row):
+        if self._fixed is not None and len(row) == self.width:
+            try:
+                return list(self._fixed(row))
+            except TypeError:
+                pass
+        if not self.slice_list:
+            return self._call_single(row)
+        if len(self._runs) == 1:
+            return list(_take(row, self._runs[0]))
+        if self._getter is not None:
+            try:
+                return list(self._getter(row))
+            except IndexError:
+                pass
+        return list(chained(_take(row, i) for i in self._runs))
+
+    def _call_single(self, row):
+        slice_ = self.slices[0]
+        try:
+            return row[slice_]
+        except TypeError:
+            # preserve the row type
+            return type(row)(_take(row, slice_))
+
+    def _apply_single(self, seq):
+        slice_ = self.slices[0]
+        for row in seq:
+            try:
+                yield row[slice_]
+            except TypeError:
+                yield self._call_single(row)
+
+    def _apply_run(self, seq):
+        slice_ = self._runs[0]
+        for row in seq:
+            try:
+                yield list(row[slice_])
+            except TypeError:
+                yield list(_take(row, slice_))
+
+    def _apply_getter(self, seq):
+        getter, slices = self._getter, self._runs
+        for row in seq:
+            try:
+                yield list(getter(row))
+            except IndexError:
+                # short row; out of range slices are empty, not errors
+                yield list(chained(_take(row, i) for i in slices))
+
+    def _apply_runs(self, seq):
+        slices = self._runs
+        for row in seq:
+            try:
+                yield list(chained([row[i] for i in slices]))
+            except TypeError:
+                yield list(chained(_take(row, i) for i in slices))
+
+    def _apply_fixed(self, seq):
+        fixed, width = self._fixed, self.width
+        for row in seq:
+            if len(row) == width:
+                try:
+                    yield list(fixed(row))
+                    continue
+                except TypeError:
+                    pass
+            yield self(row)
+
+    def apply(self, seq):
+        ":returns: generator producing the sliced rows of seq"
+        if self._fixed is not None:
+            return self._apply_fixed(seq)
+        if not self.slice_list:
+            return self._apply_single(seq)
+        if len(self._runs) == 1:
+            return self._apply_run(seq)
+        if self._getter is not None:
+            return self._apply_getter(seq)
+        return self._apply_runs(seq)
+
+    def indices(self, width):
+        """
+        :param int width: row length
+        :returns:         the selected column numbers, in output order; they
+                          are produced lazily, so stepped ranges over very
+                          wide rows aren't expanded into lists
+        :rtype:           iterator
+        """
+        slices = self._runs if self.slice_list else self.slices
+        return chained(range(*i.indices(width)) for i in slices)
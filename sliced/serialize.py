@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+Saving & loading compiled slice plans
+=====================================
+Compiled plans can be saved to a JSON file & loaded into the plan cache by
+another process, so a warm start skips parsing altogether: loading only
+creates SlicePlan objects, & doesn't parse or use the Headers or Interval
+classes.  Each plan is stored with the arguments it was compiled from, & the
+settings of its dialect:
+
+    {"format": 1, "version": "0.1a", "plans": [
+        {"spec": "2:, 1", "dialect": null, "headers": null,
+         "ignorecase": false, "allow_slice_list": true, "slice_list": true,
+         "settings": {"list_sep": ",", ...},
+         "slices": [[1, null, null], [0, 1, null]]}]}
+
+Plans saved by another version of the library, or whose dialect's settings
+have changed since, are loaded by compiling them again from their arguments;
+plans of dialects that no longer exist are skipped.
+"""
+import json
+
+from .core import _build_plan, plan_cache
+from .exceptions import InvalidSliceString, OptionNotFound
+from .grammar import Grammar
+from .io import _opened
+from .plan import SlicePlan
+
+#: version of the file format
+FORMAT = 1
+
+
+def _version():
+    from . import __version__
+    return __version__
+
+
+def _tuples(value):
+    "JSON arrays back to the tuples used in cache keys"
+    if isinstance(value, list):
+        return tuple(_tuples(i) for i in value)
+    return value
+
+
+def _headers(key):
+    ":returns: the headers argument for a cache key's headers"
+    if key and isinstance(key[0], tuple):
+        return dict(key)
+    return list(key) if key else None
+
+
+def _settings(dialect):
+    ":returns: the settings of a dialect, or None if it isn't registered"
+    return Grammar._registry.get(
+        Grammar._dialect_name(dialect or 'slice_list'))
+
+
+def _fingerprint(settings):
+    ":returns: settings as they're saved, comparable once loaded"
+    return json.dumps(settings, sort_keys=True, default=repr)
+
+
+def _entries(cache):
+    plans = []
+    for key, plan in (plan_cache if cache is None else cache).items():
+        spec, dialect, headers, ignorecase, allow_slice_list = key
+        plans.append({'spec': spec, 'dialect': dialect, 'headers': headers,
+                      'ignorecase': ignorecase,
+                      'allow_slice_list': allow_slice_list,
+                      'slice_list': plan.slice_list,
+                      'settings': _settings(dialect),
+                      'slices': [(i.start, i.stop, i.step)
+                                 for i in plan.slices]})
+    return plans
+
+
+def _dumps(plans):
+    return json.dumps({'format': FORMAT, 'version': _version(),
+                       'plans': plans}, separators=(',', ':'))
+
+
+def dumps(cache=None):
+    """
+    :param cache: LRUCache of plans (default: plan_cache)
+    :returns:     the cached plans as a JSON string
+    :rtype:       str
+    """
+    return _dumps(_entries(cache))
+
+
+def loads(text, cache=None):
+    """
+    load saved plans into the cache
+    -------------------------------
+    Plans saved by another library version, or with other dialect settings,
+    are compiled again; those that are no longer valid (e.g. their dialect
+    was removed) are skipped.
+
+    :param str text: JSON string produced by dumps
+    :param cache:    LRUCache to load the plans into (default: plan_cache)
+    :returns:        number of plans loaded
+    :rtype:          int
+    :raises ValueError: not a saved plan file, or an unknown format
+    """
+    data = json.loads(text)
+    if not isinstance(data, dict) or data.get('format') != FORMAT:
+        raise ValueError('Unknown saved plan format.')
+    cache = plan_cache if cache is None else cache
+    reparse = data.get('version') != _version()
+    count, fingerprints = 0, {}
+    for entry in data['plans']:
+        headers = _tuples(entry['headers'])
+        key = (entry['spec'], entry['dialect'], headers, entry['ignorecase'],
+               entry['allow_slice_list'])
+        dialect = entry['dialect']
+        if dialect not in fingerprints:
+            settings = _settings(dialect)
+            fingerprints[dialect] = (None if settings is None
+                                     else _fingerprint(settings))
+        if fingerprints[dialect] is None:
+            continue
+        saved = _fingerprint(entry.get('settings'))
+        if reparse or saved != fingerprints[dialect]:
+            try:
+                plan = _build_plan(entry['spec'], entry['dialect'],
+                                   _headers(headers), entry['ignorecase'],
+                                   entry['allow_slice_list'])
+            except (InvalidSliceString, OptionNotFound, ValueError):
+                continue
+        else:
+            plan = SlicePlan((slice(*i) for i in entry['slices']),
+                             entry['slice_list'])
+        cache.put(key, plan)
+        count += 1
+    return count
+
+
+def save_plans(path_or_fileobj, cache=None):
+    """
+    :param path_or_fileobj: path or text file object to write
+    :param cache:           LRUCache of plans (default: plan_cache)
+    :returns:               number of plans saved
+    """
+    plans = _entries(cache)
+    with _opened(path_or_fileobj, 'w', 'utf-8', -1) as fileobj:
+        fileobj.write(_dumps(plans))
+    return len(plans)
+
+
+def load_plans(path_or_fileobj, cache=None):
+    """
+    :param path_or_fileobj: path or text file object written by save_plans
+    :param cache:           LRUCache to load the plans into (default:
+                            plan_cache)
+    :returns:               number of plans loaded
+    :raises ValueError:     not a saved plan file, or an unknown format
+    """
+    with _opened(path_or_fileobj, 'r', 'utf-8', -1) as fileobj:
+        return loads(fileobj.read(), cache)
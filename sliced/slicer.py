@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+from .arrays import as_array, slice_array
+from .core import _normalize, compile_plan, try_compile_plan
+from .exceptions import ParseError
+
+
+class Slicer(object):
+    """
+    A slice string compiled once & applied to any number of rows
+    ------------------------------------------------------------
+    The slice string is resolved into an immutable SlicePlan when the Slicer
+    is created; the Slicer can then be shared between threads, reused for
+    many files or row streams, and pickled for worker processes without the
+    slice string being parsed again.
+
+    :param str spec:     Slice string specified in the selected dialect.
+    :param dialect:      Slice string dialect name.
+    :type dialect:       str or None
+    :param headers:      header names and optional index positions
+    :type headers:       list of strings or dictionary of indices (key=int)
+                         and header name (value=str)
+    :param ignorecase:   Indicates whether header names are case sensitive
+    :type ignorecase:    bool
+    :param int width:    number of items in each row, when known up front
+    :raises:             InvalidSliceString
+
+    >>> slicer = Slicer('2:, 1')
+    >>> slicer(['a1', 'a2', 'a3'])
+    ['a2', 'a3', 'a1']
+    >>> list(slicer.map(iter([['b1', 'b2'], ['c1', 'c2']])))
+    [['b2', 'b1'], ['c2', 'c1']]
+    """
+
+    def __init__(self, spec, dialect=None, headers=None, ignorecase=False,
+                 plan=None, width=None):
+        self.spec = _normalize(spec)
+        self.dialect = dialect
+        self.headers = headers
+        self.ignorecase = ignorecase
+        if plan is None:
+            plan = compile_plan(self.spec, dialect, headers, ignorecase,
+                                width=width)
+        elif width is not None:
+            plan = plan.specialize(width)
+        self.plan = plan
+
+    @classmethod
+    def compile(cls, spec, dialect=None, headers=None, ignorecase=False,
+                width=None):
+        """
+        create a Slicer without raising InvalidSliceString
+        --------------------------------------------------
+        Takes the same arguments as Slicer; for validating untrusted specs.
+
+        :returns: Slicer, or a ParseError (which is false) if spec isn't a
+                  valid slice string
+
+        >>> Slicer.compile('2:, 1')
+        Slicer('2:, 1', dialect=None)
+        >>> error = Slicer.compile('2:, x')
+        >>> error.column, error.expected
+        (5, ('string_end',))
+        """
+        spec = _normalize(spec)
+        plan = try_compile_plan(spec, dialect, headers, ignorecase,
+                                width=width)
+        if isinstance(plan, ParseError):
+            return plan
+        return cls(spec, dialect, headers, ignorecase, plan)
+
+    def __repr__(self):
+        return '{}({!r}, dialect={!r})'.format(self.__class__.__name__,
+                                               self.spec, self.dialect)
+
+    def __reduce__(self):
+        # ship the compiled plan, so unpickling doesn't reparse the spec
+        return (self.__class__, (self.spec, self.dialect, self.headers,
+                                 self.ignorecase, self.plan))
+
+    def __call__(self, row):
+        ":returns: the sliced row"
+        return self.plan(row)
+
+    def map(self, rows):
+        ":returns: generator lazily producing each sliced row"
+        return self.plan.apply(rows)
+
+    def apply_batch(self, rows):
+        """
+        :returns: list of sliced rows, or an array if rows is a 2-d NumPy
+                  array (see sliced.arrays)
+        """
+        array = as_array(rows)
+        if array is not None:
+            return slice_array(array, self.plan)
+        return list(self.plan.apply(rows))
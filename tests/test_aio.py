@@ -0,0 +1,59 @@
+import asyncio
+import sys
+import unittest
+from string import ascii_lowercase
+
+if sys.version_info >= (3, 7):
+    from sliced import aslices, aslice_, acut
+    from sliced import aio
+
+
+async def arows(rows):
+    for row in rows:
+        await asyncio.sleep(0)
+        yield row
+
+
+async def collect(agen):
+    return [i async for i in agen]
+
+
+def run(agen):
+    return asyncio.run(collect(agen))
+
+
+@unittest.skipIf(sys.version_info < (3, 7), 'requires asyncio.run')
+class TestAsyncSlicing(unittest.TestCase):
+
+    def setUp(self):
+        self.seq = [[i + str(j) for j in range(9)]
+                    for i in ascii_lowercase[:3]]
+
+    def test_aslices(self):
+        self.assertEqual(run(aslices(arows(self.seq), '3, 1')),
+                         [['a2', 'a0'], ['b2', 'b0'], ['c2', 'c0']])
+
+    def test_sync_iterable(self):
+        self.assertEqual(run(aslices(self.seq, '-1')),
+                         [['a8'], ['b8'], ['c8']])
+
+    def test_aslice_(self):
+        self.assertEqual(run(aslice_(arows(['abcd', 'efgh']), '2:3')),
+                         ['bc', 'fg'])
+
+    def test_acut(self):
+        self.assertEqual(run(acut(arows(self.seq), '8-')),
+                         [['a7', 'a8'], ['b7', 'b8'], ['c7', 'c8']])
+
+    def test_batches(self):
+        self.assertEqual(run(aslices(arows(self.seq), '1', batch_size=2)),
+                         [[['a0'], ['b0']], [['c0']]])
+
+    def test_identity(self):
+        self.assertEqual(run(aslices(arows(self.seq), ':')), self.seq)
+
+    def test_large_headers_compile_in_executor(self):
+        headers = ['h{}'.format(i) for i in range(aio.EXECUTOR_HEADERS)]
+        rows = [list(range(len(headers)))]
+        self.assertEqual(run(aslices(arows(rows), 'h3, h1',
+                                     headers=headers)), [[3, 1]])
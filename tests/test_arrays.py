@@ -0,0 +1,56 @@
+import unittest
+
+from sliced import slices, slice_, cut, Slicer
+from sliced.arrays import as_array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipUnless(numpy, 'requires numpy')
+class TestArrayBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.array = numpy.arange(20).reshape(2, 10)
+
+    def test_as_array(self):
+        self.assertIs(as_array(self.array), self.array)
+        self.assertIsNone(as_array(numpy.arange(3)))
+        self.assertIsNone(as_array([[1, 2], [3, 4]]))
+
+    def test_single_slice_is_a_view(self):
+        result = slice_(self.array, '2:4')
+        self.assertTrue(numpy.shares_memory(result, self.array))
+        self.assertEqual(result.tolist(), [[1, 2, 3], [11, 12, 13]])
+        result = slices(self.array, '1:3, 4:6')
+        self.assertTrue(numpy.shares_memory(result, self.array))
+        self.assertEqual(result.tolist(), [[0, 1, 2, 3, 4, 5],
+                                           [10, 11, 12, 13, 14, 15]])
+
+    def test_slice_list(self):
+        result = slices(self.array, '-1, 2:6:2, 1')
+        self.assertEqual(result.tolist(), [[9, 1, 3, 5, 0],
+                                           [19, 11, 13, 15, 10]])
+        self.assertEqual(cut(self.array, '3-4, 10').tolist(),
+                         [[2, 3, 9], [12, 13, 19]])
+
+    def test_matches_list_path(self):
+        rows = self.array.tolist()
+        for spec in ('1, 3, 7, -1', '::3, -2:', '8:3:-2, 2', '5:, 1:2'):
+            self.assertEqual(slices(self.array, spec).tolist(),
+                             list(slices(rows, spec)), spec)
+
+    def test_identity(self):
+        self.assertIs(slices(self.array, ':'), self.array)
+
+    def test_slicer(self):
+        self.assertEqual(Slicer('2, 4').apply_batch(self.array).tolist(),
+                         [[1, 3], [11, 13]])
+
+    def test_output_columns(self):
+        columns = slices(self.array, '2:4', output='columns')
+        self.assertEqual([i.tolist() for i in columns],
+                         [[1, 11], [2, 12], [3, 13]])
+        self.assertTrue(numpy.shares_memory(columns[0], self.array))
@@ -0,0 +1,124 @@
+import random
+import unittest
+from array import array
+
+from sliced.intervals import Interval
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def scalar(start, stop, step, type_, from_origin, to_origin, to_type):
+    "convert one interval with the EndPoint arithmetic"
+    interval = Interval(start, stop, step, type_, from_origin)
+    start, stop = interval._get_new_type(to_type, step=step,
+                                         to_origin=to_origin)
+    return start.value, stop.value
+
+
+class TestConvertMany(unittest.TestCase):
+
+    def columns(self, rand, origin, size=300):
+        values = [None, -3, -2, -1, 1, 2, 3, 7] + ([0] if not origin else [])
+        starts = [rand.choice(values) for _ in range(size)]
+        stops = [rand.choice(values) for _ in range(size)]
+        steps = [rand.choice([None, 1, 2, -1, -2]) for _ in range(size)]
+        types = [rand.randrange(4) for _ in range(size)]
+        return starts, stops, steps, types
+
+    def expected(self, columns, from_origin, to_origin, to_type):
+        results = []
+        for start, stop, step, type_ in zip(*columns):
+            try:
+                results.append(scalar(start, stop, step, type_, from_origin,
+                                      to_origin, to_type))
+            except ValueError:
+                # the scalar path can't take zero-based 0 to unit-based
+                results.append(None)
+        return results
+
+    def test_matches_scalar(self):
+        rand = random.Random(0)
+        for from_origin in (0, 1):
+            columns = self.columns(rand, from_origin)
+            for to_origin in (0, 1):
+                for to_type in Interval.types:
+                    expected = self.expected(columns, from_origin, to_origin,
+                                             to_type)
+                    starts, stops = Interval.convert_many(
+                        *columns, from_origin=from_origin,
+                        to_origin=to_origin, to_type=to_type)
+                    for result, value in zip(zip(starts, stops), expected):
+                        if value is not None:
+                            self.assertEqual(result, value)
+
+    @unittest.skipUnless(numpy, 'requires numpy')
+    def test_numpy_matches_lists(self):
+        rand = random.Random(1)
+        for from_origin in (0, 1):
+            starts, stops, steps, types = self.columns(rand, from_origin)
+            masked = [numpy.ma.masked_equal(
+                [-99 if i is None else i for i in column], -99)
+                for column in (starts, stops)]
+            for to_origin in (0, 1):
+                for to_type in Interval.types:
+                    options = dict(from_origin=from_origin,
+                                   to_origin=to_origin, to_type=to_type)
+                    expected = Interval.convert_many(starts, stops, steps,
+                                                     types, **options)
+                    result = Interval.convert_many(
+                        masked[0], masked[1], steps, numpy.array(types),
+                        **options)
+                    for column, values in zip(result, expected):
+                        self.assertEqual(column.tolist(), values)
+
+    def test_columns(self):
+        starts, stops = Interval.convert_many(array('q', [1, 5]),
+                                              array('q', [3, 9]),
+                                              types='right-open')
+        self.assertEqual((starts, stops), ([0, 4], [2, 8]))
+        self.assertEqual(Interval.convert_many([0], [None], from_origin=0,
+                                               to_origin=1, to_type='closed'),
+                         ([1], [None]))
+        with self.assertRaises(ValueError):
+            Interval.convert_many([0], [1])
+        with self.assertRaises(ValueError):
+            Interval.convert_many([1, 2], [3])
+        with self.assertRaises(ValueError):
+            Interval.convert_many([1], [2], types=['open', 'closed'])
+
+    @unittest.skipUnless(numpy, 'requires numpy')
+    def test_numpy_out_of_range(self):
+        starts, stops = Interval.convert_many(
+            numpy.array([1, -1]), numpy.array([-1, 2]), numpy.array([-1, 1]),
+            'open', to_type='closed')
+        self.assertEqual(starts.tolist(), [None, None])
+        self.assertEqual(stops.tolist(), [None, 0])
+        self.assertEqual(stops.tolist(),
+                         [scalar(1, -1, -1, 'open', 1, 0, 'closed')[1],
+                          scalar(-1, 2, 1, 'open', 1, 0, 'closed')[1]])
+
+    @unittest.skipUnless(numpy, 'requires numpy')
+    def test_numpy_columns(self):
+        starts, stops = Interval.convert_many(
+            numpy.array([1, 5, 2]), numpy.array([3, 9, 4]),
+            types=numpy.array(['closed', 'open', 'closed']))
+        self.assertEqual((starts.tolist(), stops.tolist()),
+                         ([0, 5, 1], [3, 8, 4]))
+        starts, stops = Interval.convert_many(
+            numpy.ma.masked_equal([1, 0], 0), numpy.array([3, 4]))
+        self.assertEqual((starts.tolist(), stops.tolist()),
+                         ([0, None], [3, 4]))
+        with self.assertRaises(ValueError):
+            Interval.convert_many(numpy.array([1.5]), numpy.array([3]))
+        with self.assertRaises(ValueError):
+            Interval.convert_many(numpy.ma.masked_equal([1.5, 0.0], 0.0),
+                                  numpy.array([3, 4]))
+        with self.assertRaises(ValueError):
+            Interval.convert_many(numpy.array([1]), [2.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+from sliced.cache import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = LRUCache(maxsize=2)
+
+    def test_get_missing(self):
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(self.cache.get('a', 0), 0)
+        self.assertEqual(self.cache.info().misses, 2)
+
+    def test_put_and_get(self):
+        self.cache.put('a', 1)
+        self.assertEqual(self.cache.get('a'), 1)
+        self.assertIn('a', self.cache)
+        self.assertEqual(self.cache.info().hits, 1)
+
+    def test_evicts_least_recently_used(self):
+        self.cache.put('a', 1)
+        self.cache.put('b', 2)
+        self.cache.get('a')
+        self.cache.put('c', 3)
+        self.assertNotIn('b', self.cache)
+        self.assertIn('a', self.cache)
+        self.assertIn('c', self.cache)
+        self.assertEqual(self.cache.info().evictions, 1)
+
+    def test_resize(self):
+        self.cache.put('a', 1)
+        self.cache.put('b', 2)
+        self.cache.maxsize = 1
+        self.assertEqual(len(self.cache), 1)
+        self.assertIn('b', self.cache)
+        self.assertEqual(self.cache.info().evictions, 1)
+        with self.assertRaises(ValueError):
+            self.cache.maxsize = -1
+
+    def test_disabled(self):
+        self.cache.maxsize = 0
+        self.cache.put('a', 1)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_unbounded(self):
+        self.cache.maxsize = None
+        for i in range(10):
+            self.cache.put(i, i)
+        self.assertEqual(len(self.cache), 10)
+
+    def test_prune(self):
+        self.cache.put('a', 1)
+        self.cache.put('b', 2)
+        self.assertEqual(self.cache.prune(lambda key: key == 'a'), 1)
+        self.assertEqual(self.cache.items(), [('b', 2)])
+
+    def test_clear(self):
+        self.cache.put('a', 1)
+        self.cache.get('a')
+        self.cache.clear()
+        self.assertEqual(tuple(self.cache.info()), (0, 0, 0, 2, 0))
@@ -1,7 +1,14 @@
+import os
+import subprocess
+import sys
 import unittest
+from decimal import Decimal
 from string import ascii_lowercase
 
-from sliced import slice_, slices, cut
+from array import array
+
+from sliced import (slice_, slices, cut, compile_plan, plan_cache, as_columns,
+                    OptionNotFound)
 
 class TestCoreFunctions(unittest.TestCase):
 
@@ -27,3 +34,65 @@ class TestCoreFunctions(unittest.TestCase):
                          ['b0', 'b1', 'b2']])
         self.assertEqual(list(cut(self.seq, '3-5, 7')),
                          [['a2', 'a3', 'a4', 'a6'], ['b2', 'b3', 'b4', 'b6']])
+
+    def test_plan_cache(self):
+        plan_cache.clear()
+        list(slices(self.seq, '1, 3'))
+        list(slices(self.seq, '1, 3'))
+        info = plan_cache.info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+        self.assertIs(compile_plan('1, 3'), compile_plan('1, 3'))
+        self.assertIsNot(compile_plan('1, 3'),
+                         compile_plan('1, 3', 'unix_cut'))
+        self.assertFalse(compile_plan('1:3').slice_list)
+
+    def test_slices_iterator(self):
+        self.assertEqual(list(slices(iter(self.seq), '1, 3')),
+                         [['a0', 'a2'], ['b0', 'b2']])
+
+    def test_as_columns(self):
+        self.assertEqual(as_columns([]), [])
+        self.assertEqual(as_columns(iter([[1, 'a', 1.5], [2, 'b', 3]])),
+                         [array('q', [1, 2]), ['a', 'b'],
+                          array('d', [1.5, 3.0])])
+        columns = as_columns([[1, 1, 2 ** 70], [2.5, 'x', 3], [3, 4, 5]])
+        self.assertEqual(columns, [array('d', [1, 2.5, 3]), [1, 'x', 4],
+                                   [2 ** 70, 3, 5]])
+        with self.assertRaises(ValueError):
+            as_columns([[1, 2], [3]])
+
+    def test_as_columns_exact(self):
+        big = 2 ** 60 + 1
+        columns = as_columns([[big, 1.5, 1, 2], [0.5, Decimal('0.1'), True,
+                                                 2 ** 53 + 1]])
+        self.assertEqual(columns, [[big, 0.5], [1.5, Decimal('0.1')],
+                                   [1, True], array('q', [2, 2 ** 53 + 1])])
+        self.assertIs(columns[2][1], True)
+        self.assertIsInstance(columns[1][1], Decimal)
+        columns = as_columns([[0.5, 1], [2 ** 53, 2.5], [3, 4]])
+        self.assertEqual(columns, [array('d', [0.5, 2 ** 53, 3]),
+                                   array('d', [1, 2.5, 4])])
+        self.assertEqual(as_columns([[0.5], [2 ** 53 + 1]]),
+                         [[0.5, 2 ** 53 + 1]])
+
+    def test_output_columns(self):
+        self.assertEqual(slices(self.seq, '3, 1', output='columns'),
+                         [['a2', 'b2'], ['a0', 'b0']])
+        self.assertEqual(slice_(self.seq, '2:3', output='columns'),
+                         [['a1', 'b1'], ['a2', 'b2']])
+        rows = [[1, 2, 3], [4, 5, 6]]
+        self.assertEqual(cut(rows, '1, 3', output='columns'),
+                         [array('q', [1, 4]), array('q', [3, 6])])
+        self.assertEqual(len(slices(self.seq, ':', output='columns')), 9)
+        with self.assertRaises(OptionNotFound):
+            slices(self.seq, '1', output='cols')
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'needs module __getattr__')
+    def test_lazy_imports(self):
+        code = ("import sys, sliced; list(sliced.slices([[1, 2]], '2'));"
+                "print(sorted({'pyparsing', 'asyncio'} & set(sys.modules)));"
+                "sliced.headers; print('pyparsing' in sys.modules)")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.check_output([sys.executable, '-c', code],
+                                         cwd=root, universal_newlines=True)
+        self.assertEqual(output.split(), ['[]', 'True'])
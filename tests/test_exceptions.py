@@ -0,0 +1,34 @@
+import unittest
+
+from sliced.exceptions import InvalidSliceString, OptionNotFound, ParseError
+
+
+class TestExceptions(unittest.TestCase):
+
+    def test_option_not_found_show(self):
+        error = OptionNotFound(dict(mesg='Unknown dialect',
+                                    selected_option='x',
+                                    available_options=['a', 'b', 'c']))
+        self.assertEqual(error.show(), "Unknown dialect: 'x'\n"
+                                       "Valid options: 'a', 'b' or 'c'.")
+        error = OptionNotFound('closed open', ['closed'])
+        self.assertEqual(error.show(), "closed open\nValid options: 'closed'.")
+        self.assertEqual(OptionNotFound('x').show(), 'x')
+
+    def test_invalid_slice_string_show(self):
+        error = InvalidSliceString('Expected string_end',
+                                   {'text': '1:3 5', 'column': 5})
+        self.assertEqual(error.show(),
+                         '1:3 5\n    ^\nExpected string_end at column 5')
+        self.assertEqual(InvalidSliceString().show(), 'InvalidSliceString')
+
+    def test_parse_error(self):
+        error = ParseError('1:3 5', column=5, expected=('string_end',))
+        self.assertIsNone(error._message)
+        self.assertEqual(error.message, 'Expected string_end')
+        self.assertEqual(error.show(), error.exception().show())
+        self.assertEqual(ParseError.from_exception(error.exception()), error)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -96,10 +96,104 @@ class TestGrammarClass(unittest.TestCase):
         with self.assertRaises(sliced.InvalidSliceString):
             self.grammar.parse_text('1:2')
 
+    def test_shared_parsers(self):
+        first, second = sliced.Grammar('unix_cut'), sliced.Grammar('unix_cut')
+        list(first.parse_text('1-2')), list(second.parse_text('3'))
+        self.assertIs(first._parser, second._parser)
+        second.allow_relative_indices = True
+        self.assertEqual(list(second.parse_text('-1')), [{'start': -1}])
+        self.assertIsNot(first._parser, second._parser)
+        self.assertEqual(list(first.parse_text('-1')),
+                         [{'range_sep': '-', 'stop': 1}])
+
+    def test_dialect_settings_are_copied(self):
+        first = sliced.Grammar('dot_notation')
+        second = sliced.Grammar('dot_notation')
+        first.interval['..'] = 'closed'
+        self.assertEqual(second.interval['..'], 'open')
+
+    def test_parse_many(self):
+        results = self.grammar.parse_many(['1, 3', 'x', '1, 3', '1:'])
+        self.assertEqual(results[0], list(self.grammar.parse('1, 3')))
+        self.assertEqual(results[0], results[2])
+        results[0][0]['start'] = 2
+        self.assertEqual(results[2][0]['start'], 1)
+        self.assertEqual(results[1],
+                         sliced.ParseError('x', 'Expected a slice', 1))
+        self.assertFalse(results[1])
+        with self.assertRaises(sliced.InvalidSliceString):
+            raise results[1].exception()
+        self.assertEqual(results[3], [{'start': 1, 'type_': 'closed'}])
+        self.grammar.dialect = 'python_slice'
+        self.assertEqual(self.grammar.parse_many(['1:2', '1,']), [
+            {'start': 1, 'stop': 2, 'type_': 'closed'},
+            sliced.ParseError('1,', 'Expected string_end', 2)])
+
+    def test_try_parse(self):
+        self.assertEqual(self.grammar.try_parse('1:3, 5'),
+                         list(self.grammar.parse('1:3, 5')))
+        error = self.grammar.try_parse('1:3 5')
+        self.assertFalse(error)
+        self.assertEqual((error.column, error.expected), (5, ('string_end',)))
+        self.assertEqual(error.message, 'Expected string_end')
+        self.assertEqual(self.grammar.try_parse(' -x').expected,
+                         ('a non-zero digit',))
+        self.grammar.dialect = 'python_slice'
+        self.assertEqual(self.grammar.try_parse('::2'),
+                         {'step': 2, 'type_': 'closed'})
+
     def test_get_dialects(self):
         self.assertEqual(set(self.grammar.get_dialects()), {'slice_list',
             'python_slice', 'dot_notation', 'double_dot', 'unix_cut'})
 
+    def test_register_dialect(self):
+        name = sliced.Grammar.register_dialect(
+            'Semi Colon', list_sep=';', range_sep=('~', '~~'),
+            interval_map={'~': 'closed', '~~': 'right-open'},
+            allow_reverse_strides=False)
+        self.assertEqual(name, 'semi_colon')
+        self.assertIn('semi_colon', self.grammar.get_dialects())
+        grammar = sliced.Grammar('semi colon')
+        self.assertEqual(list(grammar.parse('1~~3:2; -1')), [
+                         {'start': 1, 'stop': 3, 'step': 2,
+                          'type_': 'right-open'},
+                         {'start': -1, 'stop': -1, 'type_': 'closed'}])
+        with self.assertRaises(sliced.InvalidSliceString):
+            grammar.parse_text('::-1')
+        with self.assertRaises(ValueError):
+            sliced.Grammar.register_dialect('bad', range_sep='to')
+        with self.assertRaises(sliced.OptionNotFound):
+            sliced.Grammar.register_dialect('bad', interval_map={':': 'half'})
+        self.assertNotIn('bad', self.grammar.get_dialects())
+        del sliced.Grammar._registry['semi_colon']
+
+    def test_dialect_methods(self):
+        class Grammar(sliced.Grammar):
+            def _dialect__semi_colon(self):
+                self._dialect__slice_list()
+                self.list_sep = ';'
+
+            def _dialect__broken(self):
+                self._dialect__no_such_dialect()
+        self.assertIn('semi_colon', Grammar().get_dialects())
+        self.assertNotIn('semi_colon', self.grammar.get_dialects())
+        self.assertEqual(list(Grammar('semi_colon').parse_text('1; 2')),
+                         [{'start': 1}, {'start': 2}])
+        self.assertEqual(Grammar('semi_colon').interval, {':': 'closed'})
+        with self.assertRaises(AttributeError):
+            Grammar('broken')
+
+    def test_replace_dialect(self):
+        sliced.Grammar.register_dialect('tilde', range_sep='~')
+        self.assertEqual(sliced.compile_plan('1~3', 'tilde').slices,
+                         (slice(0, 3),))
+        sliced.Grammar.register_dialect('Tilde', range_sep='-')
+        with self.assertRaises(sliced.InvalidSliceString):
+            sliced.compile_plan('1~3', 'tilde')
+        self.assertEqual(sliced.compile_plan('1-3', 'tilde').slices,
+                         (slice(0, 3),))
+        del sliced.Grammar._registry['tilde']
+
     def test_list_dialects(self):
         self.assertIn('slice_list', self.grammar.list_dialects())
         self.assertIn('python_slice', self.grammar.list_dialects())
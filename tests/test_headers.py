@@ -5,4 +5,40 @@ from sliced.headers.header import Headers
 from sliced.exceptions import InvalidSliceString
 
 class TestHeaders(unittest.TestCase):
-    pass
+
+    def setUp(self):
+        self.headers = Headers(['id', 'First Name', 'Email', 'email', '2'])
+
+    def test_names(self):
+        self.assertEqual(self.headers.names_to_indices('Email, id:2'),
+                         '3,1:2')
+
+    def test_slugs(self):
+        self.assertEqual(self.headers.names_to_indices('first_name'), '2')
+
+    def test_quoted(self):
+        self.assertEqual(self.headers.names_to_indices('"2", \'id\''), '5,1')
+
+    def test_wildcards_and_regexes(self):
+        self.assertEqual(self.headers.names_to_indices('*mail'), '3,4')
+        self.assertEqual(self.headers.names_to_indices("r'^[eE]'"), '3,4')
+
+    def test_ignorecase(self):
+        headers = Headers(['id', 'Email'], ignorecase=True)
+        self.assertEqual(headers.names_to_indices('EMAIL'), '2')
+
+    def test_indices(self):
+        headers = Headers({3: 'a', 5: 'b'},
+                          grammar=sliced.Grammar('unix_cut'))
+        self.assertEqual(headers.names_to_indices('a-b, 7'), '3-5,7')
+
+    def test_unknown_name(self):
+        with self.assertRaises(InvalidSliceString) as context:
+            self.headers.names_to_indices('id, nope')
+        self.assertEqual(context.exception.info['column'], 5)
+
+    def test_slices_with_headers(self):
+        rows = [[1, 'bob', 'b@x'], [2, 'ann', 'a@x']]
+        self.assertEqual(list(sliced.slices(rows, 'mail, id',
+                                            headers=['id', 'name', 'mail'])),
+                         [['b@x', 1], ['a@x', 2]])
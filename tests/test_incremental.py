@@ -0,0 +1,65 @@
+import unittest
+
+import sliced
+from sliced import IncrementalParser
+
+
+def bounds(intervals):
+    return [(i.lower_bound, i.upper_bound, i.stride) for i in intervals]
+
+
+class TestIncrementalParser(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = IncrementalParser()
+
+    def test_update(self):
+        first = self.parser.update('1, 3:5, -1')
+        self.assertEqual(bounds(first), [(1, 1, None), (3, 5, None),
+                                         (-1, -1, None)])
+        self.assertEqual(self.parser.changed, (0, 1, 2))
+        second = self.parser.update('1, 3:6, -1,')
+        self.assertEqual(self.parser.changed, (1,))
+        self.assertIs(second[0], first[0])
+        self.assertIs(second[2], first[2])
+        self.assertEqual(bounds(second[1:2]), [(3, 6, None)])
+        self.parser.update('7,1,  -1')
+        self.assertEqual(self.parser.changed, (0,))
+        self.assertEqual(self.parser.update('7,1,  -1'), self.parser.intervals)
+        self.assertEqual(self.parser.changed, ())
+
+    def test_matches_grammar(self):
+        grammar = sliced.Grammar('dot_notation')
+        parser = IncrementalParser(grammar=grammar)
+        text = ''
+        for char in '1, 2.:5:2, :.4, 7..':
+            text += char
+            try:
+                expected = [sliced.intervals.Interval(
+                            **grammar._get_interval_args(i))
+                            for i in grammar.parse_text(text)]
+            except sliced.InvalidSliceString as error:
+                with self.assertRaises(sliced.InvalidSliceString) as context:
+                    parser.update(text)
+                self.assertEqual(context.exception.info, error.info)
+                continue
+            self.assertEqual(bounds(parser.update(text)), bounds(expected))
+
+    def test_invalid_text_keeps_state(self):
+        self.parser.update('1, 2')
+        for text in ('1,,2', '1, 2x', '', '1 :2'):
+            with self.assertRaises(sliced.InvalidSliceString):
+                self.parser.update(text)
+        self.assertEqual(self.parser.text, '1, 2')
+        self.assertEqual(bounds(self.parser.intervals),
+                         [(1, 1, None), (2, 2, None)])
+
+    def test_single_slice(self):
+        parser = IncrementalParser('python_slice')
+        self.assertEqual(bounds(parser.update('2:5')), [(2, 5, None)])
+        with self.assertRaises(sliced.InvalidSliceString):
+            parser.update('2, 5')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import random
 import unittest
 
 from sliced.intervals import Interval
@@ -358,3 +359,66 @@ class TestIntervalClass(unittest.TestCase):
         self.assertEqual(interval.to_slice(stop=1), slice(None, 1, None))
         self.assertEqual(interval.to_slice(stop=2), slice(None, 2, None))
         self.assertEqual(interval.to_slice(step=3), slice(None, None, 3))
+
+    def test_to_range(self):
+        self.assertEqual(Interval(1, 10 ** 12, 3).to_range(10 ** 15),
+                         range(0, 10 ** 12, 3))
+        self.assertEqual(Interval(-3).to_range(5), range(2, 5))
+        self.assertEqual(Interval(None, None, -2).to_range(5),
+                         range(4, -1, -2))
+
+    def test_slots(self):
+        interval = Interval(2, 5, type_='open')
+        self.assertFalse(hasattr(interval, '__dict__'))
+        self.assertEqual((Interval.CLOSED, Interval.RIGHT_OPEN,
+                          Interval.LEFT_OPEN, Interval.OPEN), (0, 1, 2, 3))
+        self.assertEqual([i.value for i in interval.endpoints], [2, 5])
+        with self.assertRaises(ValueError):
+            interval.lower_bound = 0
+        with self.assertRaises(ValueError):
+            interval.origin = 2
+        interval.origin = 0
+        interval.lower_bound = 0
+        self.assertEqual(interval.to_slice(), slice(1, 5, None))
+
+    def reference_slice(self, interval, *args):
+        "to_slice by converting EndPoints, as before the direct arithmetic"
+        start, stop, step, from_type = (args + (False,) * 4)[:4]
+        if step is False:
+            step = interval.stride
+        start, stop = interval.to_right_open(start, stop, step, from_type, 0)
+        return slice(start.value, stop.value, step)
+
+    def test_to_slice_matches_reference(self):
+        rand = random.Random(0)
+        values = [None, 1, 2, 3, 7, -1, -2, -5]
+        for _ in range(2000):
+            origin = rand.choice([0, 1])
+            start, stop = rand.choice(values), rand.choice(values)
+            step = rand.choice([None, 1, 2, -1, -3])
+            interval = Interval(start, stop, step, rand.randrange(4), origin)
+            self.assertEqual(interval.to_slice(),
+                             self.reference_slice(interval), interval)
+            args = (rand.choice(values + [False, 0]),
+                    rand.choice(values + [False, 0]),
+                    rand.choice([False, None, 2, -1]),
+                    rand.choice([False, 'open', 'closed', 1]))
+            try:
+                expected = self.reference_slice(interval, *args)
+            except ValueError:
+                with self.assertRaises(ValueError):
+                    interval.to_slice(*args)
+                continue
+            self.assertEqual(interval.to_slice(*args), expected, args)
+
+    def test_to_slice_memoized(self):
+        interval = Interval(2, 5)
+        self.assertIs(interval.to_slice(), interval.to_slice())
+        interval.stride = -1
+        self.assertEqual(interval.to_slice(), slice(1, 3, -1))
+        interval.type = 'open'
+        self.assertEqual(interval.to_slice(), slice(0, 4, -1))
+        interval.set(1, 3)
+        self.assertEqual(interval.to_slice(), slice(1, 2, None))
+        interval.origin = 0
+        self.assertEqual(interval.to_slice(), self.reference_slice(interval))
@@ -0,0 +1,127 @@
+import random
+import unittest
+from itertools import islice
+
+from sliced.intervals import IntervalSet
+from sliced.plan import SlicePlan
+
+
+def random_slices(rand, width):
+    def endpoint():
+        return rand.choice([None, rand.randint(-width, width)])
+    return [slice(endpoint(), endpoint(),
+                  rand.choice([None, 1, 2, 3, -1, -2, 5]))
+            for _ in range(rand.randint(0, 4))]
+
+
+def indices(slices, width):
+    return {j for i in slices for j in range(*i.indices(width))}
+
+
+class TestIntervalSet(unittest.TestCase):
+
+    def test_matches_sets(self):
+        rand = random.Random(0)
+        for _ in range(500):
+            width = rand.randint(0, 40)
+            first, second = (random_slices(rand, width),
+                             random_slices(rand, width))
+            a, b = IntervalSet(first, width), IntervalSet(second, width)
+            expected_a, expected_b = (indices(first, width),
+                                      indices(second, width))
+            for result, expected in ((a, expected_a), (a | b, expected_a |
+                                     expected_b), (a & b, expected_a &
+                                     expected_b), (a - b, expected_a -
+                                     expected_b)):
+                self.assertEqual(list(result), sorted(expected))
+                self.assertEqual(len(result), len(expected))
+                self.assertEqual(indices(result.to_slices(), width), expected)
+                for i in range(-1, width + 1):
+                    self.assertEqual(i in result, i in expected)
+
+    def test_unbounded_matches_sets(self):
+        rand = random.Random(1)
+
+        def absolute_slices():
+            return [slice(rand.randint(0, 20),
+                          rand.choice([None, rand.randint(0, 40)]),
+                          rand.choice([None, 2, 3, 4, 6]))
+                    for _ in range(rand.randint(0, 3))]
+
+        limit = 200
+        for _ in range(300):
+            first, second = absolute_slices(), absolute_slices()
+            a, b = IntervalSet(first), IntervalSet(second)
+            expected_a, expected_b = (indices(first, limit),
+                                      indices(second, limit))
+            for result, expected in ((a | b, expected_a | expected_b),
+                                     (a & b, expected_a & expected_b),
+                                     (a - b, expected_a - expected_b)):
+                self.assertEqual({i for i in range(limit) if i in result},
+                                 expected)
+                self.assertEqual(indices(result.to_slices(), limit), expected)
+
+    def test_unbounded(self):
+        evens = IntervalSet([slice(0, None, 2)])
+        threes = IntervalSet([slice(0, None, 3)])
+        self.assertFalse(evens.bounded)
+        self.assertEqual(list(islice(evens | threes, 8)),
+                         [0, 2, 3, 4, 6, 8, 9, 10])
+        self.assertEqual((evens & threes).to_slices(), [slice(0, None, 6)])
+        self.assertEqual(list(islice(evens - threes, 4)), [2, 4, 8, 10])
+        self.assertIn(10 ** 15 + 4, evens - threes)
+        self.assertNotIn(10 ** 15 + 2, evens - threes)
+        with self.assertRaises(ValueError):
+            len(evens)
+        with self.assertRaises(ValueError):
+            IntervalSet([slice(-3, None)])
+
+    def test_minimal_slices(self):
+        cols = IntervalSet([slice(0, 3), slice(3, 6), slice(8, 9),
+                            slice(10, 11)])
+        self.assertEqual(cols.to_slices(), [slice(0, 6), slice(8, 11, 2)])
+        self.assertEqual(cols.runs, ((0, 6, 1), (8, 11, 2)))
+        self.assertEqual(cols, IntervalSet([slice(10, 7, -2), slice(0, 6)],
+                                           width=11))
+
+    def test_big_ranges(self):
+        big = IntervalSet([slice(0, 10 ** 12)])
+        odd = big - IntervalSet([slice(0, None, 2)])
+        self.assertEqual(odd.to_slices(), [slice(1, 10 ** 12, 2)])
+        self.assertEqual(len(odd), 10 ** 12 // 2)
+
+    def test_coprime_strides(self):
+        a, b, c = (IntervalSet([slice(0, None, i)]) for i in (997, 991, 983))
+        union = a | b
+        self.assertEqual(len(union.runs), 997 + 991 - 1)
+        for i in (0, 991 * 5, 997 * 990, 997 * 991, 997 * 991 * 7 + 997):
+            self.assertIn(i, union)
+        for i in (1, 990, 996, 997 * 991 - 1):
+            self.assertNotIn(i, union)
+        difference = union - a
+        self.assertEqual(list(islice(difference, 3)), [991, 1982, 2973])
+        self.assertNotIn(997 * 991, difference)
+        self.assertIn(997 * 991 * 3 + 991, difference)
+        self.assertEqual((a & b & c).to_slices(),
+                         [slice(0, None, 997 * 991 * 983)])
+        (start, stop, step), = (a & IntervalSet([slice(5, None, 991)])).runs
+        self.assertEqual((start % 997, start % 991, stop, step),
+                         (0, 5, None, 997 * 991))
+        self.assertLess(start, 997 * 991)
+        with self.assertRaises(ValueError):
+            union | c
+
+    def test_spec(self):
+        cols = (IntervalSet.from_spec('1:10') - IntervalSet.from_spec('3, 5')
+                | IntervalSet.from_spec('20:'))
+        self.assertEqual(cols.to_spec(), '1:2, 4, 6:10, 20:')
+        row = list(range(30))
+        self.assertEqual(SlicePlan(cols.to_slices())(row),
+                         [0, 1, 3] + list(range(5, 10)) + list(range(19, 30)))
+        self.assertFalse(IntervalSet())
+        with self.assertRaises(ValueError):
+            IntervalSet().to_spec()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from sliced.io import cut_file, iter_cut_file, cut_mmap, _max_fields
+from sliced import compile_plan
+from sliced.exceptions import InvalidSliceString
+
+TSV = 'id\tname\tmail\n1\tbob\tb@x\n2\t"a\tnn"\ta@x\n'
+
+
+class TestCutFile(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'rows.tsv')
+        with open(self.path, 'w', newline='') as fileobj:
+            fileobj.write(TSV)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_yield_rows(self):
+        self.assertEqual(list(cut_file(self.path, '3, 1')),
+                         [['mail', 'id'], ['b@x', '1'], ['a@x', '2']])
+
+    def test_header_names(self):
+        self.assertEqual(list(iter_cut_file(self.path, 'name-', header=True)),
+                         [['name', 'mail'], ['bob', 'b@x'],
+                          ['a\tnn', 'a@x']])
+
+    def test_file_objects(self):
+        out = io.StringIO()
+        self.assertEqual(cut_file(io.StringIO(TSV), '2', out=out), 3)
+        self.assertEqual(out.getvalue(), 'name\nbob\n"a\tnn"\n')
+
+    def test_write_path(self):
+        path = os.path.join(self.tmpdir, 'out.csv')
+        self.assertEqual(cut_file(self.path, 'mail, id', header=True,
+                                  out=path), 3)
+        with open(path) as fileobj:
+            self.assertEqual(fileobj.read(), 'mail\tid\nb@x\t1\na@x\t2\n')
+
+    def test_delimiter(self):
+        rows = cut_file(io.StringIO('a,b,c\n1,2,3\n'), '3', delimiter=',')
+        self.assertEqual(list(rows), [['c'], ['3']])
+
+    def test_empty_file(self):
+        self.assertEqual(list(cut_file(io.StringIO(''), '1', header=True)),
+                         [])
+
+    def test_invalid_spec(self):
+        with self.assertRaises(InvalidSliceString):
+            cut_file(self.path, '1:2', out=io.StringIO())
+
+
+class TestCutMmap(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'rows.tsv')
+        with open(self.path, 'wb') as fileobj:
+            fileobj.write(b'id\tname\tmail\n1\tbob\tb@x\n2\t\xc3\xa9\ta@x')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_yield_rows(self):
+        self.assertEqual(list(cut_mmap(self.path, '3, 1')),
+                         [[b'mail', b'id'], [b'b@x', b'1'], [b'a@x', b'2']])
+
+    def test_header_names(self):
+        self.assertEqual(list(cut_mmap(self.path, 'name-', header=True)),
+                         [[b'name', b'mail'], [b'bob', b'b@x'],
+                          [b'\xc3\xa9', b'a@x']])
+
+    def test_small_chunks(self):
+        self.assertEqual(list(cut_mmap(self.path, '-1, 1', chunk_size=4)),
+                         list(cut_mmap(self.path, '-1, 1')))
+
+    def test_write(self):
+        out = io.BytesIO()
+        self.assertEqual(cut_mmap(self.path, '2-', out=out), 3)
+        self.assertEqual(out.getvalue(),
+                         b'name\tmail\nbob\tb@x\n\xc3\xa9\ta@x\n')
+
+    def test_empty_file(self):
+        path = os.path.join(self.tmpdir, 'empty.tsv')
+        open(path, 'wb').close()
+        self.assertEqual(list(cut_mmap(path, '1', header=True)), [])
+
+    def test_max_fields(self):
+        self.assertEqual(_max_fields(compile_plan('1, 3-5', 'unix_cut')), 5)
+        self.assertEqual(_max_fields(compile_plan('2-', 'unix_cut')), -1)
+        self.assertEqual(_max_fields(compile_plan('-1')), -1)
@@ -0,0 +1,63 @@
+import random
+import unittest
+
+from sliced import Lineage, compile_plan
+from sliced.intervals.tree import IntervalTree
+
+
+class TestIntervalTree(unittest.TestCase):
+
+    def test_stab(self):
+        rand = random.Random(0)
+        intervals = []
+        for n in range(300):
+            low = rand.randint(-50, 50)
+            intervals.append((low, low + rand.randint(0, 30), n))
+        tree = IntervalTree(intervals)
+        self.assertEqual(len(tree), 300)
+        for point in range(-60, 90):
+            self.assertEqual(sorted(tree.stab(point)),
+                             [i[2] for i in intervals
+                              if i[0] <= point <= i[1]])
+        self.assertEqual(IntervalTree([]).stab(0), [])
+
+
+class TestLineage(unittest.TestCase):
+
+    def test_matches_scan(self):
+        rand = random.Random(0)
+        for _ in range(100):
+            width = rand.randint(0, 30)
+            slices = [slice(rand.choice([None, rand.randint(-35, 35)]),
+                            rand.choice([None, rand.randint(-35, 35)]),
+                            rand.choice([None, 2, -1, -3]))
+                      for _ in range(rand.randint(0, 8))]
+            lineage = Lineage(slices, width)
+            row = list(range(width))
+            output = [j for i in slices for j in row[i]]
+            items = [i for i in slices for j in row[i]]
+            self.assertEqual(len(lineage), len(output))
+            for column in range(width):
+                self.assertEqual(lineage.outputs(column),
+                                 [n for n, i in enumerate(output)
+                                  if i == column])
+                self.assertEqual(lineage.items(column),
+                                 [n for n, i in enumerate(slices)
+                                  if column in row[i]])
+            for position, column in enumerate(output):
+                source, item = lineage.source(position)
+                self.assertEqual(source, column)
+                self.assertIs(slices[item], items[position])
+            with self.assertRaises(IndexError):
+                lineage.source(len(output))
+
+    def test_plan(self):
+        lineage = Lineage(compile_plan('1:1000:2, 5, -3:'), 2000)
+        self.assertEqual(lineage.items(4), [0, 1])
+        self.assertEqual(lineage.outputs(4), [2, 500])
+        self.assertEqual(lineage.items(5), [])
+        self.assertEqual(lineage.source(501), (1997, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from sliced import slices, InvalidSliceString
+from sliced.parallel import ParallelSlicer, _line_offsets
+
+
+class TestParallelSlicer(unittest.TestCase):
+
+    def setUp(self):
+        self.rows = [[str(i * 10 + j) for j in range(10)] for i in range(500)]
+        self.expected = [[i[2], i[0], i[-1]] for i in self.rows]
+
+    def test_map(self):
+        with ParallelSlicer('3, 1, -1', workers=2, chunk_size=7,
+                            max_pending=3) as slicer:
+            self.assertEqual(list(slicer.map(iter(self.rows))),
+                             self.expected)
+
+    def test_unordered(self):
+        with ParallelSlicer('3, 1, -1', workers=2, chunk_size=7,
+                            ordered=False) as slicer:
+            self.assertEqual(sorted(slicer.map(self.rows)),
+                             sorted(self.expected))
+
+    def test_worker_error(self):
+        with ParallelSlicer('1', workers=2) as slicer:
+            with self.assertRaises(TypeError):
+                list(slicer.map([None]))
+
+    def test_pickle(self):
+        slicer = ParallelSlicer('3, 1', workers=3, chunk_size=5,
+                                max_pending=4, ordered=False, chunk_bytes=99)
+        slicer.pool
+        try:
+            copy = pickle.loads(pickle.dumps(slicer))
+        finally:
+            slicer.close()
+        self.assertEqual((copy.spec, copy.plan, copy.workers, copy.chunk_size,
+                          copy.max_pending, copy.ordered, copy.chunk_bytes),
+                         ('3, 1', slicer.plan, 3, 5, 4, False, 99))
+        self.assertIsNone(copy._pool)
+
+    def test_invalid_spec(self):
+        with self.assertRaises(InvalidSliceString):
+            ParallelSlicer('1-2', workers=2)
+
+    def test_slices_workers(self):
+        self.assertEqual(list(slices(self.rows, '3, 1, -1', workers=2)),
+                         self.expected)
+
+
+class TestParallelCutFile(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'rows.tsv')
+        self.rows = [['id', 'name']] + [[str(i), 'n{}'.format(i)]
+                                        for i in range(1000)]
+        with open(self.path, 'w') as fileobj:
+            fileobj.write('\n'.join('\t'.join(i) for i in self.rows))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_line_offsets(self):
+        offsets = _line_offsets(self.path, 0, 1000)
+        self.assertEqual(offsets[0], 0)
+        self.assertEqual(offsets[-1], os.path.getsize(self.path))
+        with open(self.path, 'rb') as fileobj:
+            data = fileobj.read()
+        for offset in offsets[1:-1]:
+            self.assertEqual(data[offset - 1:offset], b'\n')
+        for start, stop in zip(offsets, offsets[1:]):
+            self.assertLessEqual(stop - start, 1000 + len(b'999\tn999\n'))
+
+    def test_cut_file(self):
+        with ParallelSlicer('2, 1', 'unix_cut', workers=2) as slicer:
+            self.assertEqual(list(slicer.cut_file(self.path)),
+                             [i[::-1] for i in self.rows])
+
+    def test_cut_file_header(self):
+        with ParallelSlicer('name', headers=self.rows[0],
+                            workers=3) as slicer:
+            self.assertEqual(list(slicer.cut_file(self.path, header=True)),
+                             [i[1:] for i in self.rows])
+
+    def test_cut_file_chunk_bytes(self):
+        with ParallelSlicer('2, 1', 'unix_cut', workers=2, chunk_bytes=100,
+                            max_pending=2) as slicer:
+            self.assertEqual(list(slicer.cut_file(self.path)),
+                             [i[::-1] for i in self.rows])
+        size = os.path.getsize(self.path)
+        self.assertGreater(len(_line_offsets(self.path, 0, 100)),
+                           size // 100)
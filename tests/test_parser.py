@@ -0,0 +1,86 @@
+import random
+import unittest
+
+import sliced
+from sliced.parser import SliceParser
+
+
+def parse(function, text):
+    try:
+        return list(function(text))
+    except sliced.InvalidSliceString as error:
+        return error
+
+
+class TestSliceParser(unittest.TestCase):
+
+    def assertColumn(self, parser, text, column, message=None):
+        with self.assertRaises(sliced.InvalidSliceString) as context:
+            parser.parse(text)
+        info = context.exception.info
+        self.assertEqual((info['text'], info['column']), (text, column))
+        if message:
+            self.assertEqual(context.exception.message, message)
+
+    def test_parse(self):
+        parser = SliceParser([':'])
+        self.assertEqual(parser.parse(' 1, 2:5:2, -2, ::-1 ,'), [
+            {'start': 1},
+            {'start': 2, 'range_sep': ':', 'stop': 5, 'step': 2},
+            {'start': -2}, {'range_sep': ':', 'step': -1}])
+        self.assertEqual(parser.parse('5:1:'),
+                         [{'start': 5, 'range_sep': ':', 'stop': 1}])
+
+    def test_columns(self):
+        parser = SliceParser([':'])
+        self.assertColumn(parser, '', 1)
+        self.assertColumn(parser, ' ', 2)
+        self.assertColumn(parser, '-0', 2)
+        self.assertColumn(parser, '1,,2', 3, 'Expected string_end')
+        self.assertColumn(parser, '1,  ,2', 5, 'Expected string_end')
+        self.assertColumn(parser, '1: 2', 4, 'Expected string_end')
+        self.assertColumn(parser, '1:2:0', 5, 'Expected string_end')
+        self.assertColumn(parser, '1,\n x', 2, 'Expected string_end')
+        self.assertColumn(parser, '1,\tx', 9, 'Expected string_end')
+
+    def test_single_slice(self):
+        parser = SliceParser([':'], list_sep=None)
+        self.assertEqual(parser.parse('2:'), [{'start': 2, 'range_sep': ':'}])
+        self.assertColumn(parser, '1,', 2, 'Expected string_end')
+
+    def test_start_is_not_given_back(self):
+        # as with pyparsing, '-1' is an index even though '-' is a separator
+        parser = SliceParser(['-'])
+        self.assertEqual(parser.parse('-1'), [{'start': -1}])
+        self.assertEqual(parser.parse('-1-'),
+                         [{'start': -1, 'range_sep': '-'}])
+        parser = SliceParser(['-'], relative=False)
+        self.assertEqual(parser.parse('-1'), [{'range_sep': '-', 'stop': 1}])
+
+    def test_matches_pyparsing(self):
+        tokens = ['0', '1', '9', '12', '005', '-', '-1', '.', '..', ':', ',',
+                  ' ', '\t', '\n', 'x']
+        rand = random.Random(0)
+        texts = [''.join(rand.choice(tokens)
+                         for _ in range(rand.randint(0, 6)))
+                 for _ in range(100)]
+        for dialect in sliced.Grammar().get_dialects():
+            grammar = sliced.Grammar(dialect)
+            for text in texts:
+                fast = parse(grammar.parse_text, text)
+                reference = parse(grammar._parse_text_pyparsing, text)
+                if not isinstance(reference, Exception):
+                    self.assertEqual(fast, reference, (dialect, text))
+                    continue
+                self.assertIsInstance(fast, sliced.InvalidSliceString)
+                if fast.message == 'Expected a slice':
+                    # the reference may point into a partial separator
+                    self.assertLessEqual(fast.info['column'],
+                                         reference.info['column'])
+                else:
+                    self.assertEqual(fast.info['column'],
+                                     reference.info['column'], (dialect, text))
+
+
+if __name__ == '__main__':
+    unittest.main()
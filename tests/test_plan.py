@@ -0,0 +1,146 @@
+import pickle
+import random
+import unittest
+from collections import deque
+from itertools import islice
+
+from sliced import compile_plan
+from sliced.plan import SlicePlan, SPECIALIZED_WIDTHS, coalesce, chained
+
+
+class TestSlicePlan(unittest.TestCase):
+
+    def setUp(self):
+        self.row = ['a0', 'a1', 'a2', 'a3']
+        self.plan = SlicePlan([slice(2, None), slice(0, 1)])
+
+    def test_call(self):
+        self.assertEqual(self.plan(self.row), ['a2', 'a3', 'a0'])
+        plan = SlicePlan([slice(1, 3)], slice_list=False)
+        self.assertEqual(plan('abcd'), 'bc')
+
+    def test_apply(self):
+        self.assertEqual(list(self.plan.apply(iter([self.row, 'wxyz']))),
+                         [['a2', 'a3', 'a0'], ['y', 'z', 'w']])
+
+    def test_index_getter(self):
+        plan = SlicePlan([slice(1, 2), slice(3, 4), slice(-1, None)])
+        self.assertIsNotNone(plan._getter)
+        self.assertEqual(plan(self.row), ['a1', 'a3', 'a3'])
+        self.assertEqual(list(plan.apply([self.row, 'wxyz'])),
+                         [['a1', 'a3', 'a3'], ['x', 'z', 'z']])
+        self.assertEqual(SlicePlan([slice(-2, -1)])(self.row), ['a2'])
+
+    def test_index_getter_short_rows(self):
+        plan = SlicePlan([slice(0, 1), slice(5, 6)])
+        self.assertEqual(plan(self.row), ['a0'])
+        self.assertEqual(list(plan.apply([self.row, []])), [['a0'], []])
+
+    def test_no_index_getter(self):
+        self.assertIsNone(self.plan._getter)
+        self.assertIsNone(SlicePlan([slice(0, 1), slice(-1, 0)])._getter)
+        self.assertIsNone(SlicePlan([slice(0, 1, 2)])._getter)
+        self.assertIsNone(SlicePlan([slice(0, 1)], slice_list=False)._getter)
+
+    def test_single_slice_required(self):
+        with self.assertRaises(ValueError):
+            SlicePlan([slice(1), slice(2)], slice_list=False)
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.plan.slices = ()
+        with self.assertRaises(AttributeError):
+            del self.plan.slice_list
+
+    def test_equality(self):
+        self.assertEqual(self.plan, SlicePlan([slice(2, None), slice(0, 1)]))
+        self.assertNotEqual(self.plan, SlicePlan([slice(2, None)]))
+        self.assertEqual(len({self.plan, SlicePlan(self.plan.slices)}), 1)
+
+    def test_pickle(self):
+        plan = pickle.loads(pickle.dumps(self.plan))
+        self.assertEqual(plan, self.plan)
+        self.assertEqual(plan(self.row), self.plan(self.row))
+
+    def test_unsliceable_rows(self):
+        row = deque(range(10))
+        for spec in ('2:8:2', '3, 1, -1', '1:3, 8:', '1, 20'):
+            plan = compile_plan(spec)
+            expected = plan(list(row))
+            self.assertEqual(list(plan(row)), list(expected))
+            self.assertEqual(list(map(list, plan.apply([row, list(row)]))),
+                             [list(expected)] * 2)
+        plan = compile_plan('::-3', allow_slice_list=False)
+        self.assertEqual(plan(row), deque([9, 6, 3, 0]))
+        self.assertEqual(list(plan.apply([row])), [deque([9, 6, 3, 0])])
+        with self.assertRaises(TypeError):
+            plan(5)
+
+    def test_specialize(self):
+        plan = compile_plan('-3, 1, 5:8, -1, 2:20:2')
+        fixed = plan.specialize(10)
+        self.assertIs(plan.specialize(10), fixed)
+        self.assertEqual(fixed.width, 10)
+        self.assertNotEqual(fixed, plan)
+        self.assertEqual(pickle.loads(pickle.dumps(fixed)), fixed)
+        self.assertIn('width=10', repr(fixed))
+        for row in (list(range(10)), list(range(12)), list(range(3)),
+                    deque(range(10))):
+            self.assertEqual(fixed(row), plan(row))
+            self.assertEqual(list(fixed.apply([row])), [plan(row)])
+        self.assertEqual(compile_plan('2:4, 5:7').specialize(9)._fixed(
+                         'abcdefghi'), 'bcdefg')
+        self.assertEqual(compile_plan('a, c', headers=['a', 'b', 'c']).width,
+                         3)
+        for width in range(100):
+            plan.specialize(width)
+        self.assertEqual(len(plan._specialized), SPECIALIZED_WIDTHS)
+        self.assertIsNot(plan.specialize(10), fixed)
+
+    def test_big_stepped_range(self):
+        plan = compile_plan('1-1000000:3', 'unix_cut')
+        self.assertEqual(plan.slices, (slice(0, 1000000, 3),))
+        row = range(3000000)
+        self.assertEqual(plan(row), range(0, 1000000, 3))
+        plan = compile_plan('1-1000000:3, 5', 'unix_cut')
+        self.assertEqual(plan(deque(range(10))), [0, 3, 6, 9, 4])
+        self.assertEqual(list(islice(plan.indices(10 ** 9), 3)), [0, 3, 6])
+
+
+class TestCoalesce(unittest.TestCase):
+
+    def test_contiguous(self):
+        self.assertEqual(compile_plan('1:3, 4:6, 7')._runs, (slice(0, 7),))
+        self.assertEqual(compile_plan('1, 2, 3, 4-', 'unix_cut')._runs,
+                         (slice(0, None),))
+        self.assertEqual(compile_plan('-3, -2, -1')._runs, (slice(-3, None),))
+
+    def test_stepped(self):
+        self.assertEqual(coalesce([slice(0, 6, 2), slice(6, 10, 2)]),
+                         [slice(0, 10, 2)])
+        self.assertEqual(coalesce([slice(0, 1), slice(2, 9, 2)]),
+                         [slice(0, 9, 2)])
+        self.assertEqual(coalesce([slice(0, 6, 2), slice(6, 10, 3)]),
+                         [slice(0, 6, 2), slice(6, 10, 3)])
+
+    def test_not_merged(self):
+        for slices in ([slice(0, 3), slice(2, 5)],
+                       [slice(5, 3), slice(3, 6)],
+                       [slice(2, -3), slice(-3, None)],
+                       [slice(0, 1), slice(2, 3)],
+                       [slice(6, 0, -1), slice(0, None, -1)]):
+            self.assertEqual(coalesce(slices), slices)
+
+    def test_output_unchanged(self):
+        bounds = [None, -7, -3, -1, 0, 1, 2, 3, 5, 8]
+        steps = [None, 1, 2, 3, -1]
+        rnd = random.Random(0)
+        for _ in range(5000):
+            slices = [slice(rnd.choice(bounds), rnd.choice(bounds),
+                            rnd.choice(steps)) for _ in range(3)]
+            plan = SlicePlan(slices)
+            for row in ([], list(range(2)), list(range(6)), list(range(12))):
+                expected = list(chained(row[i] for i in slices))
+                self.assertEqual(plan(row), expected, slices)
+                fixed = plan.specialize(len(row))
+                self.assertEqual(fixed(row), expected, slices)
@@ -0,0 +1,81 @@
+import io
+import json
+import unittest
+
+from sliced import (compile_plan, plan_cache, save_plans, load_plans, Grammar,
+                    OptionNotFound)
+from sliced.cache import LRUCache
+from sliced.serialize import dumps, loads
+
+
+class TestSerialize(unittest.TestCase):
+
+    def setUp(self):
+        plan_cache.clear()
+        self.plans = [compile_plan('2:, 1'),
+                      compile_plan('1-3', 'unix_cut'),
+                      compile_plan('::-1', allow_slice_list=False),
+                      compile_plan('b, a', headers=['a', 'b']),
+                      compile_plan('B', headers={1: 'a', 2: 'b'},
+                                   ignorecase=True)]
+
+    def tearDown(self):
+        plan_cache.clear()
+
+    def test_round_trip(self):
+        fileobj = io.StringIO()
+        self.assertEqual(save_plans(fileobj), 5)
+        plan_cache.clear()
+        fileobj.seek(0)
+        self.assertEqual(load_plans(fileobj), 5)
+        self.assertEqual(compile_plan('2:, 1'), self.plans[0])
+        self.assertEqual(compile_plan('1-3', 'unix_cut'), self.plans[1])
+        self.assertEqual(compile_plan('::-1', allow_slice_list=False),
+                         self.plans[2])
+        self.assertEqual(compile_plan('b, a', headers=['a', 'b']),
+                         self.plans[3])
+        self.assertEqual(compile_plan('B', headers={1: 'a', 2: 'b'},
+                                      ignorecase=True), self.plans[4])
+        self.assertEqual(plan_cache.info().misses, 0)
+
+    def test_other_version_is_reparsed(self):
+        data = json.loads(dumps())
+        data['version'] = 'old'
+        data['plans'][0]['slices'] = [[0, 1, None]]
+        data['plans'][1]['spec'] = 'not valid'
+        data['plans'][2]['dialect'] = 'no_such_dialect'
+        cache = LRUCache()
+        self.assertEqual(loads(json.dumps(data), cache), 3)
+        self.assertEqual(cache.items()[0][1], self.plans[0])
+
+    def test_dialect_settings(self):
+        Grammar.register_dialect('semi', list_sep=';', range_sep='~')
+        try:
+            compile_plan('1; 3', 'semi')
+            compile_plan('1~3', 'semi')
+            text = dumps()
+            cache = LRUCache()
+            self.assertEqual(loads(text, cache), 7)
+            Grammar.register_dialect('semi', list_sep=';', range_sep='~',
+                                     interval_map={'~': 'open'})
+            cache = LRUCache()
+            self.assertEqual(loads(text, cache), 7)
+            self.assertEqual(dict(cache.items())[('1~3', 'semi', None, False,
+                                                  True)].slices,
+                             (slice(1, 2),))
+        finally:
+            del Grammar._registry['semi']
+        plan_cache.clear()
+        self.assertEqual(loads(text), 5)
+        with self.assertRaises(OptionNotFound):
+            compile_plan('1; 3', 'semi')
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            loads('{"format": 0, "plans": []}')
+        with self.assertRaises(ValueError):
+            loads('[]')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import pickle
+import unittest
+from string import ascii_lowercase
+from threading import Thread
+
+from sliced import Slicer, InvalidSliceString, ParseError, plan_cache
+
+
+class TestSlicer(unittest.TestCase):
+
+    def setUp(self):
+        self.seq = [[i + str(j) for j in range(9)]
+                    for i in ascii_lowercase[:2]]
+
+    def test_call(self):
+        self.assertEqual(Slicer('2:3, 1')(self.seq[0]), ['a1', 'a2', 'a0'])
+        self.assertEqual(Slicer(':3')('abcdef'), 'abc')
+
+    def test_map(self):
+        slicer = Slicer('3-5, 7', dialect='unix_cut')
+        self.assertEqual(list(slicer.map(iter(self.seq))),
+                         [['a2', 'a3', 'a4', 'a6'], ['b2', 'b3', 'b4', 'b6']])
+
+    def test_apply_batch(self):
+        self.assertEqual(Slicer('-1, 1').apply_batch(self.seq),
+                         [['a8', 'a0'], ['b8', 'b0']])
+
+    def test_invalid_spec(self):
+        with self.assertRaises(InvalidSliceString):
+            Slicer('1-2')
+
+    def test_compile(self):
+        slicer = Slicer.compile('3-5, 7', dialect='unix_cut')
+        self.assertEqual(slicer(self.seq[0]), ['a2', 'a3', 'a4', 'a6'])
+        error = Slicer.compile('1-2')
+        self.assertIsInstance(error, ParseError)
+        self.assertEqual((error.text, error.column), ('1-2', 2))
+        error = Slicer.compile('a:x', headers=['a', 'b'])
+        self.assertEqual(error.message, "Unknown header name 'x'")
+        self.assertFalse(Slicer.compile('0'))
+        self.assertEqual(Slicer.compile('b', headers=['a', 'b']).plan.width,
+                         2)
+
+    def test_pickle_does_not_reparse(self):
+        slicer = Slicer('2:3, 1')
+        plan_cache.clear()
+        clone = pickle.loads(pickle.dumps(slicer))
+        self.assertEqual(plan_cache.info().misses, 0)
+        self.assertEqual(clone.plan, slicer.plan)
+        self.assertEqual(clone.apply_batch(self.seq),
+                         slicer.apply_batch(self.seq))
+
+    def test_threads(self):
+        slicer = Slicer('::2, 1')
+        rows = [[str(i) for i in range(20)]] * 100
+        expected = slicer.apply_batch(rows)
+        results = []
+        threads = [Thread(target=lambda: results.append(
+                   slicer.apply_batch(rows))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [expected] * 4)